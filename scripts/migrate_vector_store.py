@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Vector Store Migration Script
+=============================
+
+Convert knowledge bases built with the legacy ``vector_store/`` layout
+(``embeddings.pkl`` + indented ``metadata.json``) to the memory-mapped format
+(``embeddings.npy`` + offset-indexed ``chunks.jsonl``).
+
+Usage:
+    python scripts/migrate_vector_store.py my_kb
+    python scripts/migrate_vector_store.py --all --dtype float16 --remove-legacy
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.rag.utils.index_cache import get_index_cache
+from src.services.rag.utils.vector_store import SUPPORTED_DTYPES, migrate_legacy_store
+
+# Default knowledge base directory
+DEFAULT_KB_BASE_DIR = PROJECT_ROOT / "data" / "knowledge_bases"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Migrate legacy vector stores to the memory-mapped format",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Migrate one knowledge base
+  python scripts/migrate_vector_store.py my_kb
+
+  # Migrate every knowledge base, storing vectors as float16
+  python scripts/migrate_vector_store.py --all --dtype float16
+
+  # Migrate and delete embeddings.pkl/metadata.json afterwards
+  python scripts/migrate_vector_store.py my_kb --remove-legacy
+""",
+    )
+
+    parser.add_argument("kb_names", nargs="*", help="Knowledge base names to migrate")
+    parser.add_argument("--all", action="store_true", help="Migrate every knowledge base")
+    parser.add_argument(
+        "--base-dir", help=f"Knowledge base directory (default: {DEFAULT_KB_BASE_DIR})"
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=SUPPORTED_DTYPES,
+        default="float32",
+        help="Storage dtype for embeddings.npy (default: float32)",
+    )
+    parser.add_argument(
+        "--remove-legacy",
+        action="store_true",
+        help="Delete embeddings.pkl and metadata.json after a successful migration",
+    )
+
+    args = parser.parse_args()
+
+    base_dir = Path(args.base_dir) if args.base_dir else DEFAULT_KB_BASE_DIR
+    if args.all:
+        kb_names = sorted(p.name for p in base_dir.iterdir() if (p / "vector_store").is_dir())
+    else:
+        kb_names = args.kb_names
+
+    if not kb_names:
+        parser.error("Specify knowledge base names or --all")
+
+    failed = 0
+    for kb_name in kb_names:
+        store_dir = base_dir / kb_name / "vector_store"
+        if not store_dir.is_dir():
+            print(f"✗ {kb_name}: no vector_store directory")
+            failed += 1
+            continue
+        try:
+            info = migrate_legacy_store(
+                store_dir, dtype=args.dtype, remove_legacy=args.remove_legacy
+            )
+            get_index_cache().invalidate(store_dir)
+        except Exception as e:
+            print(f"✗ {kb_name}: {e}")
+            failed += 1
+            continue
+        if info is None:
+            print(f"- {kb_name}: nothing to migrate")
+        else:
+            print(f"✓ {kb_name}: {info['num_chunks']} chunks migrated")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ This is the single source of truth for agent base functionality across:
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 import os
 from pathlib import Path
 import sys
@@ -26,8 +27,19 @@ if str(_project_root) not in sys.path:
 from src.config.settings import settings
 from src.logging import LLMStats, get_logger
 from src.services.config import get_agent_params
+from src.services.llm import (
+    LLMUsage,
+    ModelRoute,
+    estimate_usage,
+    get_last_usage,
+    get_llm_config,
+    get_model_router,
+    get_token_limit_kwargs,
+    supports_response_format,
+    system_first,
+    was_cache_hit,
+)
 from src.services.llm import complete as llm_complete
-from src.services.llm import get_llm_config, get_token_limit_kwargs, supports_response_format
 from src.services.llm import stream as llm_stream
 from src.services.prompt import get_prompt_manager
 
@@ -286,6 +298,40 @@ class BaseAgent(ABC):
             for stats in cls._shared_stats.values():
                 stats.print_summary()
 
+    async def _measure_usage(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        response: str,
+        messages: list[dict[str, str]] | None = None,
+    ) -> LLMUsage:
+        """
+        Token usage of the LLM call that just finished.
+
+        Prefers the usage block reported by the provider; only when there is
+        none are the texts tokenized, in a worker thread so long prompts do
+        not block the event loop.
+
+        Args:
+            model: Model name
+            system_prompt: System prompt
+            user_prompt: User prompt
+            response: LLM response
+            messages: Messages array actually sent (optional)
+
+        Returns:
+            LLMUsage (source "api" when reported by the provider)
+        """
+        usage = get_last_usage()
+        if usage is not None:
+            return usage
+        if messages:
+            prompt_text = "\n".join(str(m.get("content", "")) for m in messages)
+        else:
+            prompt_text = f"{system_prompt}\n{user_prompt}"
+        return await asyncio.to_thread(estimate_usage, model, prompt_text, response or "")
+
     def _track_tokens(
         self,
         model: str,
@@ -293,6 +339,8 @@ class BaseAgent(ABC):
         user_prompt: str,
         response: str,
         stage: str | None = None,
+        cached: bool = False,
+        usage: LLMUsage | None = None,
     ):
         """
         Track token usage using available tracker.
@@ -307,31 +355,54 @@ class BaseAgent(ABC):
             user_prompt: User prompt
             response: LLM response
             stage: Stage name (optional)
+            cached: True if the response came from the LLM response cache
+            usage: Measured token usage (see _measure_usage); without it the
+                trackers fall back to their own estimation
         """
         stage_label = stage or self.agent_name
 
-        # 1. Use external TokenTracker if provided
-        if self.token_tracker:
+        # 1. Use external TokenTracker if provided (cached responses cost nothing)
+        if self.token_tracker and not cached:
             try:
-                self.token_tracker.add_usage(
-                    agent_name=self.agent_name,
-                    stage=stage_label,
-                    model=model,
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    response_text=response,
-                )
+                if usage is not None:
+                    self.token_tracker.add_usage(
+                        agent_name=self.agent_name,
+                        stage=stage_label,
+                        model=model,
+                        token_counts=usage.to_token_counts(),
+                        calculation_method=usage.source,
+                    )
+                else:
+                    self.token_tracker.add_usage(
+                        agent_name=self.agent_name,
+                        stage=stage_label,
+                        model=model,
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        response_text=response,
+                    )
             except Exception:
                 pass  # Don't let tracking errors affect main flow
 
         # 2. Always use shared LLMStats
         stats = self.get_stats(self.module_name)
-        stats.add_call(
-            model=model,
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            response=response,
-        )
+        if usage is not None:
+            stats.add_call(
+                model=model,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                cached=cached,
+                cache_read_tokens=usage.cache_read_tokens,
+                cache_write_tokens=usage.cache_write_tokens,
+            )
+        else:
+            stats.add_call(
+                model=model,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                response=response,
+                cached=cached,
+            )
 
     # -------------------------------------------------------------------------
     # LLM Call Interface
@@ -348,6 +419,8 @@ class BaseAgent(ABC):
         model: str | None = None,
         verbose: bool = True,
         stage: str | None = None,
+        cache: bool | None = None,
+        prompt_cache: bool | None = None,
     ) -> str:
         """
         Unified interface for calling LLM (non-streaming).
@@ -364,11 +437,21 @@ class BaseAgent(ABC):
             max_tokens: Maximum tokens (optional, uses config by default)
             model: Model name (optional, uses config by default)
             verbose: Whether to print raw LLM output (default True)
-            stage: Stage marker for logging and tracking
+            stage: Stage marker for logging and tracking; also selects the model
+                tier when agents.yaml model_routing maps it (unless model is given)
+            cache: Serve/store the response via the LLM response cache (True/False);
+                None caches only temperature-0 calls
+            prompt_cache: Send provider prompt-caching hints for the stable
+                prefix (default: LLM_PROMPT_CACHE)
 
         Returns:
             LLM response text
         """
+        stage_label = stage or self.agent_name
+
+        # Lightweight stages may be routed to a cheaper model tier (agents.yaml
+        # model_routing); an explicit model always wins
+        route = None if model else get_model_router().resolve(stage_label, self.module_name)
         model = model or self.get_model()
         temperature = temperature if temperature is not None else self.get_temperature()
         max_tokens = max_tokens if max_tokens is not None else self.get_max_tokens()
@@ -382,10 +465,6 @@ class BaseAgent(ABC):
             "temperature": temperature,
         }
 
-        # Handle token limit for newer OpenAI models
-        if max_tokens:
-            kwargs.update(get_token_limit_kwargs(model, max_tokens))
-
         # Handle response_format with capability check
         if response_format:
             try:
@@ -400,46 +479,106 @@ class BaseAgent(ABC):
                 self.logger.debug(f"response_format not supported for {binding}/{model}, skipping")
 
         if messages:
-            kwargs["messages"] = messages
+            # Stable system prompt first, so providers can reuse the cached prefix
+            kwargs["messages"] = system_first(messages)
 
         # Log input
-        stage_label = stage or self.agent_name
         if hasattr(self.logger, "log_llm_input"):
             self.logger.log_llm_input(
                 agent_name=self.agent_name,
                 stage=stage_label,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                metadata={"model": model, "temperature": temperature, "max_tokens": max_tokens},
+                metadata={
+                    "model": route.model if route else model,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                },
             )
 
-        # Call LLM via factory (routes to cloud or local provider)
-        response = None
-        try:
-            response = await llm_complete(
+        async def _complete(call_model: str, target: ModelRoute | None) -> str:
+            call_kwargs = dict(kwargs)
+            # Handle token limit for newer OpenAI models
+            if max_tokens:
+                call_kwargs.update(get_token_limit_kwargs(call_model, max_tokens))
+            if target is not None and target.binding:
+                call_kwargs["binding"] = target.binding
+            return await llm_complete(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
-                model=model,
-                api_key=self.api_key,
-                base_url=self.base_url,
+                model=call_model,
+                api_key=(target.api_key if target and target.api_key else self.api_key),
+                base_url=(target.base_url if target and target.base_url else self.base_url),
                 api_version=self.api_version,
                 max_retries=max_retries,
-                **kwargs,
+                cache=cache,
+                prompt_cache=prompt_cache,
+                **call_kwargs,
             )
-        except Exception as e:
-            self.logger.error(f"LLM call failed: {e}")
-            raise
+
+        # Call LLM via factory (routes to cloud or local provider)
+        router = get_model_router()
+        response = None
+        fallback = False
+        if route is not None:
+            try:
+                response = await _complete(route.model, route)
+                model = route.model
+            except Exception as e:
+                router.record(
+                    stage_label, route.tier, route.model, time.time() - start_time, ok=False
+                )
+                self.logger.warning(
+                    f"Routed call for stage '{stage_label}' failed on {route.tier} tier "
+                    f"({route.model}): {e}; retrying on {model}"
+                )
+                route = None
+                fallback = True
+                start_time = time.time()
+
+        if response is None:
+            try:
+                response = await _complete(model, None)
+            except Exception as e:
+                router.record(
+                    stage_label,
+                    "primary",
+                    model,
+                    time.time() - start_time,
+                    ok=False,
+                    fallback=fallback,
+                )
+                self.logger.error(f"LLM call failed: {e}")
+                raise
+        cached = was_cache_hit()
 
         # Calculate duration
         call_duration = time.time() - start_time
 
-        # Track token usage
+        # Track token usage (provider-reported when available)
+        usage = (
+            None
+            if cached
+            else await self._measure_usage(
+                model, system_prompt, user_prompt, response, messages=messages
+            )
+        )
         self._track_tokens(
             model=model,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             response=response,
             stage=stage_label,
+            cached=cached,
+            usage=usage,
+        )
+        router.record(
+            stage_label,
+            route.tier if route else "primary",
+            model,
+            call_duration,
+            usage=usage,
+            fallback=fallback,
         )
 
         # Log output
@@ -448,7 +587,7 @@ class BaseAgent(ABC):
                 agent_name=self.agent_name,
                 stage=stage_label,
                 response=response,
-                metadata={"length": len(response), "duration": call_duration},
+                metadata={"length": len(response), "duration": call_duration, "cached": cached},
             )
 
         # Verbose output
@@ -466,6 +605,7 @@ class BaseAgent(ABC):
         max_tokens: int | None = None,
         model: str | None = None,
         stage: str | None = None,
+        prompt_cache: bool | None = None,
     ) -> AsyncGenerator[str, None]:
         """
         Unified interface for streaming LLM responses.
@@ -481,6 +621,8 @@ class BaseAgent(ABC):
             max_tokens: Maximum tokens (optional, uses config by default)
             model: Model name (optional, uses config by default)
             stage: Stage marker for logging
+            prompt_cache: Send provider prompt-caching hints for the stable
+                prefix (default: LLM_PROMPT_CACHE)
 
         Yields:
             Response chunks as strings
@@ -511,6 +653,7 @@ class BaseAgent(ABC):
 
         # Track start time
         start_time = time.time()
+        first_token_time = None
         full_response = ""
 
         try:
@@ -522,19 +665,26 @@ class BaseAgent(ABC):
                 api_key=self.api_key,
                 base_url=self.base_url,
                 api_version=self.api_version,
-                messages=messages,
+                messages=system_first(messages) if messages else None,
+                prompt_cache=prompt_cache,
                 **kwargs,
             ):
+                if first_token_time is None:
+                    first_token_time = time.time() - start_time
                 full_response += chunk
                 yield chunk
 
             # Track token usage after streaming completes
+            usage = await self._measure_usage(
+                model, system_prompt, user_prompt, full_response, messages=messages
+            )
             self._track_tokens(
                 model=model,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 response=full_response,
                 stage=stage_label,
+                usage=usage,
             )
 
             # Log output
@@ -549,6 +699,7 @@ class BaseAgent(ABC):
                     metadata={
                         "length": len(full_response),
                         "duration": call_duration,
+                        "first_token_latency": first_token_time,
                         "streaming": True,
                     },
                 )
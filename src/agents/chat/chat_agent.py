@@ -21,6 +21,7 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from src.agents.base_agent import BaseAgent
+from src.services.llm import get_token_counter
 from src.tools import rag_search, web_search
 
 
@@ -71,7 +72,7 @@ class ChatAgent(BaseAgent):
 
     def count_tokens(self, text: str) -> int:
         """
-        Count tokens in text using tiktoken.
+        Count tokens in text using the shared token counter.
 
         Falls back to character-based estimation if tiktoken unavailable.
 
@@ -81,15 +82,7 @@ class ChatAgent(BaseAgent):
         Returns:
             Estimated token count
         """
-        try:
-            import tiktoken
-
-            # Use cl100k_base encoding (GPT-4, GPT-3.5-turbo)
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
-        except ImportError:
-            # Fallback: rough estimate of 4 characters per token
-            return len(text) // 4
+        return get_token_counter(self.get_model()).count(text)
 
     def truncate_history(
         self,
@@ -113,12 +106,12 @@ class ChatAgent(BaseAgent):
         if not history:
             return []
 
-        # Calculate tokens for each message
-        message_tokens = []
-        for msg in history:
-            content = msg.get("content", "")
-            tokens = self.count_tokens(content)
-            message_tokens.append((msg, tokens))
+        # Calculate tokens for each message (earlier turns are memoized, so
+        # only new messages are encoded)
+        counts = get_token_counter(self.get_model()).count_many(
+            [msg.get("content", "") for msg in history]
+        )
+        message_tokens = list(zip(history, counts))
 
         # Build history from newest to oldest, stop when limit reached
         truncated = []
@@ -350,12 +343,16 @@ class ChatAgent(BaseAgent):
         )
 
         # Track token usage
+        usage = await self._measure_usage(
+            self.get_model(), system_prompt, user_prompt, response, messages=messages
+        )
         self._track_tokens(
             model=self.get_model(),
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             response=response,
             stage="chat",
+            usage=usage,
         )
 
         return response
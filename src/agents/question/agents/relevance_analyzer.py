@@ -100,6 +100,7 @@ class RelevanceAnalyzer(BaseAgent):
                 response_format={"type": "json_object"},
                 temperature=0.3,  # Lower temperature for more consistent analysis
                 stage="analyze_relevance",
+                cache=True,  # Same question + knowledge gives the same analysis
             )
 
             result = self._parse_analysis_response(response)
@@ -6,12 +6,11 @@ RetrieveAgent - Responsible for generating RAG queries and retrieving knowledge.
 Uses unified BaseAgent for LLM calls and configuration management.
 """
 
-import asyncio
 import json
 from typing import Any
 
 from src.agents.base_agent import BaseAgent
-from src.tools.rag_tool import rag_search
+from src.tools.rag_tool import rag_search_many
 
 
 class RetrieveAgent(BaseAgent):
@@ -20,7 +19,7 @@ class RetrieveAgent(BaseAgent):
 
     Responsibilities:
     - Generate semantic search queries from requirements
-    - Execute RAG searches in parallel
+    - Execute RAG searches as one batch
     - Merge and summarize retrieval results
     """
 
@@ -79,7 +78,7 @@ class RetrieveAgent(BaseAgent):
         queries = await self._generate_queries(requirement_text, num_queries)
         self.logger.info(f"Generated {len(queries)} search queries")
 
-        # Step 2: Execute RAG searches in parallel
+        # Step 2: Execute RAG searches as one batch
         retrievals = await self._execute_searches(queries)
         self.logger.info(f"Retrieved {len(retrievals)} results")
 
@@ -156,59 +155,46 @@ class RetrieveAgent(BaseAgent):
 
         return queries[:num_queries]
 
-    async def _single_rag_search(self, query: str) -> dict[str, Any]:
+    async def _execute_searches(self, queries: list[str]) -> list[dict[str, Any]]:
         """
-        Execute a single RAG search.
+        Execute RAG searches as one batched call.
 
         Args:
-            query: Search query
+            queries: List of search queries
 
         Returns:
-            Dict with query and answer
+            List of retrieval results
         """
+        self.logger.debug(f"Executing {len(queries)} RAG searches in one batch")
+
         try:
-            result = await rag_search(
-                query=query,
+            results = await rag_search_many(
+                queries=queries,
                 kb_name=self.kb_name,
                 mode=self.rag_mode,
                 only_need_context=True,
             )
-            return {
-                "query": query,
-                "answer": result.get("answer", ""),
-                "mode": result.get("mode", self.rag_mode),
-            }
         except Exception as e:
-            self.logger.warning(f"RAG search failed for '{query}': {e}")
-            return {
-                "query": query,
-                "answer": "",
-                "error": str(e),
-            }
-
-    async def _execute_searches(self, queries: list[str]) -> list[dict[str, Any]]:
-        """
-        Execute RAG searches in parallel.
-
-        Args:
-            queries: List of search queries
-
-        Returns:
-            List of retrieval results
-        """
-        self.logger.debug(f"Executing {len(queries)} RAG searches in parallel")
-
-        tasks = [self._single_rag_search(query) for query in queries]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            self.logger.warning(f"RAG search failed for {len(queries)} queries: {e}")
+            return []
 
         retrievals = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.warning(f"Search failed for query '{queries[i]}': {result}")
+        for query, result in zip(queries, results):
+            # A failed query only drops its own result
+            if result.get("error"):
+                self.logger.warning(
+                    f"RAG search failed for query '{query[:50]}': {result['error']}"
+                )
                 continue
             if result.get("answer"):
-                retrievals.append(result)
-                self.logger.debug(f"  → Query: {queries[i][:50]}... (retrieved)")
+                retrievals.append(
+                    {
+                        "query": query,
+                        "answer": result.get("answer", ""),
+                        "mode": result.get("mode", self.rag_mode),
+                    }
+                )
+                self.logger.debug(f"  → Query: {query[:50]}... (retrieved)")
 
         return retrievals
 
@@ -10,6 +10,7 @@ ReportingAgent - Report generation Agent (DR-in-KG 2.0)
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from pathlib import Path
 import re
@@ -83,6 +84,10 @@ class ReportingAgent(BaseAgent):
         self.enable_citation_list = self.reporting_config.get("enable_citation_list", False)
         self.enable_inline_citations = self.reporting_config.get("enable_inline_citations", False)
 
+        # Section writing concurrency: sections are independent LLM calls
+        self.parallel_sections = self.reporting_config.get("parallel_sections", True)
+        self.max_parallel_sections = max(1, self.reporting_config.get("max_parallel_sections", 4))
+
     def set_citation_manager(self, citation_manager):
         """Set citation manager"""
         self.citation_manager = citation_manager
@@ -374,9 +379,17 @@ class ReportingAgent(BaseAgent):
         return "\n".join(lines)
 
     async def _write_introduction(
-        self, topic: str, blocks: list[TopicBlock], outline: dict[str, Any]
+        self,
+        topic: str,
+        blocks: list[TopicBlock],
+        outline: dict[str, Any],
+        section_summaries: dict[str, str] | None = None,
     ) -> str:
-        """Write report introduction section"""
+        """Write report introduction section
+
+        Args:
+            section_summaries: Optional block_id -> excerpt of the already written section
+        """
         system_prompt = self.get_prompt(
             "system",
             "role",
@@ -393,9 +406,14 @@ class ReportingAgent(BaseAgent):
         # Prepare context for introduction: overview information of all topics
         topics_summary = []
         for b in blocks:
-            topics_summary.append(
-                {"sub_topic": b.sub_topic, "overview": b.overview, "tool_count": len(b.tool_traces)}
-            )
+            summary = {
+                "sub_topic": b.sub_topic,
+                "overview": b.overview,
+                "tool_count": len(b.tool_traces),
+            }
+            if section_summaries and section_summaries.get(b.block_id):
+                summary["section_summary"] = section_summaries[b.block_id]
+            topics_summary.append(summary)
 
         # Use introduction_instruction if available, otherwise fall back to introduction title
         intro_instruction = outline.get("introduction_instruction", "") or outline.get(
@@ -491,9 +509,17 @@ class ReportingAgent(BaseAgent):
             )
 
     async def _write_conclusion(
-        self, topic: str, blocks: list[TopicBlock], outline: dict[str, Any]
+        self,
+        topic: str,
+        blocks: list[TopicBlock],
+        outline: dict[str, Any],
+        section_summaries: dict[str, str] | None = None,
     ) -> str:
-        """Write report conclusion section"""
+        """Write report conclusion section
+
+        Args:
+            section_summaries: Optional block_id -> excerpt of the already written section
+        """
         system_prompt = self.get_prompt(
             "system",
             "role",
@@ -517,6 +543,8 @@ class ReportingAgent(BaseAgent):
                     t.summary for t in b.tool_traces[:3]
                 ],  # Top 3 key findings for each topic
             }
+            if section_summaries and section_summaries.get(b.block_id):
+                findings["section_summary"] = section_summaries[b.block_id]
             topics_findings.append(findings)
 
         # Use conclusion_instruction if available, otherwise fall back to conclusion title
@@ -1092,7 +1120,12 @@ class ReportingAgent(BaseAgent):
     async def _write_report(
         self, topic: str, blocks: list[TopicBlock], outline: dict[str, Any]
     ) -> str:
-        """Write complete report using step-by-step method with three-level heading support"""
+        """Write complete report using step-by-step method with three-level heading support
+
+        Sections are written concurrently (up to ``max_parallel_sections``); the
+        introduction and conclusion are written afterwards from excerpts of the
+        written sections. The report is assembled in outline order.
+        """
         parts = []
 
         # Build citation number map before writing (for consistent ref_number in traces)
@@ -1108,26 +1141,17 @@ class ReportingAgent(BaseAgent):
             title = f"# {title}"
         parts.append(f"{title}\n\n")
 
-        # 2. Write introduction
-        print("  📝 Writing introduction...")
-        self._notify_progress(
-            getattr(self, "_progress_callback", None),
-            "writing_section",
-            current_section="Introduction",
-            section_index=0,
-            total_sections=len(outline.get("sections", [])) + 2,  # +2 for intro and conclusion
-        )
-        introduction = await self._write_introduction(topic, blocks, outline)
-        # Get introduction title from outline, or use default if not available
+        sections = outline.get("sections", [])
+        total_sections = len(sections) + 2  # +2 for intro and conclusion
         intro_title = outline.get("introduction", "## Introduction")
         if not intro_title.startswith("##"):
             intro_title = f"## {intro_title}"
-        parts.append(f"{intro_title}\n\n")
-        parts.append(introduction)
-        parts.append("\n\n")
+        conclusion_title = outline.get("conclusion", "## Conclusion")
+        if not conclusion_title.startswith("##"):
+            conclusion_title = f"## {conclusion_title}"
 
-        # 3. Write each section with subsection support
-        sections = outline.get("sections", [])
+        # 2. Resolve the topic block of each section
+        jobs = []
         for i, section in enumerate(sections, 1):
             block_id = section.get("block_id")
             block = next((b for b in blocks if b.block_id == block_id), None)
@@ -1136,50 +1160,70 @@ class ReportingAgent(BaseAgent):
                     f"  ⚠️  Warning: Cannot find topic block with block_id={block_id}, skipping this section"
                 )
                 continue
-
-            section_title = section.get("title", block.sub_topic)
-            # Clean section title for display (remove markdown markers)
-            display_title = section_title.replace("##", "").strip()
-            print(f"  📝 Writing section {i}/{len(sections)}: {section_title}...")
-            self._notify_progress(
-                getattr(self, "_progress_callback", None),
-                "writing_section",
-                current_section=display_title,
-                section_index=i,  # 1-based, after introduction
-                total_sections=len(sections) + 2,  # +2 for intro and conclusion
-            )
-
-            # Check if section has subsections defined in outline
-            subsections = section.get("subsections", [])
-
-            if subsections:
-                # Write section with explicit subsection structure
-                section_content = await self._write_section_with_subsections(
-                    topic, block, section, subsections
+            jobs.append((i, section, block))
+
+        # 3. Write sections concurrently (bounded), results kept in outline order
+        limit = self.max_parallel_sections if self.parallel_sections else 1
+        semaphore = asyncio.Semaphore(limit)
+
+        async def write_section(i: int, section: dict[str, Any], block: TopicBlock) -> str:
+            async with semaphore:
+                section_title = section.get("title", block.sub_topic)
+                # Clean section title for display (remove markdown markers)
+                display_title = section_title.replace("##", "").strip()
+                print(f"  📝 Writing section {i}/{len(sections)}: {section_title}...")
+                self._notify_progress(
+                    getattr(self, "_progress_callback", None),
+                    "writing_section",
+                    current_section=display_title,
+                    section_index=i,  # 1-based, after introduction
+                    total_sections=total_sections,
                 )
-            else:
+
+                # Check if section has subsections defined in outline
+                subsections = section.get("subsections", [])
+                if subsections:
+                    # Write section with explicit subsection structure
+                    return await self._write_section_with_subsections(
+                        topic, block, section, subsections
+                    )
                 # Write section normally (LLM will generate its own subsection structure)
-                section_content = await self._write_section_body(topic, block, section)
+                return await self._write_section_body(topic, block, section)
 
-            # Section content already includes ## level title, append directly
-            parts.append(section_content)
-            parts.append("\n\n")
+        if limit > 1 and len(jobs) > 1:
+            print(f"  ⚡ Writing {len(jobs)} sections (up to {limit} at a time)...")
+        section_contents = await self._gather_all(
+            [write_section(i, section, block) for i, section, block in jobs]
+        )
+        section_summaries = {
+            block.block_id: self._summarize_section(content)
+            for (_, _, block), content in zip(jobs, section_contents)
+        }
 
-        # 4. Write conclusion
-        print("  📝 Writing conclusion...")
-        total_sections = len(sections) + 2
+        # 4. Write introduction and conclusion from the written sections
+        print("  📝 Writing introduction and conclusion...")
         self._notify_progress(
             getattr(self, "_progress_callback", None),
             "writing_section",
-            current_section="Conclusion",
-            section_index=total_sections - 1,  # Last section
+            current_section="Introduction & Conclusion",
+            section_index=total_sections - 1,  # Last step
             total_sections=total_sections,
         )
-        conclusion = await self._write_conclusion(topic, blocks, outline)
-        # Get conclusion title from outline, or use default if not available
-        conclusion_title = outline.get("conclusion", "## Conclusion")
-        if not conclusion_title.startswith("##"):
-            conclusion_title = f"## {conclusion_title}"
+        introduction, conclusion = await self._gather_all(
+            [
+                self._write_introduction(topic, blocks, outline, section_summaries),
+                self._write_conclusion(topic, blocks, outline, section_summaries),
+            ]
+        )
+
+        # Assemble in outline order
+        parts.append(f"{intro_title}\n\n")
+        parts.append(introduction)
+        parts.append("\n\n")
+        for section_content in section_contents:
+            # Section content already includes ## level title, append directly
+            parts.append(section_content)
+            parts.append("\n\n")
         parts.append(f"{conclusion_title}\n\n")
         parts.append(conclusion)
         parts.append("\n\n")
@@ -1213,6 +1257,28 @@ class ReportingAgent(BaseAgent):
 
         return report
 
+    @staticmethod
+    async def _gather_all(coros: list) -> list:
+        """Run coroutines concurrently and return their results in order
+
+        If one fails, the others are cancelled and the error is raised.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _summarize_section(self, content: str, max_chars: int = 600) -> str:
+        """Condense a written section into a plain-text excerpt for the introduction and conclusion"""
+        body = re.sub(r"^#{1,6}\s+.*$", "", content, flags=re.MULTILINE)
+        text = " ".join(self._strip_markdown(body).split())
+        if len(text) > max_chars:
+            text = text[:max_chars].rsplit(" ", 1)[0] + "..."
+        return text
+
     async def _write_section_with_subsections(
         self,
         topic: str,
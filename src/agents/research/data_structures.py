@@ -5,6 +5,7 @@ DR-in-KG 2.0 Core Data Structures
 Includes: TopicBlock, ToolTrace, DynamicTopicQueue
 """
 
+import asyncio
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -245,6 +246,17 @@ class DynamicTopicQueue:
         self.created_at = datetime.now().isoformat()
         self.max_length = max_length if isinstance(max_length, int) and max_length > 0 else None
         self.state_file = state_file
+        # Work queue of the parallel research workers, fed by add_block
+        self.work_queue: asyncio.Queue | None = None
+
+    def attach_work_queue(self, work_queue: asyncio.Queue | None) -> None:
+        """
+        Feed every block added from now on into a work queue
+
+        Args:
+            work_queue: Queue consumed by the research workers (None detaches)
+        """
+        self.work_queue = work_queue
 
     def set_state_file(self, filepath: str | None) -> None:
         """Set queue auto-persistence file"""
@@ -275,6 +287,8 @@ class DynamicTopicQueue:
         block = TopicBlock(block_id=block_id, sub_topic=sub_topic, overview=overview)
         self.blocks.append(block)
         self._auto_save()
+        if self.work_queue is not None:
+            self.work_queue.put_nowait(block)
         return block
 
     def has_topic(self, sub_topic: str) -> bool:
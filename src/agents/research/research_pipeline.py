@@ -817,7 +817,9 @@ class ResearchPipeline:
     async def _phase2_researching_parallel(self):
         """
         Phase 2: Dynamic Research Loop (Parallel Mode)
-        Executes multiple topic blocks in parallel with concurrency limit
+        A pool of max_parallel_topics workers pulls topic blocks from a work queue.
+        Topics added by ManagerAgent during research are fed into the same queue
+        and start as soon as a worker is free.
         """
         # Initialize researching stage event list
         if "researching" not in self._stage_events:
@@ -827,8 +829,7 @@ class ResearchPipeline:
         research = self.agents["research"]
 
         # Get configuration
-        max_parallel = self.config.get("researching", {}).get("max_parallel_topics", 5)
-        semaphore = asyncio.Semaphore(max_parallel)
+        max_parallel = max(1, self.config.get("researching", {}).get("max_parallel_topics", 5))
 
         # Get all pending blocks at the start
         from src.agents.research.data_structures import TopicStatus
@@ -899,12 +900,12 @@ class ResearchPipeline:
                     active_tasks=list(active_tasks.values()),
                     active_count=len(active_tasks),
                     completed_count=completed_count["value"],
-                    total_blocks=total_blocks,
+                    total_blocks=len(self.queue.blocks),
                 )
 
         async def research_single_block(block: Any) -> dict[str, Any] | None:
             """
-            Research a single topic block with semaphore control
+            Research a single topic block
 
             Args:
                 block: TopicBlock to research
@@ -912,180 +913,153 @@ class ResearchPipeline:
             Returns:
                 Research result or None if failed
             """
-            async with semaphore:
-                try:
-                    # Mark as researching (thread-safe)
-                    async with manager._lock:
-                        # Refresh block status from queue
-                        current_block = self.queue.get_block_by_id(block.block_id)
-                        if current_block and current_block.status == TopicStatus.PENDING:
-                            self.queue.mark_researching(block.block_id)
-
-                    # Add to active tasks
-                    await update_active_task(
-                        block.block_id,
-                        {
-                            "block_id": block.block_id,
-                            "sub_topic": block.sub_topic,
-                            "status": "starting",
-                            "iteration": 0,
-                            "current_tool": None,
-                            "current_query": None,
-                        },
-                    )
-
-                    self._log_researching_progress(
-                        "block_started",
-                        block_id=block.block_id,
-                        sub_topic=block.sub_topic,
-                        execution_mode="parallel",
-                        active_count=len(active_tasks),
-                    )
-
-                    if self.logger:
-                        self.logger.info(
-                            f"\n[{block.block_id}] 🔍 Starting research: {block.sub_topic}"
-                        )
+            try:
+                # Mark as researching (thread-safe)
+                async with manager._lock:
+                    # Refresh block status from queue
+                    current_block = self.queue.get_block_by_id(block.block_id)
+                    if current_block and current_block.status == TopicStatus.PENDING:
+                        self.queue.mark_researching(block.block_id)
+
+                # Add to active tasks
+                await update_active_task(
+                    block.block_id,
+                    {
+                        "block_id": block.block_id,
+                        "sub_topic": block.sub_topic,
+                        "status": "starting",
+                        "iteration": 0,
+                        "current_tool": None,
+                        "current_query": None,
+                    },
+                )
 
-                    # Get max_iterations from config for this closure
-                    config_max_iterations = self.config.get("researching", {}).get(
-                        "max_iterations", 5
-                    )
+                self._log_researching_progress(
+                    "block_started",
+                    block_id=block.block_id,
+                    sub_topic=block.sub_topic,
+                    execution_mode="parallel",
+                    active_count=len(active_tasks),
+                )
 
-                    # Create iteration callback for parallel mode
-                    def parallel_iteration_callback(event_type: str, **data):
-                        """Handle iteration progress in parallel mode"""
-                        # Update active task info
-                        task_info = {
-                            "block_id": block.block_id,
-                            "sub_topic": block.sub_topic,
-                            "status": event_type,
-                            "iteration": data.get("iteration", 0),
-                            "max_iterations": data.get("max_iterations", config_max_iterations),
-                            "current_tool": data.get("tool_type"),
-                            "current_query": data.get("query"),
-                            "tools_used": data.get("tools_used", []),
-                        }
-                        # Schedule async update
-                        asyncio.create_task(update_active_task(block.block_id, task_info))
-
-                        # Also log the detailed progress
-                        self._log_researching_progress(
-                            event_type,
-                            block_id=block.block_id,
-                            sub_topic=block.sub_topic,
-                            execution_mode="parallel",
-                            **data,
-                        )
-
-                    # Execute research loop with async wrappers
-                    result = await research.process(
-                        topic_block=block,
-                        call_tool_callback=self._call_tool,
-                        note_agent=self.agents["note"],
-                        citation_manager=async_citation_manager,
-                        queue=self.queue,
-                        manager_agent=async_manager_agent,
-                        config=self.config,
-                        progress_callback=parallel_iteration_callback,
+                if self.logger:
+                    self.logger.info(
+                        f"\n[{block.block_id}] 🔍 Starting research: {block.sub_topic}"
                     )
 
-                    # Mark as completed (thread-safe)
-                    await manager.complete_task_async(block.block_id)
-                    completed_count["value"] += 1
-
-                    # Remove from active tasks
-                    await update_active_task(block.block_id, None)
-
+                # Get max_iterations from config for this closure
+                config_max_iterations = self.config.get("researching", {}).get("max_iterations", 5)
+
+                # Create iteration callback for parallel mode
+                def parallel_iteration_callback(event_type: str, **data):
+                    """Handle iteration progress in parallel mode"""
+                    # Update active task info
+                    task_info = {
+                        "block_id": block.block_id,
+                        "sub_topic": block.sub_topic,
+                        "status": event_type,
+                        "iteration": data.get("iteration", 0),
+                        "max_iterations": data.get("max_iterations", config_max_iterations),
+                        "current_tool": data.get("tool_type"),
+                        "current_query": data.get("query"),
+                        "tools_used": data.get("tools_used", []),
+                    }
+                    # Schedule async update
+                    asyncio.create_task(update_active_task(block.block_id, task_info))
+
+                    # Also log the detailed progress
                     self._log_researching_progress(
-                        "block_completed",
+                        event_type,
                         block_id=block.block_id,
                         sub_topic=block.sub_topic,
-                        iterations=result.get("iterations", 0),
-                        tools_used=result.get("tools_used", []),
-                        queries_used=result.get("queries_used", []),
-                        current_block=completed_count["value"],
-                        total_blocks=total_blocks,
                         execution_mode="parallel",
+                        **data,
                     )
 
-                    if self.logger:
-                        self.logger.success(f"[{block.block_id}] ✓ Completed: {block.sub_topic}")
-
-                    return result
-
-                except Exception as e:
-                    # Mark as failed (thread-safe)
-                    await manager.fail_task_async(block.block_id, str(e))
-                    completed_count["value"] += 1
-
-                    # Remove from active tasks
-                    await update_active_task(block.block_id, None)
+                # Execute research loop with async wrappers
+                result = await research.process(
+                    topic_block=block,
+                    call_tool_callback=self._call_tool,
+                    note_agent=self.agents["note"],
+                    citation_manager=async_citation_manager,
+                    queue=self.queue,
+                    manager_agent=async_manager_agent,
+                    config=self.config,
+                    progress_callback=parallel_iteration_callback,
+                )
 
-                    if self.logger:
-                        self.logger.error(f"[{block.block_id}] ✗ Failed: {block.sub_topic} - {e}")
+                # Mark as completed (thread-safe)
+                await manager.complete_task_async(block.block_id)
+                completed_count["value"] += 1
 
-                    self._log_researching_progress(
-                        "block_failed",
-                        block_id=block.block_id,
-                        sub_topic=block.sub_topic,
-                        error=str(e),
-                        execution_mode="parallel",
-                    )
-                    return None
+                # Remove from active tasks
+                await update_active_task(block.block_id, None)
 
-        # Execute all research tasks in parallel
-        tasks = [research_single_block(block) for block in pending_blocks]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+                self._log_researching_progress(
+                    "block_completed",
+                    block_id=block.block_id,
+                    sub_topic=block.sub_topic,
+                    iterations=result.get("iterations", 0),
+                    tools_used=result.get("tools_used", []),
+                    queries_used=result.get("queries_used", []),
+                    current_block=completed_count["value"],
+                    total_blocks=len(self.queue.blocks),
+                    execution_mode="parallel",
+                )
 
-        # Handle any exceptions that weren't caught
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                block = pending_blocks[i]
-                await manager.fail_task_async(block.block_id, str(result))
                 if self.logger:
-                    self.logger.error(f"[{block.block_id}] ✗ Exception: {result}")
+                    self.logger.success(f"[{block.block_id}] ✓ Completed: {block.sub_topic}")
 
-        # Wait for any dynamically added topics (if manager adds new topics during research)
-        # Continue until all tasks are processed (completed or failed)
-        max_wait_iterations = 100  # Prevent infinite loop
-        wait_count = 0
-
-        while True:
-            # Check if all blocks are processed (COMPLETED or FAILED, not PENDING or RESEARCHING)
-            stats = self.queue.get_statistics()
-            pending_count = stats.get("pending", 0)
-            researching_count = stats.get("researching", 0)
+                return result
 
-            # Exit if no pending or researching tasks
-            if pending_count == 0 and researching_count == 0:
-                break
+            except Exception as e:
+                # Mark as failed (thread-safe)
+                await manager.fail_task_async(block.block_id, str(e))
+                completed_count["value"] += 1
 
-            # Get any newly added pending blocks
-            new_pending = [b for b in self.queue.blocks if b.status == TopicStatus.PENDING]
-            if not new_pending:
-                # No pending blocks, but there might be researching ones
-                # Wait a bit for them to complete
-                wait_count += 1
-                if wait_count > max_wait_iterations:
-                    self.logger.warning(
-                        "Max wait iterations reached, exiting parallel research loop"
-                    )
-                    break
-                await asyncio.sleep(0.1)
-                continue
+                # Remove from active tasks
+                await update_active_task(block.block_id, None)
 
-            # Reset wait count when we have new work
-            wait_count = 0
+                if self.logger:
+                    self.logger.error(f"[{block.block_id}] ✗ Failed: {block.sub_topic} - {e}")
 
-            # Research newly added blocks
-            new_tasks = [research_single_block(block) for block in new_pending]
-            new_results = await asyncio.gather(*new_tasks, return_exceptions=True)
+                self._log_researching_progress(
+                    "block_failed",
+                    block_id=block.block_id,
+                    sub_topic=block.sub_topic,
+                    error=str(e),
+                    execution_mode="parallel",
+                )
+                return None
 
-            for i, result in enumerate(new_results):
-                if isinstance(result, Exception):
-                    block = new_pending[i]
-                    await manager.fail_task_async(block.block_id, str(result))
+        async def worker() -> None:
+            """Research blocks from the work queue until cancelled"""
+            while True:
+                block = await work_queue.get()
+                try:
+                    await research_single_block(block)
+                except Exception as e:
+                    # Handle any exceptions that weren't caught
+                    await manager.fail_task_async(block.block_id, str(e))
+                    if self.logger:
+                        self.logger.error(f"[{block.block_id}] ✗ Exception: {e}")
+                finally:
+                    work_queue.task_done()
+
+        # New topics are enqueued by DynamicTopicQueue.add_block; join() returns once
+        # every block, including those discovered while researching, is processed
+        work_queue: asyncio.Queue = asyncio.Queue()
+        for block in pending_blocks:
+            work_queue.put_nowait(block)
+        self.queue.attach_work_queue(work_queue)
+        workers = [asyncio.create_task(worker()) for _ in range(max_parallel)]
+        try:
+            await work_queue.join()
+        finally:
+            self.queue.attach_work_queue(None)
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         stats = self.queue.get_statistics()
         self._log_researching_progress(
@@ -10,6 +10,8 @@ from datetime import datetime
 import json
 from typing import Any
 
+from src.services.llm.tokenizer import count_tokens, get_encoding
+
 # Try importing tiktoken (if available)
 try:
     import tiktoken  # type: ignore
@@ -44,23 +46,13 @@ MODEL_PRICING = {
 def get_tiktoken_encoding(model_name: str):
     if not TIKTOKEN_AVAILABLE:
         return None
-    try:
-        if "gpt-4" in model_name.lower() or "gpt-3.5" in model_name.lower():
-            return tiktoken.encoding_for_model(model_name)
-        if "gpt-4o" in model_name.lower():
-            return tiktoken.encoding_for_model("gpt-4o")
-        return tiktoken.get_encoding("cl100k_base")
-    except Exception:
-        return tiktoken.get_encoding("cl100k_base") if TIKTOKEN_AVAILABLE else None
+    return get_encoding(model_name)
 
 
 def count_tokens_with_tiktoken(text: str, model_name: str) -> int:
     if not TIKTOKEN_AVAILABLE:
         return 0
-    enc = get_tiktoken_encoding(model_name)
-    if enc is None:
-        return 0
-    return len(enc.encode(text))
+    return count_tokens(text, model_name)
 
 
 def count_tokens_with_litellm(messages: list[dict], model_name: str) -> dict[str, int]:
@@ -140,12 +132,12 @@ class TokenTracker:
         user_prompt: str | None = None,
         response_text: str | None = None,
         messages: list[dict] | None = None,
+        calculation_method: str | None = None,
     ):
-        method = "api"
+        method = calculation_method or "api"
         if token_counts:
             prompt_tokens = token_counts.get("prompt_tokens", prompt_tokens)
             completion_tokens = token_counts.get("completion_tokens", completion_tokens)
-            method = "api"
         elif self.prefer_tiktoken and (system_prompt or user_prompt):
             prompt_text = (system_prompt or "") + "\n" + (user_prompt or "")
             prompt_tokens = count_tokens_with_tiktoken(prompt_text, model)
@@ -4,8 +4,10 @@ InvestigateAgent - Investigator
 Generates query actions and calls tools based on current memory and reflections.
 """
 
+import asyncio
 from pathlib import Path
 import sys
+import time
 from typing import Any
 
 # Add project root to path
@@ -48,8 +50,12 @@ class InvestigateAgent(BaseAgent):
 
         # Read agent-specific config from solve.agents.investigate_agent
         agent_config = config.get("solve", {}).get("agents", {}).get("investigate_agent", {})
-        self.max_actions_per_round = agent_config.get("max_actions_per_round", 1)
+        self.max_actions_per_round = agent_config.get("max_actions_per_round", 3)
         self.max_iterations = agent_config.get("max_iterations", 3)
+        # Tools of one round are independent and can run concurrently
+        self.parallel_tools = agent_config.get("parallel_tools", True)
+        self.max_parallel_tools = max(1, agent_config.get("max_parallel_tools", 3))
+        self.tool_timeout = agent_config.get("tool_timeout", 60)
 
     async def process(
         self,
@@ -150,25 +156,27 @@ class InvestigateAgent(BaseAgent):
         executed_actions: list[dict[str, Any]] = []
 
         # Limit number of actions per round based on config
-        tool_plans_to_execute = tool_plans[: self.max_actions_per_round]
+        tool_plans_to_execute = [
+            plan
+            for plan in tool_plans[: self.max_actions_per_round]
+            if plan.get("tool") and plan.get("tool") != "none"
+        ]
 
-        for plan in tool_plans_to_execute:
-            tool_type = plan.get("tool")
-            if not tool_type:
-                continue
+        # Tools run concurrently, but citations are registered in plan order so
+        # cite IDs do not depend on which tool finished first
+        outcomes = await self._fetch_actions(tool_plans_to_execute, kb_name, output_dir)
 
+        for plan, outcome in zip(tool_plans_to_execute, outcomes):
+            tool_type = plan.get("tool")
             query = plan.get("query", "")
             identifier = plan.get("identifier")
 
-            if tool_type == "none":
-                continue
-
-            knowledge_item = await self._execute_single_action(
+            knowledge_item = self._register_action(
                 tool_selection=tool_type,
                 query=query,
                 identifier=identifier,
                 kb_name=kb_name,
-                output_dir=output_dir,
+                outcome=outcome,
                 citation_memory=citation_memory,
             )
 
@@ -290,6 +298,39 @@ class InvestigateAgent(BaseAgent):
             )
         return template.format(**context)
 
+    async def _fetch_actions(
+        self,
+        plans: list[dict[str, Any]],
+        kb_name: str,
+        output_dir: str | None,
+    ) -> list[dict[str, Any] | None]:
+        """Run the tool calls of one round, concurrently unless disabled (results in plan order)"""
+        if not self.parallel_tools or len(plans) <= 1:
+            return [
+                await self._fetch_tool_result(
+                    plan.get("tool"),
+                    plan.get("query", ""),
+                    plan.get("identifier"),
+                    kb_name,
+                    output_dir,
+                )
+                for plan in plans
+            ]
+
+        semaphore = asyncio.Semaphore(self.max_parallel_tools)
+
+        async def fetch(plan: dict[str, Any]) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self._fetch_tool_result(
+                    plan.get("tool"),
+                    plan.get("query", ""),
+                    plan.get("identifier"),
+                    kb_name,
+                    output_dir,
+                )
+
+        return list(await asyncio.gather(*(fetch(plan) for plan in plans)))
+
     async def _execute_single_action(
         self,
         tool_selection: str,
@@ -300,18 +341,42 @@ class InvestigateAgent(BaseAgent):
         citation_memory: CitationMemory,
     ) -> KnowledgeItem | None:
         """Execute a single tool call"""
-        import time
+        outcome = await self._fetch_tool_result(
+            tool_selection, query, identifier, kb_name, output_dir
+        )
+        return self._register_action(
+            tool_selection=tool_selection,
+            query=query,
+            identifier=identifier,
+            kb_name=kb_name,
+            outcome=outcome,
+            citation_memory=citation_memory,
+        )
 
+    async def _fetch_tool_result(
+        self,
+        tool_selection: str,
+        query: str,
+        identifier: str | None,
+        kb_name: str,
+        output_dir: str | None,
+    ) -> dict[str, Any] | None:
+        """
+        Call one tool (bounded by tool_timeout) without registering a citation
+
+        Returns:
+            dict with result, raw_result, elapsed_ms and error (None on success),
+            or None if the call was rejected before running
+        """
         start_time = time.time()
-        tool_input = {"query": query, "identifier": identifier, "kb_name": kb_name}
 
         try:
             if tool_selection == "rag_naive":
-                result = await self._call_rag_naive(query, kb_name, output_dir)
+                result = await self._with_timeout(self._call_rag_naive(query, kb_name, output_dir))
                 raw_result = result.get("answer", "")
 
             elif tool_selection == "rag_hybrid":
-                result = await self._call_rag_hybrid(query, kb_name, output_dir)
+                result = await self._with_timeout(self._call_rag_hybrid(query, kb_name, output_dir))
                 raw_result = result.get("answer", "")
 
             elif tool_selection == "web_search":
@@ -321,7 +386,7 @@ class InvestigateAgent(BaseAgent):
                         "Tool call rejected (web_search): web_search is disabled in config"
                     )
                     return None
-                result = await self._call_web_search(query, output_dir)
+                result = await self._with_timeout(self._call_web_search(query, output_dir))
                 raw_result = json.dumps(result, ensure_ascii=False, indent=2)
 
             elif tool_selection == "query_item":
@@ -337,62 +402,103 @@ class InvestigateAgent(BaseAgent):
                     )
                     return None
 
-                result = await self._call_query_item(identifier_to_use, kb_name)
+                result = await self._with_timeout(self._call_query_item(identifier_to_use, kb_name))
                 raw_result = result.get("content", result.get("answer", ""))
 
             else:
                 self.logger.warning(f"Unknown tool type: {tool_selection}")
                 return None
 
-            elapsed_ms = (time.time() - start_time) * 1000
+            return {
+                "result": result,
+                "raw_result": raw_result,
+                "elapsed_ms": (time.time() - start_time) * 1000,
+                "error": None,
+            }
 
-            # Create and register citation
-            cite_id = citation_memory.add_citation(
-                tool_type=tool_selection,
-                query=query,
-                raw_result=raw_result,
-                stage="analysis",
-                metadata={"identifier": identifier},
-            )
-            citation_memory.save()
+        except asyncio.TimeoutError:
+            error_msg = f"timed out after {self.tool_timeout}s"
+        except Exception as e:
+            error_msg = str(e) or repr(e)
 
-            # Log tool call
-            self.logger.log_tool_call(
-                tool_name=tool_selection,
-                tool_input=tool_input,
-                tool_output=result,
-                status="success",
-                elapsed_ms=elapsed_ms,
-                citation_id=cite_id,
-            )
+        return {
+            "result": None,
+            "raw_result": "",
+            "elapsed_ms": (time.time() - start_time) * 1000,
+            "error": error_msg,
+        }
 
-            # Create knowledge item
-            knowledge_item = KnowledgeItem(
-                cite_id=cite_id,
-                tool_type=tool_selection,
-                query=query,
-                raw_result=raw_result,
-                summary="",  # Generated by NoteAgent
-            )
+    async def _with_timeout(self, coro):
+        """
+        Await a tool call, bounded by tool_timeout (None or 0 disables it)
 
-            return knowledge_item
+        A timeout only abandons the awaitable. Blocking tools run through
+        asyncio.to_thread (web_search, query_item) keep running in the default
+        executor until they return, so a hung call still holds a worker thread.
+        """
+        if not self.tool_timeout:
+            return await coro
+        return await asyncio.wait_for(coro, timeout=self.tool_timeout)
 
-        except Exception as e:
-            elapsed_ms = (time.time() - start_time) * 1000
-            error_msg = str(e)
+    def _register_action(
+        self,
+        tool_selection: str,
+        query: str,
+        identifier: str | None,
+        kb_name: str,
+        outcome: dict[str, Any] | None,
+        citation_memory: CitationMemory,
+    ) -> KnowledgeItem | None:
+        """Log a finished tool call and register its citation"""
+        if outcome is None:
+            return None
 
+        tool_input = {"query": query, "identifier": identifier, "kb_name": kb_name}
+
+        if outcome["error"] is not None:
+            error_msg = outcome["error"]
             self.logger.log_tool_call(
                 tool_name=tool_selection,
                 tool_input=tool_input,
                 tool_output=error_msg,
                 status="failed",
-                elapsed_ms=elapsed_ms,
+                elapsed_ms=outcome["elapsed_ms"],
                 error=error_msg,
             )
-
-            self.logger.warning(f"Tool call failed ({tool_selection}): {e}")
+            self.logger.warning(f"Tool call failed ({tool_selection}): {error_msg}")
             return None
 
+        raw_result = outcome["raw_result"]
+
+        # Create and register citation
+        cite_id = citation_memory.add_citation(
+            tool_type=tool_selection,
+            query=query,
+            raw_result=raw_result,
+            stage="analysis",
+            metadata={"identifier": identifier},
+        )
+        citation_memory.save()
+
+        # Log tool call
+        self.logger.log_tool_call(
+            tool_name=tool_selection,
+            tool_input=tool_input,
+            tool_output=outcome["result"],
+            status="success",
+            elapsed_ms=outcome["elapsed_ms"],
+            citation_id=cite_id,
+        )
+
+        # Create knowledge item
+        return KnowledgeItem(
+            cite_id=cite_id,
+            tool_type=tool_selection,
+            query=query,
+            raw_result=raw_result,
+            summary="",  # Generated by NoteAgent
+        )
+
     async def _call_rag_naive(
         self, query: str, kb_name: str, output_dir: str | None
     ) -> dict[str, Any]:
@@ -406,9 +512,11 @@ class InvestigateAgent(BaseAgent):
         return await rag_search(query=query, kb_name=kb_name, mode="hybrid")
 
     async def _call_web_search(self, query: str, output_dir: str | None) -> dict[str, Any]:
-        """Call Web Search"""
-        return web_search(query=query, output_dir=output_dir or "./cache", verbose=False)
+        """Call Web Search (blocking client, run in a worker thread that outlives a timeout)"""
+        return await asyncio.to_thread(
+            web_search, query=query, output_dir=output_dir or "./cache", verbose=False
+        )
 
     async def _call_query_item(self, identifier: str, kb_name: str) -> dict[str, Any]:
-        """Call Query Item"""
-        return query_numbered_item(identifier=identifier, kb_name=kb_name)
+        """Call Query Item (blocking, run in a worker thread that outlives a timeout)"""
+        return await asyncio.to_thread(query_numbered_item, identifier=identifier, kb_name=kb_name)
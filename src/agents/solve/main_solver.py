@@ -31,6 +31,7 @@ from .solve_loop import (
 )
 from .utils import ConfigValidator, PerformanceMonitor, SolveAgentLogger
 from .utils.display_manager import get_display_manager
+from .utils.step_scheduler import StepScheduler, resolve_dependencies, transitive_dependencies
 from .utils.token_tracker import TokenTracker
 
 
@@ -589,84 +590,61 @@ class MainSolver:
         if plan_result is None:
             raise ValueError("ManagerAgent failed to generate plan")
 
-        # 2. Solve Loop - Execute steps
+        # 2. Solve Loop - Execute steps (independent steps run concurrently)
         self.logger.info("Solve: Executing solution steps...")
         max_correction_iterations = self.config.get("system", {}).get(
             "max_solve_correction_iterations", 3
         )
+        solve_config = self.config.get("solve", {})
+        max_parallel_steps = (
+            solve_config.get("max_parallel_steps", 3)
+            if solve_config.get("parallel_steps", True)
+            else 1
+        )
         total_planned_steps = len(solve_memory.solve_chains)
         self.logger.log_stage_progress(
             "SolveLoop",
             "start",
-            f"planned_steps={total_planned_steps}, max_corrections={max_correction_iterations}",
+            f"planned_steps={total_planned_steps}, max_corrections={max_correction_iterations}, "
+            f"max_parallel_steps={max_parallel_steps}",
         )
 
-        for step_index, step in enumerate(solve_memory.solve_chains, 1):
-            if step.status in ("waiting_response", "done"):
-                continue
-
-            self.logger.info(f"  Step {step_index}: {step.step_id}")
-            self.logger.debug(f"  Target: {step.step_target[:80]}")
+        step_indices = {
+            step.step_id: index for index, step in enumerate(solve_memory.solve_chains, 1)
+        }
+        dependencies = resolve_dependencies(solve_memory.solve_chains)
 
-            if hasattr(self, "_send_progress_update"):
-                self._send_progress_update(
-                    "solve",
-                    {
-                        "step_index": step_index,
-                        "step_id": step.step_id,
-                        "step_target": step.step_target,
-                    },
+        async def run_step(step: SolveChainStep) -> None:
+            # Solve → Tool → Response for one step; dependents start once it is done
+            if step.status not in ("waiting_response", "done"):
+                await self._solve_step(
+                    question=question,
+                    step=step,
+                    step_index=step_indices[step.step_id],
+                    solve_memory=solve_memory,
+                    investigate_memory=investigate_memory,
+                    citation_memory=citation_memory,
+                    output_dir=output_dir,
+                    max_correction_iterations=max_correction_iterations,
+                    dependencies=dependencies,
+                )
+            current_step = solve_memory.get_step(step.step_id) or step
+            if current_step.status == "waiting_response":
+                await self._respond_step(
+                    question=question,
+                    step=current_step,
+                    step_index=step_indices[step.step_id],
+                    solve_memory=solve_memory,
+                    investigate_memory=investigate_memory,
+                    citation_memory=citation_memory,
+                    output_dir=output_dir,
+                    dependencies=dependencies,
                 )
 
-            self.logger.log_stage_progress("SolveLoop", "running", f"step={step.step_id}")
-
-            if self._has_pending_tool_calls(step):
-                await self._execute_tool_calls(step, solve_memory, citation_memory, output_dir)
-
-            iteration = 0
-            while iteration < max_correction_iterations:
-                iteration += 1
-                current_step = solve_memory.get_step(step.step_id) or step
-
-                with self.monitor.track(f"solve_execute_{step.step_id}_iter_{iteration}"):
-                    solve_result = await self.solve_agent.process(
-                        question=question,
-                        current_step=current_step,
-                        solve_memory=solve_memory,
-                        investigate_memory=investigate_memory,
-                        citation_memory=citation_memory,
-                        kb_name=self.kb_name,
-                        output_dir=output_dir,
-                        verbose=False,
-                    )
-
-                if solve_result.get("raw_llm_response"):
-                    self.logger.log_stage_progress(
-                        "SolveLoop", "running", f"step={step.step_id}, iteration={iteration}"
-                    )
-
-                if solve_result.get("requested_calls"):
-                    await self._execute_tool_calls(
-                        current_step, solve_memory, citation_memory, output_dir
-                    )
-
-                self.logger.update_token_stats(self.token_tracker.get_summary())
-
-                if solve_result.get("finish_requested"):
-                    current_step = solve_memory.get_step(step.step_id) or step
-                    if self._has_pending_tool_calls(current_step):
-                        self.logger.debug("  Finish triggered but tools pending, continuing...")
-                        continue
-                    solve_memory.mark_step_waiting_response(current_step.step_id)
-                    solve_memory.save()
-                    self.logger.log_stage_progress(
-                        "SolveLoop", "complete", f"step={current_step.step_id} ready for response"
-                    )
-                    break
-            else:
-                self.logger.warning(f"  Step {step.step_id} max iterations reached")
-                solve_memory.mark_step_waiting_response(step.step_id)
-                solve_memory.save()
+        self.logger.log_stage_progress("ResponseLoop", "start", "Generating responses")
+        schedule_report = await StepScheduler(max_parallel=max_parallel_steps).run(
+            solve_memory.solve_chains, run_step
+        )
 
         pending_steps = [
             s.step_id
@@ -679,64 +657,22 @@ class MainSolver:
         self.logger.log_stage_progress(
             "SolveLoop", "complete", f"steps_processed={total_planned_steps - len(pending_steps)}"
         )
-
-        # 3. Response: Generate responses for each step
-        self.logger.info("Response: Generating step responses...")
-        self.logger.log_stage_progress("ResponseLoop", "start", "Generating responses")
-
-        accumulated_response = ""
-        for step in solve_memory.solve_chains:
-            if step.status == "done" and step.step_response:
-                accumulated_response += step.step_response + "\n\n"
-
-        for step in solve_memory.solve_chains:
-            if step.status != "waiting_response":
-                continue
-
-            original_step_index = next(
-                (
-                    i + 1
-                    for i, s in enumerate(solve_memory.solve_chains)
-                    if s.step_id == step.step_id
-                ),
-                0,
-            )
-
-            if hasattr(self, "_send_progress_update"):
-                self._send_progress_update(
-                    "response",
-                    {
-                        "step_index": original_step_index,
-                        "step_id": step.step_id,
-                        "step_target": step.step_target,
-                    },
-                )
-
-            with self.monitor.track(f"solve_response_{step.step_id}"):
-                response_result = await self.response_agent.process(
-                    question=question,
-                    step=step,
-                    solve_memory=solve_memory,
-                    investigate_memory=investigate_memory,
-                    citation_memory=citation_memory,
-                    output_dir=output_dir,
-                    verbose=False,
-                    accumulated_response=accumulated_response,
-                )
-
-            step_response = response_result.get("step_response", "")
-            if step_response:
-                accumulated_response += step_response + "\n\n"
-
-            if response_result.get("raw_response"):
-                self.logger.log_stage_progress(
-                    "ResponseLoop", "running", f"step={step.step_id} response generated"
-                )
-
-            self.logger.update_token_stats(self.token_tracker.get_summary())
-
         self.logger.log_stage_progress("ResponseLoop", "complete", "All responses generated")
 
+        solve_memory.metadata["schedule"] = {
+            "max_parallel_steps": max_parallel_steps,
+            "wall_seconds": round(schedule_report["wall_seconds"], 2),
+            "serial_seconds": round(schedule_report["serial_seconds"], 2),
+            "critical_path_seconds": round(schedule_report["critical_path_seconds"], 2),
+            "critical_path": schedule_report["critical_path"],
+        }
+        self.logger.info(
+            f"  Schedule: wall={schedule_report['wall_seconds']:.1f}s, "
+            f"serial={schedule_report['serial_seconds']:.1f}s, "
+            f"critical path={schedule_report['critical_path_seconds']:.1f}s "
+            f"({' → '.join(schedule_report['critical_path'])})"
+        )
+
         # 4. Finalize: Compile final answer
         self.logger.info("Finalize: Compiling final answer...")
         self.logger.log_stage_progress("Finalize", "start", "Compiling steps")
@@ -833,9 +769,137 @@ class MainSolver:
                 "coverage_rate": investigate_memory.metadata.get("coverage_rate", 0.0),
                 "avg_confidence": investigate_memory.metadata.get("avg_confidence", 0.0),
                 "total_steps": solve_memory.metadata["total_steps"],
+                "schedule": solve_memory.metadata.get("schedule"),
             },
         }
 
+    async def _solve_step(
+        self,
+        question: str,
+        step: SolveChainStep,
+        step_index: int,
+        solve_memory: SolveMemory,
+        investigate_memory: InvestigateMemory,
+        citation_memory: CitationMemory,
+        output_dir: str,
+        max_correction_iterations: int,
+        dependencies: dict[str, list[str]],
+    ) -> None:
+        """Run the solve/tool iterations of one step until it is ready for a response"""
+        self.logger.info(f"  Step {step_index}: {step.step_id}")
+        self.logger.debug(f"  Target: {step.step_target[:80]}")
+
+        if hasattr(self, "_send_progress_update"):
+            self._send_progress_update(
+                "solve",
+                {
+                    "step_index": step_index,
+                    "step_id": step.step_id,
+                    "step_target": step.step_target,
+                },
+            )
+
+        self.logger.log_stage_progress("SolveLoop", "running", f"step={step.step_id}")
+
+        if self._has_pending_tool_calls(step):
+            await self._execute_tool_calls(step, solve_memory, citation_memory, output_dir)
+
+        iteration = 0
+        while iteration < max_correction_iterations:
+            iteration += 1
+            current_step = solve_memory.get_step(step.step_id) or step
+
+            with self.monitor.track(f"solve_execute_{step.step_id}_iter_{iteration}"):
+                solve_result = await self.solve_agent.process(
+                    question=question,
+                    current_step=current_step,
+                    solve_memory=solve_memory,
+                    investigate_memory=investigate_memory,
+                    citation_memory=citation_memory,
+                    kb_name=self.kb_name,
+                    output_dir=output_dir,
+                    verbose=False,
+                    dependencies=dependencies,
+                )
+
+            if solve_result.get("raw_llm_response"):
+                self.logger.log_stage_progress(
+                    "SolveLoop", "running", f"step={step.step_id}, iteration={iteration}"
+                )
+
+            if solve_result.get("requested_calls"):
+                await self._execute_tool_calls(
+                    current_step, solve_memory, citation_memory, output_dir
+                )
+
+            self.logger.update_token_stats(self.token_tracker.get_summary())
+
+            if solve_result.get("finish_requested"):
+                current_step = solve_memory.get_step(step.step_id) or step
+                if self._has_pending_tool_calls(current_step):
+                    self.logger.debug("  Finish triggered but tools pending, continuing...")
+                    continue
+                solve_memory.mark_step_waiting_response(current_step.step_id)
+                solve_memory.save()
+                self.logger.log_stage_progress(
+                    "SolveLoop", "complete", f"step={current_step.step_id} ready for response"
+                )
+                break
+        else:
+            self.logger.warning(f"  Step {step.step_id} max iterations reached")
+            solve_memory.mark_step_waiting_response(step.step_id)
+            solve_memory.save()
+
+    async def _respond_step(
+        self,
+        question: str,
+        step: SolveChainStep,
+        step_index: int,
+        solve_memory: SolveMemory,
+        investigate_memory: InvestigateMemory,
+        citation_memory: CitationMemory,
+        output_dir: str,
+        dependencies: dict[str, list[str]],
+    ) -> None:
+        """Generate the response of one step from the responses of the steps it builds on"""
+        # Responses of the step's (transitive) dependencies, in plan order; for a
+        # sequential plan this is every earlier step, as before
+        needed = transitive_dependencies(step.step_id, dependencies)
+        accumulated_response = "".join(
+            s.step_response + "\n\n"
+            for s in solve_memory.solve_chains
+            if s.step_id in needed and s.step_response
+        )
+
+        if hasattr(self, "_send_progress_update"):
+            self._send_progress_update(
+                "response",
+                {
+                    "step_index": step_index,
+                    "step_id": step.step_id,
+                    "step_target": step.step_target,
+                },
+            )
+
+        with self.monitor.track(f"solve_response_{step.step_id}"):
+            response_result = await self.response_agent.process(
+                question=question,
+                step=step,
+                solve_memory=solve_memory,
+                investigate_memory=investigate_memory,
+                citation_memory=citation_memory,
+                output_dir=output_dir,
+                verbose=False,
+                accumulated_response=accumulated_response,
+            )
+
+        if response_result.get("raw_response"):
+            self.logger.log_stage_progress(
+                "ResponseLoop", "running", f"step={step.step_id} response generated"
+            )
+
+        self.logger.update_token_stats(self.token_tracker.get_summary())
+
     async def _execute_tool_calls(
         self,
         step: SolveChainStep,
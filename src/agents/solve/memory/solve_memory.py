@@ -75,6 +75,8 @@ class SolveChainStep:
     step_response: Optional[str] = None
     status: str = "undone"  # undone | in_progress | waiting_response | done | failed
     used_citations: List[str] = field(default_factory=list)
+    # Earlier steps this step builds on; None = the previous step (sequential plan)
+    depends_on: Optional[List[str]] = None
     created_at: str = field(default_factory=_now)
     updated_at: str = field(default_factory=_now)
 
@@ -100,6 +102,7 @@ class SolveChainStep:
             step_response=data.get("step_response", data.get("content")),
             status=data["status"],
             used_citations=data.get("used_citations", []),
+            depends_on=data.get("depends_on"),
             created_at=data["created_at"],
             updated_at=data["updated_at"],
         )
@@ -193,6 +193,7 @@ class ManagerAgent(BaseAgent):
             raise ValueError("'steps' array in JSON is empty, please check LLM output")
 
         # Parse each step
+        earlier_step_ids: list[str] = []
         for idx, step_data in enumerate(steps_data, 1):
             if not isinstance(step_data, dict):
                 self.logger.warning(
@@ -249,6 +250,12 @@ class ManagerAgent(BaseAgent):
                         f"[ManagerAgent] Skipping unknown cite_id {cleaned} (not in knowledge chain)"
                     )
 
+            # Get depends_on (missing field = depends on the previous step)
+            depends_on = self._parse_depends_on(
+                step_data.get("depends_on"), step_id, earlier_step_ids
+            )
+            earlier_step_ids.append(step_id)
+
             # Create step
             steps.append(
                 SolveChainStep(
@@ -256,6 +263,7 @@ class ManagerAgent(BaseAgent):
                     step_target=step_target,
                     available_cite=list(dict.fromkeys(filtered_cites)),  # Remove duplicates
                     status="undone",
+                    depends_on=depends_on,
                 )
             )
 
@@ -270,5 +278,35 @@ class ManagerAgent(BaseAgent):
                 logger.info(
                     f"    Available citations: {', '.join(step.available_cite) or '(none)'}"
                 )
+                if step.depends_on is not None:
+                    logger.info(f"    Depends on: {', '.join(step.depends_on) or '(none)'}")
 
         return steps
+
+    def _parse_depends_on(
+        self, depends_raw: Any, step_id: str, earlier_step_ids: list[str]
+    ) -> list[str] | None:
+        """Normalize a step's depends_on field (only earlier steps are kept)"""
+        if depends_raw is None:
+            return None
+        if isinstance(depends_raw, str):
+            depends_raw = [] if depends_raw.strip().lower() in ("", "none") else [depends_raw]
+        if not isinstance(depends_raw, list):
+            return None
+
+        # Match IDs case-insensitively ("s1" -> "S1") against the earlier steps
+        earlier_by_upper = {earlier_id.upper(): earlier_id for earlier_id in earlier_step_ids}
+        depends_on: list[str] = []
+        for dep in depends_raw:
+            dep_id = str(dep).strip().strip("[] ").upper()
+            if dep_id and not dep_id.startswith("S"):
+                dep_id = f"S{dep_id}"
+            dep_id = earlier_by_upper.get(dep_id, dep_id)
+            if dep_id in earlier_step_ids:
+                if dep_id not in depends_on:
+                    depends_on.append(dep_id)
+            elif dep_id:
+                self.logger.warning(
+                    f"[ManagerAgent] Step {step_id}: ignoring dependency {dep_id} (not an earlier step)"
+                )
+        return depends_on
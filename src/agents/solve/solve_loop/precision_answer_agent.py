@@ -71,7 +71,10 @@ class PrecisionAnswerAgent(BaseAgent):
             )
         user_prompt = template.format(question=question)
         response = await self.call_llm(
-            user_prompt=user_prompt, system_prompt=system_prompt, verbose=verbose
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            verbose=verbose,
+            stage="precision_decision",
         )
         needs_precision = response.strip().upper().startswith("Y")
         return {"needs_precision": needs_precision, "raw_decision": response.strip()}
@@ -91,6 +94,9 @@ class PrecisionAnswerAgent(BaseAgent):
             )
         user_prompt = template.format(question=question, detailed_answer=detailed_answer)
         response = await self.call_llm(
-            user_prompt=user_prompt, system_prompt=system_prompt, verbose=verbose
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            verbose=verbose,
+            stage="precision_answer",
         )
         return response.strip()
@@ -18,6 +18,7 @@ from src.agents.base_agent import BaseAgent
 
 from ..memory import CitationMemory, InvestigateMemory, SolveChainStep, SolveMemory
 from ..utils.json_utils import extract_json_from_text
+from ..utils.step_scheduler import resolve_dependencies, transitive_dependencies
 
 
 class SolveAgent(BaseAgent):
@@ -62,6 +63,7 @@ class SolveAgent(BaseAgent):
         kb_name: str = "ai_textbook",
         output_dir: str | None = None,
         verbose: bool = True,
+        dependencies: dict[str, list[str]] | None = None,
     ) -> dict[str, Any]:
         if not current_step:
             raise ValueError("No pending solve-chain step to execute")
@@ -71,6 +73,7 @@ class SolveAgent(BaseAgent):
             current_step=current_step,
             solve_memory=solve_memory,
             investigate_memory=investigate_memory,
+            dependencies=dependencies,
         )
 
         system_prompt = self._build_system_prompt()
@@ -182,13 +185,14 @@ class SolveAgent(BaseAgent):
         current_step: SolveChainStep,
         solve_memory: SolveMemory,
         investigate_memory: InvestigateMemory,
+        dependencies: dict[str, list[str]] | None = None,
     ) -> dict[str, Any]:
         return {
             "question": question,
             "current_step_id": current_step.step_id,
             "step_target": current_step.step_target,
             "available_cite_text": self._format_available_cite(current_step, investigate_memory),
-            "previous_steps": self._format_previous_steps(current_step, solve_memory),
+            "previous_steps": self._format_previous_steps(current_step, solve_memory, dependencies),
             "current_tool_history": self._format_tool_history(current_step),
         }
 
@@ -237,13 +241,21 @@ class SolveAgent(BaseAgent):
         return "\n".join(lines) if lines else "(No matching knowledge)"
 
     def _format_previous_steps(
-        self, current_step: SolveChainStep, solve_memory: SolveMemory
+        self,
+        current_step: SolveChainStep,
+        solve_memory: SolveMemory,
+        dependencies: dict[str, list[str]] | None = None,
     ) -> str:
+        # Only the steps this one (transitively) depends on, so the prompt does not
+        # depend on which concurrently running siblings happened to finish first
+        if dependencies is None:
+            dependencies = resolve_dependencies(solve_memory.solve_chains)
+        needed = transitive_dependencies(current_step.step_id, dependencies)
         snippets: list[str] = []
         for step in solve_memory.solve_chains:
             if step.step_id == current_step.step_id:
                 break
-            if step.step_response:
+            if step.step_id in needed and step.step_response:
                 snippets.append(
                     f"[{step.step_id}] {step.step_target}\n{step.step_response[:300]}..."
                 )
@@ -5,11 +5,13 @@ ToolAgent - Tool executor
 Responsible for reading tool calls in solve-chain, actually executing tools and producing summary
 """
 
+import asyncio
 from pathlib import Path
 import re
 import sys
 import time
 from typing import Any
+import weakref
 
 project_root = Path(__file__).parent.parent.parent.parent
 if str(project_root) not in sys.path:
@@ -27,6 +29,11 @@ from ..memory.solve_memory import ToolCallRecord
 class ToolAgent(BaseAgent):
     """Execute tool calls and generate summary"""
 
+    # Code executions sharing an artifacts directory run one at a time
+    _artifact_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+        weakref.WeakValueDictionary()
+    )
+
     def __init__(
         self,
         config: dict[str, Any],
@@ -46,6 +53,10 @@ class ToolAgent(BaseAgent):
             config=config,
             token_tracker=token_tracker,
         )
+        # Independent tool calls of a step run (and get summarized) concurrently
+        agent_config = config.get("solve", {}).get("agents", {}).get("tool_agent", {})
+        self.parallel_tools = agent_config.get("parallel_tools", True)
+        self.max_parallel_tools = max(1, agent_config.get("max_parallel_tools", 4))
 
     async def _generate_code_from_intent(self, intent: str) -> str:
         system_prompt = """
@@ -104,13 +115,64 @@ Rules:
             "Tool", "start", f"step={step.step_id}, pending_calls={len(pending)}"
         )
 
-        for record in pending:
-            call_label = f"{record.tool_type} | cite={record.cite_id or '-'}"
-            self.logger.log_stage_progress(
-                "Tool", "running", f"step={step.step_id}, call={call_label}"
+        if self.parallel_tools and len(pending) > 1:
+            semaphore = asyncio.Semaphore(self.max_parallel_tools)
+
+            async def run_bounded(record: ToolCallRecord) -> dict[str, Any]:
+                async with semaphore:
+                    return await self._run_call(
+                        step, record, kb_name, output_dir, artifacts_dir, verbose
+                    )
+
+            outcomes = await asyncio.gather(*(run_bounded(record) for record in pending))
+        else:
+            outcomes = [
+                await self._run_call(step, record, kb_name, output_dir, artifacts_dir, verbose)
+                for record in pending
+            ]
+
+        # Apply results in call order so memory and logs do not depend on timing
+        for record, outcome in zip(pending, outcomes):
+            logs.append(
+                self._apply_call_outcome(step, record, outcome, solve_memory, citation_memory)
             )
-            start_ts = time.time()
-            try:
+
+        solve_memory.save()
+        citation_memory.save()
+
+        self.logger.log_stage_progress(
+            "Tool", "complete", f"step={step.step_id}, executed={len(logs)}"
+        )
+
+        return {"step_id": step.step_id, "executed": logs, "status": "completed"}
+
+    async def _run_call(
+        self,
+        step: SolveChainStep,
+        record: ToolCallRecord,
+        kb_name: str,
+        output_dir: str | None,
+        artifacts_dir: Path,
+        verbose: bool,
+    ) -> dict[str, Any]:
+        """Execute one tool call and summarize it as soon as its raw result lands"""
+        call_label = f"{record.tool_type} | cite={record.cite_id or '-'}"
+        self.logger.log_stage_progress("Tool", "running", f"step={step.step_id}, call={call_label}")
+        start_ts = time.time()
+        try:
+            if record.tool_type == "code_execution":
+                # Serialize code runs per artifacts directory so artifact
+                # snapshots and generated files do not clobber each other
+                lock = self._artifact_locks.setdefault(str(artifacts_dir), asyncio.Lock())
+                async with lock:
+                    raw_answer, metadata = await self._execute_single_call(
+                        record=record,
+                        kb_name=kb_name,
+                        output_dir=output_dir,
+                        artifacts_dir=str(artifacts_dir),
+                        verbose=verbose,
+                    )
+            else:
                 raw_answer, metadata = await self._execute_single_call(
                     record=record,
                     kb_name=kb_name,
@@ -119,110 +181,117 @@ Rules:
                     verbose=verbose,
                 )
 
-                # Check if code execution failed
-                is_failed = False
-                if record.tool_type == "code_execution":
-                    is_failed = metadata.get("execution_failed", False)
-                    exit_code = metadata.get("exit_code", 0)
-                    if exit_code != 0:
-                        is_failed = True
-
-                summary = await self._summarize_tool_result(
-                    tool_type=record.tool_type, query=record.query, raw_answer=raw_answer
-                )
-
-                # Set correct status based on execution result
-                status = "failed" if is_failed else "success"
-                solve_memory.update_tool_call_result(
-                    step_id=step.step_id,
-                    call_id=record.call_id,
-                    raw_answer=raw_answer,
-                    summary=summary,
-                    status=status,
-                    metadata=metadata,  # Pass metadata to ensure artifacts are saved
-                )
-                citation_memory.update_citation(
-                    cite_id=record.cite_id,
-                    raw_result=raw_answer,
-                    content=summary,
-                    metadata=metadata,
-                    step_id=step.step_id,
-                )
-                elapsed_ms = (time.time() - start_ts) * 1000
-                self.logger.log_tool_call(
-                    tool_name=record.tool_type,
-                    tool_input={
-                        "step_id": step.step_id,
-                        "call_id": record.call_id,
-                        "query": record.query,
-                    },
-                    tool_output=raw_answer,
-                    status="success",
-                    elapsed_ms=elapsed_ms,
-                    step_id=step.step_id,
-                    cite_id=record.cite_id,
-                )
-                logs.append(
-                    {
-                        "call_id": record.call_id,
-                        "tool_type": record.tool_type,
-                        "cite_id": record.cite_id,
-                        "status": "success",
-                        "summary": summary,
-                    }
-                )
-            except Exception as e:
-                error_msg = str(e)
-                elapsed_ms = (time.time() - start_ts) * 1000
-                solve_memory.update_tool_call_result(
-                    step_id=step.step_id,
-                    call_id=record.call_id,
-                    raw_answer=error_msg,
-                    summary=error_msg[:200],
-                    status="failed",
-                    metadata={"error": True},
-                )
-                citation_memory.update_citation(
-                    cite_id=record.cite_id,
-                    raw_result=error_msg,
-                    content=error_msg[:200],
-                    metadata={"error": True},
-                    step_id=step.step_id,
-                )
-                self.logger.log_tool_call(
-                    tool_name=record.tool_type,
-                    tool_input={
-                        "step_id": step.step_id,
-                        "call_id": record.call_id,
-                        "query": record.query,
-                    },
-                    tool_output=error_msg,
-                    status="failed",
-                    elapsed_ms=elapsed_ms,
-                    step_id=step.step_id,
-                    cite_id=record.cite_id,
-                )
-                self.logger.log_stage_progress(
-                    "Tool", "warning", f"step={step.step_id}, call={call_label}, error={error_msg}"
-                )
-                logs.append(
-                    {
-                        "call_id": record.call_id,
-                        "tool_type": record.tool_type,
-                        "cite_id": record.cite_id,
-                        "status": "failed",
-                        "error": error_msg,
-                    }
-                )
+            # Check if code execution failed
+            is_failed = False
+            if record.tool_type == "code_execution":
+                is_failed = metadata.get("execution_failed", False)
+                exit_code = metadata.get("exit_code", 0)
+                if exit_code != 0:
+                    is_failed = True
+
+            summary = await self._summarize_tool_result(
+                tool_type=record.tool_type, query=record.query, raw_answer=raw_answer
+            )
+            return {
+                "raw_answer": raw_answer,
+                "metadata": metadata,
+                "summary": summary,
+                "is_failed": is_failed,
+                "error": None,
+                "elapsed_ms": (time.time() - start_ts) * 1000,
+            }
+        except Exception as e:
+            return {"error": str(e), "elapsed_ms": (time.time() - start_ts) * 1000}
 
-        solve_memory.save()
-        citation_memory.save()
+    def _apply_call_outcome(
+        self,
+        step: SolveChainStep,
+        record: ToolCallRecord,
+        outcome: dict[str, Any],
+        solve_memory: SolveMemory,
+        citation_memory: CitationMemory,
+    ) -> dict[str, Any]:
+        """Record a finished tool call in memory and logs; returns its log entry"""
+        tool_input = {
+            "step_id": step.step_id,
+            "call_id": record.call_id,
+            "query": record.query,
+        }
+
+        if outcome["error"] is None:
+            raw_answer = outcome["raw_answer"]
+            summary = outcome["summary"]
+            metadata = outcome["metadata"]
+            # Set correct status based on execution result
+            status = "failed" if outcome["is_failed"] else "success"
+            solve_memory.update_tool_call_result(
+                step_id=step.step_id,
+                call_id=record.call_id,
+                raw_answer=raw_answer,
+                summary=summary,
+                status=status,
+                metadata=metadata,  # Pass metadata to ensure artifacts are saved
+            )
+            citation_memory.update_citation(
+                cite_id=record.cite_id,
+                raw_result=raw_answer,
+                content=summary,
+                metadata=metadata,
+                step_id=step.step_id,
+            )
+            self.logger.log_tool_call(
+                tool_name=record.tool_type,
+                tool_input=tool_input,
+                tool_output=raw_answer,
+                status="success",
+                elapsed_ms=outcome["elapsed_ms"],
+                step_id=step.step_id,
+                cite_id=record.cite_id,
+            )
+            return {
+                "call_id": record.call_id,
+                "tool_type": record.tool_type,
+                "cite_id": record.cite_id,
+                "status": "success",
+                "summary": summary,
+            }
 
+        error_msg = outcome["error"]
+        solve_memory.update_tool_call_result(
+            step_id=step.step_id,
+            call_id=record.call_id,
+            raw_answer=error_msg,
+            summary=error_msg[:200],
+            status="failed",
+            metadata={"error": True},
+        )
+        citation_memory.update_citation(
+            cite_id=record.cite_id,
+            raw_result=error_msg,
+            content=error_msg[:200],
+            metadata={"error": True},
+            step_id=step.step_id,
+        )
+        self.logger.log_tool_call(
+            tool_name=record.tool_type,
+            tool_input=tool_input,
+            tool_output=error_msg,
+            status="failed",
+            elapsed_ms=outcome["elapsed_ms"],
+            step_id=step.step_id,
+            cite_id=record.cite_id,
+        )
+        call_label = f"{record.tool_type} | cite={record.cite_id or '-'}"
         self.logger.log_stage_progress(
-            "Tool", "complete", f"step={step.step_id}, executed={len(logs)}"
+            "Tool", "warning", f"step={step.step_id}, call={call_label}, error={error_msg}"
         )
-
-        return {"step_id": step.step_id, "executed": logs, "status": "completed"}
+        return {
+            "call_id": record.call_id,
+            "tool_type": record.tool_type,
+            "cite_id": record.cite_id,
+            "status": "failed",
+            "error": error_msg,
+        }
 
     async def _execute_single_call(
         self,
@@ -250,7 +319,10 @@ Rules:
             return answer, metadata
 
         if tool_type == "web_search":
-            result = web_search(query=query, output_dir=output_dir, verbose=verbose)
+            # Blocking client: run in a worker thread so other calls keep going
+            result = await asyncio.to_thread(
+                web_search, query=query, output_dir=output_dir, verbose=verbose
+            )
             answer = result.get("answer") or result.get("summary") or ""
             used_citation_ids = self._extract_answer_citations(answer)
             filtered_citations = self._select_web_citations(used_citation_ids, result)
@@ -364,7 +436,10 @@ Rules:
         )
 
         response = await self.call_llm(
-            user_prompt=user_prompt, system_prompt=system_prompt, verbose=False
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            verbose=False,
+            stage="summarize_tool_result",
         )
         return response.strip()
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+StepScheduler - Dependency-aware scheduler for solve-chain steps
+Starts each step as soon as the steps it depends on are finished and reports the critical path
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+from ..memory import SolveChainStep
+
+
+def resolve_dependencies(steps: list[SolveChainStep]) -> dict[str, list[str]]:
+    """
+    Resolve the dependencies of every step.
+
+    Steps without an explicit ``depends_on`` (plans from older versions)
+    depend on the previous step, so they keep running strictly in order.
+    Unknown IDs and references to later steps are ignored, which keeps the
+    graph acyclic.
+
+    Args:
+        steps: Steps in plan order
+
+    Returns:
+        dict: step_id -> IDs of the earlier steps it depends on
+    """
+    resolved: dict[str, list[str]] = {}
+    earlier: list[str] = []
+    for step in steps:
+        if step.depends_on is None:
+            deps = earlier[-1:]
+        else:
+            deps = [dep for dep in dict.fromkeys(step.depends_on) if dep in earlier]
+        resolved[step.step_id] = deps
+        earlier.append(step.step_id)
+    return resolved
+
+
+def transitive_dependencies(step_id: str, dependencies: dict[str, list[str]]) -> set[str]:
+    """Return every step that ``step_id`` depends on, directly or indirectly"""
+    seen: set[str] = set()
+    stack = list(dependencies.get(step_id, []))
+    while stack:
+        dep = stack.pop()
+        if dep not in seen:
+            seen.add(dep)
+            stack.extend(dependencies.get(dep, []))
+    return seen
+
+
+class StepScheduler:
+    """Runs independent solve-chain steps concurrently"""
+
+    def __init__(self, max_parallel: int = 3):
+        """
+        Args:
+            max_parallel: Maximum number of steps running at the same time
+        """
+        self.max_parallel = max(1, max_parallel)
+
+    async def run(
+        self,
+        steps: list[SolveChainStep],
+        runner: Callable[[SolveChainStep], Awaitable[Any]],
+    ) -> dict[str, Any]:
+        """
+        Run every step once its dependencies have finished.
+
+        Ready steps are started in plan order. If a step fails, the steps
+        still running are cancelled and the error is raised.
+
+        Args:
+            steps: Steps in plan order
+            runner: Coroutine function executing one step
+
+        Returns:
+            dict: Timing report
+                {
+                    'wall_seconds': float,
+                    'serial_seconds': float,
+                    'critical_path_seconds': float,
+                    'critical_path': List[str],
+                    'durations': Dict[str, float]
+                }
+        """
+        dependencies = resolve_dependencies(steps)
+        pending = list(steps)
+        done: set[str] = set()
+        running: dict[asyncio.Task, str] = {}
+        started: dict[str, float] = {}
+        durations: dict[str, float] = {}
+        run_start = time.monotonic()
+
+        try:
+            while pending or running:
+                for step in list(pending):
+                    if len(running) >= self.max_parallel:
+                        break
+                    if all(dep in done for dep in dependencies[step.step_id]):
+                        pending.remove(step)
+                        started[step.step_id] = time.monotonic()
+                        running[asyncio.ensure_future(runner(step))] = step.step_id
+
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    step_id = running.pop(task)
+                    task.result()
+                    durations[step_id] = time.monotonic() - started[step_id]
+                    done.add(step_id)
+        finally:
+            for task in running:
+                task.cancel()
+
+        # Longest chain of dependent steps, by measured duration
+        path_time: dict[str, float] = {}
+        path_prev: dict[str, str | None] = {}
+        for step in steps:
+            step_id = step.step_id
+            prev = max(dependencies[step_id], key=lambda dep: path_time[dep], default=None)
+            path_time[step_id] = durations[step_id] + (path_time[prev] if prev else 0.0)
+            path_prev[step_id] = prev
+
+        critical_path: list[str] = []
+        tail = max(path_time, key=path_time.get, default=None)
+        while tail:
+            critical_path.insert(0, tail)
+            tail = path_prev[tail]
+
+        return {
+            "wall_seconds": time.monotonic() - run_start,
+            "serial_seconds": sum(durations.values()),
+            "critical_path_seconds": path_time[critical_path[-1]] if critical_path else 0.0,
+            "critical_path": critical_path,
+            "durations": durations,
+        }
@@ -10,6 +10,8 @@ from datetime import datetime
 import json
 from typing import Any
 
+from src.services.llm.tokenizer import count_tokens, get_encoding
+
 # Try importing tiktoken (if available)
 try:
     import tiktoken
@@ -60,6 +62,8 @@ def get_tiktoken_encoding(model_name: str):
     """
     Get tiktoken encoder (for precise token counting)
 
+    Encodings are memoized per model by the shared token-counting service.
+
     Args:
         model_name: Model name
 
@@ -68,24 +72,16 @@ def get_tiktoken_encoding(model_name: str):
     """
     if not TIKTOKEN_AVAILABLE:
         return None
-
-    try:
-        # Try getting encoding based on model name
-        if "gpt-4" in model_name.lower() or "gpt-3.5" in model_name.lower():
-            return tiktoken.encoding_for_model(model_name)
-        if "gpt-4o" in model_name.lower():
-            return tiktoken.encoding_for_model("gpt-4o")
-        # Default to cl100k_base (encoding for GPT-3.5/GPT-4)
-        return tiktoken.get_encoding("cl100k_base")
-    except Exception:
-        # If fails, use default encoding
-        return tiktoken.get_encoding("cl100k_base")
+    return get_encoding(model_name)
 
 
 def count_tokens_with_tiktoken(text: str, model_name: str) -> int:
     """
     Precisely calculate token count using tiktoken
 
+    Uses the shared token counter, which caches counts of repeated texts
+    (e.g. the same system prompt on every call).
+
     Args:
         text: Text to calculate
         model_name: Model name (for selecting correct encoding)
@@ -96,11 +92,7 @@ def count_tokens_with_tiktoken(text: str, model_name: str) -> int:
     if not TIKTOKEN_AVAILABLE:
         return 0
 
-    encoding = get_tiktoken_encoding(model_name)
-    if encoding is None:
-        return 0
-
-    return len(encoding.encode(text))
+    return count_tokens(text, model_name)
 
 
 def count_tokens_with_litellm(messages: list[dict], model_name: str) -> dict[str, int]:
@@ -280,6 +272,7 @@ class TokenTracker:
         user_prompt: str | None = None,
         response_text: str | None = None,
         messages: list[dict] | None = None,
+        calculation_method: str | None = None,
     ):
         """
         Add token usage record (supports multiple calculation methods)
@@ -295,14 +288,14 @@ class TokenTracker:
             user_prompt: User prompt (for tiktoken calculation)
             response_text: Response text (for tiktoken calculation)
             messages: Message list (for litellm calculation)
+            calculation_method: How token_counts were obtained (default "api")
         """
-        calculation_method = "api"
+        calculation_method = calculation_method or "api"
 
         # If token_counts is provided (from API response), prioritize using it
         if token_counts:
             prompt_tokens = token_counts.get("prompt_tokens", prompt_tokens)
             completion_tokens = token_counts.get("completion_tokens", completion_tokens)
-            calculation_method = "api"
         # If no API data, try using tiktoken for precise calculation
         elif self.prefer_tiktoken and system_prompt and user_prompt:
             prompt_tokens = count_tokens_with_tiktoken(system_prompt + "\n" + user_prompt, model)
@@ -1,4 +1,6 @@
+import asyncio
 from contextlib import asynccontextmanager
+import os
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -119,6 +121,19 @@ def validate_tool_consistency():
         raise
 
 
+async def _warm_up_default_kb():
+    """Load the default KB's index so the first search does not pay for it."""
+    try:
+        from src.services.config import get_kb_config_service
+        from src.services.rag.service import RAGService
+
+        kb_name = get_kb_config_service().get_default_kb()
+        if kb_name and await RAGService().warm_up(kb_name):
+            logger.info(f"Warmed up default knowledge base '{kb_name}'")
+    except Exception as e:
+        logger.warning(f"Failed to warm up default knowledge base: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -142,10 +157,41 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize LLM client at startup: {e}")
 
+    # Preload the default knowledge base's index in the background
+    warmup_task = None
+    if os.getenv("RAG_WARMUP_ON_STARTUP", "true").lower() in ("true", "1", "yes"):
+        warmup_task = asyncio.create_task(_warm_up_default_kb())
+
     yield
+
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
     # Execute on shutdown
     logger.info("Application shutdown")
 
+    # Tear down warm RAG pipelines
+    try:
+        from src.services.rag.factory import invalidate_pipelines
+
+        invalidate_pipelines()
+    except Exception as e:
+        logger.warning(f"Failed to tear down RAG pipelines: {e}")
+
+    # Close pooled HTTP connections
+    try:
+        from src.services.embedding import close_embedding_client
+
+        await close_embedding_client()
+    except Exception as e:
+        logger.warning(f"Failed to close embedding HTTP client: {e}")
+
+    try:
+        from src.services.llm import close_llm_sessions
+
+        await close_llm_sessions()
+    except Exception as e:
+        logger.warning(f"Failed to close LLM HTTP sessions: {e}")
+
 
 app = FastAPI(
     title="DeepTutor API",
@@ -18,6 +18,7 @@ from src.agents.chat import ChatAgent, SessionManager
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm.config import get_llm_config
+from src.services.llm.scheduler import Priority, set_llm_context
 from src.services.settings.interface_settings import get_ui_language
 
 # Initialize logger
@@ -163,6 +164,9 @@ async def websocket_chat(websocket: WebSocket):
                     )
                     session_id = session["session_id"]
 
+                # Chat replies are waited on live: schedule ahead of batch work
+                set_llm_context(priority=Priority.INTERACTIVE, session_id=session_id)
+
                 # Send session ID to frontend
                 await websocket.send_json(
                     {
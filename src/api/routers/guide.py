@@ -22,6 +22,7 @@ from src.api.utils.task_id_manager import TaskIDManager
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm import get_llm_config
+from src.services.llm.scheduler import Priority, set_llm_context
 from src.services.settings.interface_settings import get_ui_language
 
 router = APIRouter()
@@ -259,6 +260,7 @@ async def websocket_guide(websocket: WebSocket, session_id: str):
     - get_session: Get session state
     """
     await websocket.accept()
+    set_llm_context(priority=Priority.INTERACTIVE, session_id=session_id)
 
     task_manager = TaskIDManager.get_instance()
     task_id = task_manager.generate_task_id("guide", session_id)
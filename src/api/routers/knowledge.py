@@ -39,6 +39,7 @@ sys.path.insert(0, str(_project_root))
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm import get_llm_config
+from src.services.llm.scheduler import Priority, set_llm_context
 
 # Initialize logger with config
 project_root = Path(__file__).parent.parent.parent.parent
@@ -102,6 +103,8 @@ async def run_initialization_task(initializer: KnowledgeBaseInitializer):
     """Background task for knowledge base initialization"""
     task_manager = TaskIDManager.get_instance()
     task_id = task_manager.generate_task_id("kb_init", initializer.kb_name)
+    # Indexing yields LLM capacity to interactive sessions
+    set_llm_context(priority=Priority.BACKGROUND, session_id=f"kb:{initializer.kb_name}")
 
     try:
         if not initializer.progress_tracker:
@@ -158,6 +161,7 @@ async def run_upload_processing_task(
     task_manager = TaskIDManager.get_instance()
     task_key = f"{kb_name}_upload_{len(uploaded_file_paths)}"
     task_id = task_manager.generate_task_id("kb_upload", task_key)
+    set_llm_context(priority=Priority.BACKGROUND, session_id=f"kb:{kb_name}")
 
     progress_tracker = ProgressTracker(kb_name, Path(base_dir))
     progress_tracker.task_id = task_id
@@ -304,9 +308,12 @@ async def update_kb_config(kb_name: str, config: dict):
     """Update configuration for a specific knowledge base."""
     try:
         from src.services.config import get_kb_config_service
+        from src.services.rag.factory import invalidate_pipelines
 
         service = get_kb_config_service()
         service.set_kb_config(kb_name, config)
+        # Rebuild warm pipelines with the new settings on next use
+        invalidate_pipelines()
         return {"status": "success", "kb_name": kb_name, "config": service.get_kb_config(kb_name)}
     except Exception as e:
         logger.error(f"Error updating config for KB '{kb_name}': {e}")
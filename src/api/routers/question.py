@@ -23,6 +23,7 @@ sys.path.insert(0, str(project_root))
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm.config import get_llm_config
+from src.services.llm.scheduler import Priority, set_llm_context
 from src.services.settings.interface_settings import get_ui_language
 
 # Setup module logger with unified logging system (from config)
@@ -351,6 +352,7 @@ async def websocket_question_generate(websocket: WebSocket):
         # Generate task ID
         task_key = f"question_{kb_name}_{hash(str(requirement))}"
         task_id = task_manager.generate_task_id("question_gen", task_key)
+        set_llm_context(priority=Priority.NORMAL, session_id=task_id)
 
         # Send task ID to frontend
         try:
@@ -15,6 +15,7 @@ from src.api.utils.task_id_manager import TaskIDManager
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm import get_llm_config
+from src.services.llm.scheduler import Priority, set_llm_context
 from src.services.settings.interface_settings import get_ui_language
 
 # Force stdout to use utf-8 to prevent encoding errors with emojis on Windows
@@ -110,6 +111,7 @@ async def websocket_research_run(websocket: WebSocket):
         # Generate task ID
         task_key = f"research_{kb_name}_{hash(str(topic))}"
         task_id = task_manager.generate_task_id("research", task_key)
+        set_llm_context(priority=Priority.NORMAL, session_id=task_id)
 
         # Send task ID to frontend
         await websocket.send_json({"type": "task_id", "task_id": task_id})
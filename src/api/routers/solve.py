@@ -23,6 +23,7 @@ sys.path.insert(0, str(_project_root))
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm import get_llm_config
+from src.services.llm.scheduler import Priority, set_llm_context
 from src.services.settings.interface_settings import get_ui_language
 
 # Initialize logger with config
@@ -173,6 +174,8 @@ async def websocket_solve(websocket: WebSocket):
             )
             session_id = session["session_id"]
 
+        set_llm_context(priority=Priority.NORMAL, session_id=session_id)
+
         # Send session ID to frontend
         await websocket.send_json({"type": "session", "session_id": session_id})
 
@@ -9,9 +9,25 @@ import time
 from fastapi import APIRouter
 from pydantic import BaseModel
 
-from src.services.embedding import get_embedding_client, get_embedding_config
+from src.services.embedding import (
+    get_embedding_cache,
+    get_embedding_client,
+    get_embedding_config,
+)
 from src.services.llm import complete as llm_complete
-from src.services.llm import get_llm_config, get_token_limit_kwargs
+from src.services.llm import (
+    get_llm_config,
+    get_llm_hedger,
+    get_llm_scheduler,
+    get_model_router,
+    get_response_cache,
+    get_token_limit_kwargs,
+    llm_session_stats,
+    stream_stats,
+    token_counter_stats,
+)
+from src.services.rag.factory import pipeline_stats
+from src.services.rag.utils.index_cache import get_index_cache, get_llamaindex_cache
 from src.services.tts import get_tts_config
 
 router = APIRouter()
@@ -82,6 +98,31 @@ async def get_system_status():
     return result
 
 
+@router.get("/metrics")
+async def get_system_metrics():
+    """
+    Get in-process performance counters
+
+    Returns:
+        Dictionary of cache and pool statistics keyed by subsystem
+    """
+    embedding_cache = get_embedding_cache()
+    response_cache = get_response_cache()
+    return {
+        "rag_index_cache": get_index_cache().stats(),
+        "rag_pipelines": pipeline_stats(),
+        "llamaindex_index_cache": get_llamaindex_cache().stats(),
+        "embedding_cache": embedding_cache.stats() if embedding_cache else None,
+        "llm_http_sessions": llm_session_stats(),
+        "llm_response_cache": response_cache.stats() if response_cache else None,
+        "llm_scheduler": get_llm_scheduler().stats(),
+        "llm_streams": stream_stats(),
+        "llm_token_counter": token_counter_stats(),
+        "llm_model_routing": get_model_router().stats(),
+        "llm_hedging": get_llm_hedger().stats(),
+    }
+
+
 @router.post("/test/llm", response_model=TestResponse)
 async def test_llm_connection():
     """
@@ -10,6 +10,7 @@ Supports multiple RAG providers with lazy loading:
 - lightrag: Knowledge graph (LightRAG.ainsert, text-only)
 - raganything: Multimodal with MinerU parser
 - raganything_docling: Multimodal with Docling parser
+- vector_store (component VectorIndexer): append-only, new chunks added in place
 """
 
 import argparse
@@ -80,7 +81,7 @@ class DocumentAdder:
             if not llamaindex_storage.exists():
                 raise ValueError(f"Knowledge base not initialized (llamaindex): {kb_name}")
         else:
-            if not self.rag_storage_dir.exists():
+            if not self.rag_storage_dir.exists() and not self._uses_vector_store():
                 raise ValueError(f"Knowledge base not initialized: {kb_name}")
 
         self.api_key = api_key
@@ -128,6 +129,17 @@ class DocumentAdder:
         # Default to raganything for backward compatibility
         return "raganything"
 
+    def _uses_vector_store(self) -> bool:
+        """
+        Whether the KB was built by a component pipeline with VectorIndexer
+        (vector_store/ only, no LightRAG or LlamaIndex storage).
+        """
+        return (
+            (self.kb_dir / "vector_store" / "info.json").exists()
+            and not self.rag_storage_dir.exists()
+            and not (self.kb_dir / "llamaindex_storage").exists()
+        )
+
     def _ensure_working_directories(self):
         for directory in [self.raw_dir, self.images_dir, self.content_list_dir]:
             directory.mkdir(parents=True, exist_ok=True)
@@ -227,6 +239,10 @@ class DocumentAdder:
         provider = self._resolved_provider
         logger.info(f"Processing {len(new_files)} files with provider: {provider}")
 
+        # Vector-store KBs are appended in place regardless of the recorded provider
+        if self._uses_vector_store():
+            return await self._process_vector_store(new_files)
+
         # Dispatch to provider-specific implementation
         if provider == "llamaindex":
             return await self._process_llamaindex(new_files)
@@ -291,6 +307,67 @@ class DocumentAdder:
 
         return processed_files
 
+    async def _process_vector_store(self, new_files: List[Path]) -> List[Path]:
+        """
+        Incremental add for KBs indexed by the component VectorIndexer.
+
+        Only the new files are chunked and embedded; their vectors and chunk
+        records are appended to the existing store instead of rebuilding it.
+        Re-added files replace their previous chunks.
+        """
+        logger.info("Using vector store incremental append...")
+
+        from src.services.rag.components.chunkers import SemanticChunker
+        from src.services.rag.components.embedders import OpenAIEmbedder
+        from src.services.rag.components.indexers import VectorIndexer
+        from src.services.rag.types import Document
+
+        # Pre-import progress stage if needed
+        ProgressStage: Any = None
+        if self.progress_tracker:
+            from src.knowledge.progress_tracker import ProgressStage
+
+        chunker = SemanticChunker()
+        embedder = OpenAIEmbedder()
+        indexer = VectorIndexer(kb_base_dir=str(self.base_dir))
+
+        processed_files = []
+        total_files = len(new_files)
+
+        for idx, doc_file in enumerate(new_files, 1):
+            try:
+                if self.progress_tracker and ProgressStage:
+                    self.progress_tracker.update(
+                        ProgressStage.PROCESSING_FILE,
+                        f"Indexing (vector store) {doc_file.name}",
+                        current=idx,
+                        total=total_files,
+                    )
+
+                text = await self._extract_text_basic(doc_file)
+                if not text.strip():
+                    logger.warning(f"  ⚠ No text extracted: {doc_file.name}")
+                    continue
+
+                doc = Document(
+                    content=text,
+                    file_path=str(doc_file),
+                    metadata={"filename": doc_file.name},
+                )
+                doc.chunks.extend(await chunker.process(doc))
+                await embedder.process(doc)
+
+                if await indexer.process(self.kb_name, [doc], append=True):
+                    processed_files.append(doc_file)
+                    self._record_successful_hash(doc_file)
+                    logger.info(f"  ✓ Appended to vector store: {doc_file.name}")
+                else:
+                    logger.error(f"  ✗ Failed to index: {doc_file.name}")
+            except Exception as e:
+                logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
+
+        return processed_files
+
     async def _process_lightrag(self, new_files: List[Path]) -> List[Path]:
         """
         Incremental add for LightRAG pipeline (text-only).
@@ -9,7 +9,6 @@ Use LLM to identify these contents and store the mapping between numbers and ori
 
 import argparse
 import asyncio
-import inspect
 import json
 import os
 from pathlib import Path
@@ -20,6 +19,7 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from dotenv import load_dotenv
 
+from src.services.llm import complete as llm_complete
 from src.services.llm import get_llm_client, get_llm_config
 
 load_dotenv(dotenv_path=".env", override=False)
@@ -61,26 +61,27 @@ async def _call_llm_async(
     temperature: float = 0.1,
     model: str = None,
 ) -> str:
-    """Asynchronously call LLM using unified LLM service"""
-    # Get unified LLM client (handles all provider differences and env var setup)
-    llm_client = get_llm_client()
-    llm_model_func = llm_client.get_model_func()
+    """Asynchronously call LLM using unified LLM service
 
-    # If model not specified, use configured model
-    if model is None:
-        model = llm_client.config.model
+    Responses are cached (see src.services.llm.response_cache), so re-running
+    extraction over unchanged content does not call the LLM again.
+    """
+    # Get unified LLM client (handles all provider differences and env var setup)
+    llm_cfg = get_llm_client().config
 
-    result = llm_model_func(
+    return await llm_complete(
         prompt,
         system_prompt=system_prompt,
+        model=model or llm_cfg.model,
+        api_key=llm_cfg.api_key,
+        base_url=llm_cfg.base_url,
+        api_version=getattr(llm_cfg, "api_version", None),
+        binding=getattr(llm_cfg, "binding", None),
         max_tokens=max_tokens,
         temperature=temperature,
+        cache=True,
     )
 
-    if inspect.isawaitable(result):
-        return await result
-    return str(result)
-
 
 def _extract_json_block(text: str) -> str:
     """Extract JSON block from text"""
@@ -488,6 +488,16 @@ class KnowledgeBaseManager:
         # Delete the directory
         shutil.rmtree(kb_dir)
 
+        # Drop warm RAG pipelines that may hold instances bound to this KB
+        try:
+            from src.services.rag.factory import invalidate_pipelines
+            from src.services.rag.utils.index_cache import get_index_cache
+
+            invalidate_pipelines(kb_base_dir=str(self.base_dir))
+            get_index_cache().invalidate(kb_dir / "vector_store")
+        except Exception as e:
+            print(f"Warning: Failed to invalidate RAG caches: {e}")
+
         # Remove from config
         if name in self.config.get("knowledge_bases", {}):
             del self.config["knowledge_bases"][name]
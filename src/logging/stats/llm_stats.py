@@ -52,9 +52,12 @@ def get_pricing(model: str) -> dict[str, float]:
     return MODEL_PRICING.get("gpt-4o-mini", {"input": 0.00015, "output": 0.0006})
 
 
-def estimate_tokens(text: str) -> int:
-    """Rough estimate of tokens (1.3 tokens per word)."""
-    return int(len(text.split()) * 1.3)
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Count tokens with the shared token counter (tiktoken, or ~4 chars per token)."""
+    # Import here to avoid circular imports
+    from src.services.llm.tokenizer import count_tokens
+
+    return count_tokens(text, model)
 
 
 @dataclass
@@ -65,6 +68,9 @@ class LLMCall:
     prompt_tokens: int
     completion_tokens: int
     cost: float
+    cached: bool = False
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
@@ -87,6 +93,9 @@ class LLMStats:
         self.total_completion_tokens = 0
         self.total_cost = 0.0
         self.model_used: Optional[str] = None
+        self.cache_hits = 0
+        self.total_cache_read_tokens = 0
+        self.total_cache_write_tokens = 0
 
     def add_call(
         self,
@@ -97,6 +106,9 @@ class LLMStats:
         system_prompt: Optional[str] = None,
         user_prompt: Optional[str] = None,
         response: Optional[str] = None,
+        cached: bool = False,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ):
         """
         Add an LLM call to the stats.
@@ -108,14 +120,27 @@ class LLMStats:
             system_prompt: System prompt text (for estimation)
             user_prompt: User prompt text (for estimation)
             response: Response text (for estimation)
+            cached: True if the response came from the LLM response cache
+                (counted as a call, but no tokens or cost)
+            cache_read_tokens: Prompt tokens read from the provider's prompt cache
+            cache_write_tokens: Prompt tokens written to the provider's prompt cache
         """
+        if cached:
+            self.calls.append(
+                LLMCall(model=model, prompt_tokens=0, completion_tokens=0, cost=0.0, cached=True)
+            )
+            self.cache_hits += 1
+            if self.model_used is None:
+                self.model_used = model
+            return
+
         # Estimate tokens if not provided
         if prompt_tokens is None and (system_prompt or user_prompt):
             prompt_text = (system_prompt or "") + "\n" + (user_prompt or "")
-            prompt_tokens = estimate_tokens(prompt_text)
+            prompt_tokens = estimate_tokens(prompt_text, model)
 
         if completion_tokens is None and response:
-            completion_tokens = estimate_tokens(response)
+            completion_tokens = estimate_tokens(response, model)
 
         prompt_tokens = prompt_tokens or 0
         completion_tokens = completion_tokens or 0
@@ -128,7 +153,12 @@ class LLMStats:
 
         # Record call
         call = LLMCall(
-            model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cost=cost
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost=cost,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
         self.calls.append(call)
 
@@ -136,6 +166,8 @@ class LLMStats:
         self.total_prompt_tokens += prompt_tokens
         self.total_completion_tokens += completion_tokens
         self.total_cost += cost
+        self.total_cache_read_tokens += cache_read_tokens
+        self.total_cache_write_tokens += cache_write_tokens
 
         # Track primary model
         if self.model_used is None:
@@ -151,6 +183,10 @@ class LLMStats:
             "completion_tokens": self.total_completion_tokens,
             "total_tokens": self.total_prompt_tokens + self.total_completion_tokens,
             "cost_usd": self.total_cost,
+            "cache_hits": self.cache_hits,
+            "cache_hit_rate": self.cache_hits / len(self.calls) if self.calls else 0.0,
+            "cache_read_tokens": self.total_cache_read_tokens,
+            "cache_write_tokens": self.total_cache_write_tokens,
         }
 
     def log_summary(self, logger: Optional["Logger"] = None):
@@ -180,6 +216,20 @@ class LLMStats:
             f"Tokens      : {total_tokens:,} (Input: {self.total_prompt_tokens:,}, Output: {self.total_completion_tokens:,})"
         )
         logger.info(f"Cost        : ${self.total_cost:.6f} USD")
+        if self.cache_hits:
+            logger.info(
+                f"Cache Hits  : {self.cache_hits} ({self.cache_hits / len(self.calls):.0%} of calls)"
+            )
+        if self.total_cache_read_tokens or self.total_cache_write_tokens:
+            read_share = (
+                self.total_cache_read_tokens / self.total_prompt_tokens
+                if self.total_prompt_tokens
+                else 0.0
+            )
+            logger.info(
+                f"Prompt Cache: {self.total_cache_read_tokens:,} read ({read_share:.0%} of input), "
+                f"{self.total_cache_write_tokens:,} written"
+            )
         logger.info("=" * 60)
 
     def print_summary(self):
@@ -197,3 +247,6 @@ class LLMStats:
         self.total_completion_tokens = 0
         self.total_cost = 0.0
         self.model_used = None
+        self.cache_hits = 0
+        self.total_cache_read_tokens = 0
+        self.total_cache_write_tokens = 0
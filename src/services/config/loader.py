@@ -250,11 +250,37 @@ def get_agent_params(module_name: str) -> dict:
     return defaults
 
 
+def get_model_routing_config() -> dict:
+    """
+    Get the stage-to-model-tier routing table from config/agents.yaml.
+
+    Returns:
+        dict: The ``model_routing`` section, containing:
+            - tiers: tier name -> {model, binding, base_url, api_key_env}
+            - stages: stage label (or "module.stage") -> tier name
+        Empty sections if not configured.
+    """
+    routing = {"tiers": {}, "stages": {}}
+    try:
+        config_path = PROJECT_ROOT / "config" / "agents.yaml"
+        if config_path.exists():
+            with open(config_path, encoding="utf-8") as f:
+                agents_config = yaml.safe_load(f) or {}
+            section = agents_config.get("model_routing") or {}
+            routing["tiers"] = section.get("tiers") or {}
+            routing["stages"] = section.get("stages") or {}
+    except Exception as e:
+        print(f"⚠️ Failed to load model_routing from agents.yaml: {e}, routing disabled")
+
+    return routing
+
+
 __all__ = [
     "PROJECT_ROOT",
     "load_config_with_main",
     "get_path_from_config",
     "parse_language",
     "get_agent_params",
+    "get_model_routing_config",
     "_deep_merge",
 ]
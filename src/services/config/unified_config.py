@@ -505,6 +505,8 @@ class UnifiedConfigManager:
                 cfg["is_default"] = False  # Ensure it's not marked as default
                 data["configs"][i] = cfg
                 self._save_configs(config_type, data)
+                if data.get("active_id") == config_id:
+                    self._invalidate_rag_caches(config_type)
                 return cfg
 
         return None
@@ -520,9 +522,12 @@ class UnifiedConfigManager:
 
         if len(data["configs"]) < original_len:
             # If deleted config was active, switch to default
-            if data.get("active_id") == config_id:
+            was_active = data.get("active_id") == config_id
+            if was_active:
                 data["active_id"] = "default"
             self._save_configs(config_type, data)
+            if was_active:
+                self._invalidate_rag_caches(config_type)
             return True
 
         return False
@@ -544,8 +549,27 @@ class UnifiedConfigManager:
         if success and config_type == ConfigType.LLM:
             self._update_openai_env_vars_for_lightrag()
 
+        if success:
+            self._invalidate_rag_caches(config_type)
+
         return success
 
+    def _invalidate_rag_caches(self, config_type: ConfigType) -> None:
+        """
+        Drop warm RAG pipelines and loaded LlamaIndex indexes, which captured
+        the previous LLM/embedding functions, after the effective config changed.
+        """
+        if config_type not in (ConfigType.LLM, ConfigType.EMBEDDING):
+            return
+        try:
+            from src.services.rag.factory import invalidate_pipelines
+            from src.services.rag.utils.index_cache import get_llamaindex_cache
+
+            invalidate_pipelines()
+            get_llamaindex_cache().invalidate()
+        except ImportError:
+            pass
+
     def _update_openai_env_vars_for_lightrag(self):
         """
         Update OPENAI_API_KEY and OPENAI_BASE_URL environment variables for LightRAG.
@@ -5,11 +5,30 @@ Base Embedding Adapter
 
 Abstract base class for all embedding adapters.
 Defines the contract that all embedding providers must implement.
+
+Adapters share one long-lived ``httpx.AsyncClient`` per event loop (see
+``BaseEmbeddingAdapter.get_http_client``), so repeated embedding calls reuse
+pooled keep-alive connections instead of paying a TCP/TLS handshake each time.
+Pool limits come from the adapter config or these environment variables:
+
+- ``EMBEDDING_HTTP_MAX_CONNECTIONS`` (default 20)
+- ``EMBEDDING_HTTP_MAX_KEEPALIVE`` (default 10)
+- ``EMBEDDING_HTTP_KEEPALIVE_EXPIRY`` seconds (default 30)
+- ``EMBEDDING_HTTP2`` ("true" to enable HTTP/2; requires the ``h2`` package)
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 from dataclasses import dataclass
+import logging
+import os
+import threading
 from typing import Any, Dict, List, Optional
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -72,6 +91,10 @@ class BaseEmbeddingAdapter(ABC):
                 - model: Model name to use
                 - dimensions: Embedding vector dimensions
                 - request_timeout: Request timeout in seconds
+                - http_max_connections: Connection pool size (optional)
+                - http_max_keepalive: Idle keep-alive connections kept (optional)
+                - http_keepalive_expiry: Idle connection lifetime in seconds (optional)
+                - http2: Enable HTTP/2 (optional)
         """
         self.api_key = config.get("api_key")
         self.base_url = config.get("base_url")
@@ -80,6 +103,61 @@ class BaseEmbeddingAdapter(ABC):
         self.dimensions = config.get("dimensions")
         self.request_timeout = config.get("request_timeout", 30)
 
+        self.http_limits = httpx.Limits(
+            max_connections=int(
+                config.get("http_max_connections")
+                or os.getenv("EMBEDDING_HTTP_MAX_CONNECTIONS", 20)
+            ),
+            max_keepalive_connections=int(
+                config.get("http_max_keepalive") or os.getenv("EMBEDDING_HTTP_MAX_KEEPALIVE", 10)
+            ),
+            keepalive_expiry=float(
+                config.get("http_keepalive_expiry")
+                or os.getenv("EMBEDDING_HTTP_KEEPALIVE_EXPIRY", 30)
+            ),
+        )
+        http2 = config.get("http2")
+        if http2 is None:
+            http2 = os.getenv("EMBEDDING_HTTP2", "false").lower() in ("true", "1", "yes")
+        self.http2 = bool(http2)
+
+        # One client per event loop: pooled connections cannot cross loops
+        # (embed_sync runs requests on a private loop)
+        self._http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._http_lock = threading.Lock()
+
+    def get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client for the running event loop.
+
+        Returns:
+            Long-lived httpx.AsyncClient with keep-alive connection pooling
+        """
+        loop = asyncio.get_running_loop()
+        with self._http_lock:
+            client = self._http_clients.get(loop)
+            if client is None or client.is_closed:
+                http2 = self.http2
+                if http2:
+                    try:
+                        import h2  # noqa: F401
+                    except ImportError:
+                        logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+                        http2 = False
+                client = httpx.AsyncClient(
+                    timeout=self.request_timeout, limits=self.http_limits, http2=http2
+                )
+                self._http_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._http_lock:
+            client = self._http_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
     @abstractmethod
     async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
         """
@@ -4,8 +4,6 @@
 import logging
 from typing import Any, Dict
 
-import httpx
-
 from .base import BaseEmbeddingAdapter, EmbeddingRequest, EmbeddingResponse
 
 logger = logging.getLogger(__name__)
@@ -83,14 +81,14 @@ class CohereEmbeddingAdapter(BaseEmbeddingAdapter):
 
         logger.debug(f"Sending embedding request to {url} with {len(request.texts)} texts")
 
-        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        client = self.get_http_client()
+        response = await client.post(url, json=payload, headers=headers)
 
-            if response.status_code >= 400:
-                logger.error(f"HTTP {response.status_code} response body: {response.text}")
+        if response.status_code >= 400:
+            logger.error(f"HTTP {response.status_code} response body: {response.text}")
 
-            response.raise_for_status()
-            data = response.json()
+        response.raise_for_status()
+        data = response.json()
 
         if api_version == "v1":
             embeddings = data["embeddings"]
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Embedding Cache
+===============
+
+Content-addressed cache for embedding vectors, so re-indexing a knowledge
+base or repeating a query does not pay the provider again.
+
+- Entries are keyed by (binding, endpoint, model, dimensions, input_type,
+  sha256(text)), so OpenAI-compatible servers sharing a binding and a model
+  name do not read each other's vectors
+- Tier 1 is an in-memory LRU of recently used vectors
+- Tier 2 is a SQLite database under ``data/cache/`` holding float32 blobs,
+  which survives restarts
+- Lookups are per text, so a batch with partial hits only sends the misses
+  upstream
+
+Configuration (environment):
+    EMBEDDING_CACHE_ENABLED     Enable the cache (default: true)
+    EMBEDDING_CACHE_PATH        SQLite file (default: data/cache/embeddings.sqlite)
+    EMBEDDING_CACHE_MAX_ITEMS   In-memory LRU capacity (default: 10000)
+"""
+
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "data" / "cache" / "embeddings.sqlite"
+DEFAULT_MAX_ITEMS = 10000
+
+
+def make_cache_key(
+    text: str,
+    binding: str,
+    model: str,
+    dimensions: Optional[int] = None,
+    input_type: Optional[str] = None,
+    base_url: Optional[str] = None,
+) -> str:
+    """
+    Build the content-addressed key of one text.
+
+    Args:
+        text: Input text
+        binding: Provider binding (e.g. "openai")
+        model: Embedding model name
+        dimensions: Requested vector dimensions
+        input_type: Task type for task-aware models
+        base_url: Endpoint the embeddings are requested from
+
+    Returns:
+        Hex digest identifying the (model settings, text) pair
+    """
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    endpoint = _normalize_endpoint(base_url)
+    namespace = f"{binding}|{endpoint}|{model}|{dimensions or ''}|{input_type or ''}|{text_hash}"
+    return hashlib.sha256(namespace.encode("utf-8")).hexdigest()
+
+
+def _normalize_endpoint(base_url: Optional[str]) -> str:
+    """Case-fold scheme and host and drop trailing slashes, so equivalent URLs share keys"""
+    if not base_url:
+        return ""
+    parsed = urlparse(base_url.strip())
+    if not parsed.netloc:
+        return base_url.strip().rstrip("/").lower()
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+
+
+class EmbeddingCache:
+    """
+    Two-tier (memory LRU + SQLite) embedding vector cache.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_items: int = DEFAULT_MAX_ITEMS):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file. None keeps the cache in memory only.
+            max_items: Capacity of the in-memory LRU tier
+        """
+        self.path = Path(path) if path is not None else None
+        self.max_items = max_items
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        if self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache disabled on disk ({self.path}): {e}")
+                self._conn = None
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up vectors, memory first and then disk.
+
+        Args:
+            keys: Cache keys from make_cache_key()
+
+        Returns:
+            Vectors aligned with keys, None for misses
+        """
+        results: List[Optional[List[float]]] = [None] * len(keys)
+        pending: Dict[str, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+                    self.memory_hits += 1
+                else:
+                    pending.setdefault(key, []).append(i)
+
+            if pending and self._conn is not None:
+                found = self._read(list(pending))
+                for key, vector in found.items():
+                    self._remember(key, vector)
+                    for i in pending.pop(key):
+                        results[i] = vector
+                        self.disk_hits += 1
+
+            self.misses += sum(len(positions) for positions in pending.values())
+        return results
+
+    def put_many(self, keys: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """
+        Store vectors in both tiers.
+
+        Args:
+            keys: Cache keys from make_cache_key()
+            vectors: Embedding vectors aligned with keys
+        """
+        rows = []
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                vector = list(vector)
+                self._remember(key, vector)
+                rows.append((key, np.asarray(vector, dtype=np.float32).tobytes()))
+            self.writes += len(rows)
+
+            if rows and self._conn is not None:
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist embeddings to cache: {e}")
+
+    def clear(self) -> None:
+        """Drop every cached vector from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters and current occupancy."""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "path": str(self.path) if self._conn is not None else None,
+                "memory_entries": len(self._memory),
+                "max_items": self.max_items,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def _read(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        try:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                for key, blob in cursor:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read embedding cache: {e}")
+        return found
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+
+# Singleton instance
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get or create the process-wide embedding cache.
+
+    Returns:
+        EmbeddingCache instance, or None if EMBEDDING_CACHE_ENABLED is off
+    """
+    global _cache
+    if os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() not in ("true", "1", "yes"):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = os.getenv("EMBEDDING_CACHE_PATH") or DEFAULT_CACHE_PATH
+                max_items = int(os.getenv("EMBEDDING_CACHE_MAX_ITEMS", DEFAULT_MAX_ITEMS))
+                _cache = EmbeddingCache(path=Path(path), max_items=max_items)
+    return _cache
+
+
+def reset_embedding_cache():
+    """Close and reset the singleton embedding cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
@@ -4,14 +4,17 @@ Embedding Client
 ================
 
 Unified embedding client for all DeepTutor services.
-Now supports multiple providers through adapters.
+Now supports multiple providers through adapters, with a content-addressed
+cache in front of them.
 """
 
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional
 
 from src.logging import get_logger
 
 from .adapters.base import EmbeddingRequest
+from .cache import get_embedding_cache, make_cache_key
 from .config import EmbeddingConfig, get_embedding_config
 from .provider import EmbeddingProviderManager, get_embedding_provider_manager
 
@@ -62,12 +65,52 @@ class EmbeddingClient:
         """
         Get embeddings for texts using the configured adapter.
 
+        Texts already in the embedding cache are served from it; only the
+        remaining (deduplicated) texts are sent to the provider.
+
         Args:
             texts: List of texts to embed
 
         Returns:
             List of embedding vectors
         """
+        cache = get_embedding_cache()
+        if cache is None or not texts:
+            return await self._embed_uncached(texts)
+
+        keys = [
+            make_cache_key(
+                text,
+                binding=self.config.binding,
+                model=self.config.model,
+                dimensions=self.config.dim,
+                input_type=self.config.input_type,
+                base_url=self.config.base_url,
+            )
+            for text in texts
+        ]
+        embeddings = await asyncio.to_thread(cache.get_many, keys)
+
+        # One upstream slot per distinct missing text
+        missing: Dict[str, str] = {}
+        for key, text, vector in zip(keys, texts, embeddings):
+            if vector is None:
+                missing.setdefault(key, text)
+
+        if missing:
+            fresh = await self._embed_uncached(list(missing.values()))
+            await asyncio.to_thread(cache.put_many, list(missing), fresh)
+            by_key = dict(zip(missing, fresh))
+            embeddings = [
+                vector if vector is not None else by_key[key]
+                for key, vector in zip(keys, embeddings)
+            ]
+
+        self.logger.debug(f"Embedding cache served {len(texts) - len(missing)}/{len(texts)} texts")
+        return embeddings
+
+    async def _embed_uncached(self, texts: List[str]) -> List[List[float]]:
+        """Send texts to the configured adapter."""
         adapter = self.manager.get_active_adapter()
 
         request = EmbeddingRequest(
@@ -95,8 +138,6 @@ class EmbeddingClient:
 
         Use this when you need to call from non-async context.
         """
-        import asyncio
-
         try:
             loop = asyncio.get_event_loop()
             if loop.is_running():
@@ -158,3 +199,10 @@ def reset_embedding_client():
     """Reset the singleton embedding client."""
     global _client
     _client = None
+
+
+async def close_embedding_client():
+    """Close the pooled HTTP connections of the active embedding adapter."""
+    adapter = get_embedding_provider_manager().adapter
+    if adapter is not None:
+        await adapter.aclose()
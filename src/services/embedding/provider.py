@@ -7,6 +7,7 @@ Factory and manager for embedding adapters.
 Provides centralized configuration and adapter selection.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, Optional, Type
 
@@ -77,9 +78,21 @@ class EmbeddingProviderManager:
         Args:
             adapter: Adapter instance to set as active
         """
-        self.adapter = adapter
+        previous, self.adapter = self.adapter, adapter
+        if previous is not None and previous is not adapter:
+            self._close_soon(previous)
         logger.debug(f"Active embedding adapter set to: {adapter.__class__.__name__}")
 
+    @staticmethod
+    def _close_soon(adapter: BaseEmbeddingAdapter) -> None:
+        """Close a replaced adapter's pooled connections if a loop is running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop: the client is released when the adapter is collected
+            return
+        loop.create_task(adapter.aclose())
+
     def get_active_adapter(self) -> BaseEmbeddingAdapter:
         """
         Get the currently active adapter.
@@ -58,6 +58,7 @@ from .capabilities import (
     has_thinking_tags,
     requires_api_version,
     supports_response_format,
+    supports_stream_usage,
     supports_streaming,
     supports_tools,
     system_in_messages,
@@ -77,6 +78,7 @@ from .exceptions import (
     LLMModelNotFoundError,
     LLMProviderError,
     LLMRateLimitError,
+    LLMStreamInterruptedError,
     LLMTimeoutError,
 )
 from .factory import (
@@ -90,6 +92,33 @@ from .factory import (
     get_provider_presets,
     stream,
 )
+from .hedging import LLMHedger, get_llm_hedger, reset_llm_hedger
+from .http_session import close_llm_sessions, llm_session_stats
+from .prompt_cache import prompt_cache_enabled, system_first
+from .response_cache import (
+    LLMResponseCache,
+    get_response_cache,
+    reset_response_cache,
+    set_response_cache,
+    was_cache_hit,
+)
+from .router import ModelRoute, ModelRouter, get_model_router, reset_model_router
+from .scheduler import (
+    LLMScheduler,
+    Priority,
+    get_llm_scheduler,
+    reset_llm_scheduler,
+    set_llm_context,
+)
+from .telemetry import reset_stream_stats, stream_stats
+from .tokenizer import (
+    TokenCounter,
+    count_tokens,
+    get_token_counter,
+    reset_token_counters,
+    token_counter_stats,
+)
+from .usage import LLMUsage, estimate_usage, get_last_usage
 from .utils import (
     build_auth_headers,
     build_chat_url,
@@ -116,6 +145,7 @@ __all__ = [
     "get_capability",
     "supports_response_format",
     "supports_streaming",
+    "supports_stream_usage",
     "system_in_messages",
     "has_thinking_tags",
     "supports_tools",
@@ -129,6 +159,7 @@ __all__ = [
     "LLMRateLimitError",
     "LLMAuthenticationError",
     "LLMModelNotFoundError",
+    "LLMStreamInterruptedError",
     # Factory (main API)
     "complete",
     "stream",
@@ -140,6 +171,46 @@ __all__ = [
     "DEFAULT_MAX_RETRIES",
     "DEFAULT_RETRY_DELAY",
     "DEFAULT_EXPONENTIAL_BACKOFF",
+    # Prompt caching
+    "prompt_cache_enabled",
+    "system_first",
+    # Response cache
+    "LLMResponseCache",
+    "get_response_cache",
+    "set_response_cache",
+    "reset_response_cache",
+    "was_cache_hit",
+    # Model routing
+    "ModelRoute",
+    "ModelRouter",
+    "get_model_router",
+    "reset_model_router",
+    # Scheduler
+    "LLMScheduler",
+    "Priority",
+    "get_llm_scheduler",
+    "reset_llm_scheduler",
+    "set_llm_context",
+    # Hedged requests
+    "LLMHedger",
+    "get_llm_hedger",
+    "reset_llm_hedger",
+    # HTTP session pool
+    "close_llm_sessions",
+    "llm_session_stats",
+    # Token counting
+    "TokenCounter",
+    "count_tokens",
+    "get_token_counter",
+    "token_counter_stats",
+    "reset_token_counters",
+    # Token usage
+    "LLMUsage",
+    "get_last_usage",
+    "estimate_usage",
+    # Stream telemetry
+    "stream_stats",
+    "reset_stream_stats",
     # Providers (lazy loaded)
     "cloud_provider",
     "local_provider",
@@ -27,6 +27,8 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
     "openai": {
         "supports_response_format": True,
         "supports_streaming": True,
+        "supports_stream_usage": True,  # stream_options.include_usage
+        "supports_prompt_cache_key": True,  # prefix-cache routing hint (OpenAI/Azure hosts only)
         "supports_tools": True,
         "system_in_messages": True,  # System prompt goes in messages array
         "newer_models_use_max_completion_tokens": True,
@@ -34,6 +36,7 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
     "azure_openai": {
         "supports_response_format": True,
         "supports_streaming": True,
+        "supports_stream_usage": True,
         "supports_tools": True,
         "system_in_messages": True,
         "newer_models_use_max_completion_tokens": True,
@@ -58,6 +61,7 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
     "deepseek": {
         "supports_response_format": False,  # DeepSeek doesn't support strict JSON schema yet
         "supports_streaming": True,
+        "supports_stream_usage": True,
         "supports_tools": True,
         "system_in_messages": True,
         "has_thinking_tags": True,  # DeepSeek reasoner has thinking tags
@@ -66,6 +70,7 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
     "openrouter": {
         "supports_response_format": True,  # Depends on underlying model
         "supports_streaming": True,
+        "supports_stream_usage": True,
         "supports_tools": True,
         "system_in_messages": True,
     },
@@ -73,6 +78,7 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
     "groq": {
         "supports_response_format": True,
         "supports_streaming": True,
+        "supports_stream_usage": True,
         "supports_tools": True,
         "system_in_messages": True,
     },
@@ -80,12 +86,14 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
     "together": {
         "supports_response_format": True,
         "supports_streaming": True,
+        "supports_stream_usage": True,
         "supports_tools": True,
         "system_in_messages": True,
     },
     "together_ai": {  # Alias
         "supports_response_format": True,
         "supports_streaming": True,
+        "supports_stream_usage": True,
         "supports_tools": True,
         "system_in_messages": True,
     },
@@ -112,6 +120,7 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
     "vllm": {
         "supports_response_format": True,
         "supports_streaming": True,
+        "supports_stream_usage": True,
         "supports_tools": False,
         "system_in_messages": True,
     },
@@ -127,6 +136,8 @@ PROVIDER_CAPABILITIES: dict[str, dict[str, Any]] = {
 DEFAULT_CAPABILITIES: dict[str, Any] = {
     "supports_response_format": True,
     "supports_streaming": True,
+    "supports_stream_usage": False,
+    "supports_prompt_cache_key": False,
     "supports_tools": False,
     "system_in_messages": True,
     "has_thinking_tags": False,
@@ -255,6 +266,21 @@ def supports_streaming(binding: str, model: Optional[str] = None) -> bool:
     return get_capability(binding, "supports_streaming", model, default=True)
 
 
+def supports_stream_usage(binding: str, model: Optional[str] = None) -> bool:
+    """
+    Check if the provider accepts ``stream_options: {"include_usage": true}``
+    and reports token usage in the final stream chunk.
+
+    Args:
+        binding: Provider binding name
+        model: Optional model name
+
+    Returns:
+        True if usage can be requested for streams
+    """
+    return get_capability(binding, "supports_stream_usage", model, default=False)
+
+
 def system_in_messages(binding: str, model: Optional[str] = None) -> bool:
     """
     Check if system prompt should be in messages array (OpenAI style)
@@ -344,6 +370,7 @@ __all__ = [
     "get_capability",
     "supports_response_format",
     "supports_streaming",
+    "supports_stream_usage",
     "system_in_messages",
     "has_thinking_tags",
     "supports_tools",
@@ -15,6 +15,7 @@ from src.logging import get_logger
 
 from .capabilities import system_in_messages
 from .config import LLMConfig, get_llm_config
+from .scheduler import governed
 
 
 class LLMClient:
@@ -161,6 +162,8 @@ class LLMClient:
         # Note: Environment variables are already set in __init__ via _setup_openai_env_vars()
         from lightrag.llm.openai import openai_complete_if_cache
 
+        # Calls bypass the factory, so they wait for a scheduler slot here
+        @governed(binding, self.config.model)
         def llm_model_func(
             prompt: str,
             system_prompt: Optional[str] = None,
@@ -233,6 +236,7 @@ class LLMClient:
         # Get api_version once for reuse
         api_version = getattr(self.config, "api_version", None)
 
+        @governed(binding, self.config.model)
         def vision_model_func(
             prompt: str,
             system_prompt: Optional[str] = None,
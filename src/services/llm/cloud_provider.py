@@ -5,36 +5,25 @@ Cloud LLM Provider
 
 Handles all cloud API LLM calls (OpenAI, DeepSeek, Anthropic, etc.)
 Provides both complete() and stream() methods.
+Requests reuse pooled keep-alive sessions (see http_session).
 """
 
-import logging
 import os
-from typing import AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import aiohttp
 
-# Get loggers for suppression during fallback scenarios
-# (lightrag logs errors internally before raising exceptions)
-_lightrag_logger = logging.getLogger("lightrag")
-_openai_logger = logging.getLogger("openai")
-
-# Lazy import for lightrag to avoid import errors when not installed
-_openai_complete_if_cache = None
-
-
-def _get_openai_complete_if_cache():
-    """Lazy load openai_complete_if_cache from lightrag."""
-    global _openai_complete_if_cache
-    if _openai_complete_if_cache is None:
-        from lightrag.llm.openai import openai_complete_if_cache
-
-        _openai_complete_if_cache = openai_complete_if_cache
-    return _openai_complete_if_cache
-
-
-from .capabilities import get_effective_temperature, supports_response_format
+from .capabilities import (
+    get_effective_temperature,
+    supports_response_format,
+    supports_stream_usage,
+)
 from .config import get_token_limit_kwargs
-from .exceptions import LLMAPIError, LLMAuthenticationError, LLMConfigError
+from .error_mapping import map_http_error
+from .exceptions import LLMAPIError, LLMAuthenticationError
+from .http_session import get_llm_session
+from .prompt_cache import anthropic_cache_blocks, prompt_cache_enabled, prompt_cache_key
+from .usage import merge_usage, parse_usage, record_usage
 from .utils import (
     build_auth_headers,
     build_chat_url,
@@ -153,6 +142,34 @@ async def stream(
             yield chunk
 
 
+# Optional OpenAI chat parameters forwarded as-is when a caller sets them
+_OPENAI_PASSTHROUGH_PARAMS = (
+    "top_p",
+    "stop",
+    "seed",
+    "presence_penalty",
+    "frequency_penalty",
+    "tools",
+    "tool_choice",
+)
+
+
+def _add_prompt_cache_key(
+    data: Dict[str, Any],
+    binding: str,
+    model: str,
+    base_url: Optional[str],
+    prompt_cache: Optional[bool],
+) -> None:
+    """Attach a prompt_cache_key (system-prompt digest) where the endpoint accepts one."""
+    if not prompt_cache_enabled(prompt_cache):
+        return
+    system = next((m.get("content") for m in data["messages"] if m.get("role") == "system"), None)
+    key = prompt_cache_key(binding, model, system, base_url)
+    if key:
+        data["prompt_cache_key"] = key
+
+
 async def _openai_complete(
     model: str,
     prompt: str,
@@ -161,98 +178,83 @@ async def _openai_complete(
     base_url: Optional[str],
     api_version: Optional[str] = None,
     binding: str = "openai",
+    messages: Optional[List[Dict[str, str]]] = None,
+    history_messages: Optional[List[Dict[str, str]]] = None,
     **kwargs,
 ) -> str:
-    """OpenAI-compatible completion."""
+    """
+    OpenAI-compatible completion.
+
+    Sends exactly one request; failures are raised as unified exceptions
+    (see error_mapping.map_http_error) and retried by the factory.
+    """
     # Sanitize URL
     if base_url:
         base_url = sanitize_url(base_url, model)
 
-    # Handle API Parameter Compatibility using capabilities
-    # Remove response_format for providers that don't support it (e.g., DeepSeek)
-    if not supports_response_format(binding, model):
-        kwargs.pop("response_format", None)
+    # Build URL using unified utility (use binding for Azure detection)
+    effective_base = base_url or "https://api.openai.com/v1"
+    url = build_chat_url(effective_base, api_version, binding)
 
-    content = None
-    try:
-        # Try using lightrag's openai_complete_if_cache first (has caching)
-        # Only pass api_version if it's set (for Azure OpenAI)
-        # Standard OpenAI SDK doesn't accept api_version parameter
-        lightrag_kwargs = {
-            "system_prompt": system_prompt,
-            "history_messages": [],  # Required by lightrag to build messages array
-            "api_key": api_key,
-            "base_url": base_url,
-            **kwargs,
-        }
-        if api_version:
-            lightrag_kwargs["api_version"] = api_version
-
-        # Suppress lightrag's and openai's internal error logging during the call
-        # (errors are handled by our fallback mechanism)
-        original_lightrag_level = _lightrag_logger.level
-        original_openai_level = _openai_logger.level
-        _lightrag_logger.setLevel(logging.CRITICAL)
-        _openai_logger.setLevel(logging.CRITICAL)
-        try:
-            # model and prompt must be positional arguments
-            openai_complete_if_cache = _get_openai_complete_if_cache()
-            content = await openai_complete_if_cache(model, prompt, **lightrag_kwargs)
-        finally:
-            _lightrag_logger.setLevel(original_lightrag_level)
-            _openai_logger.setLevel(original_openai_level)
-    except Exception:
-        pass  # Fall through to direct call
-
-    # Fallback: Direct aiohttp call
-    if not content and base_url:
-        # Build URL using unified utility (use binding for Azure detection)
-        url = build_chat_url(base_url, api_version, binding)
-
-        # Build headers using unified utility
-        headers = build_auth_headers(api_key, binding)
-
-        data = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": get_effective_temperature(
-                binding, model, kwargs.get("temperature", 0.7)
-            ),
-        }
-
-        # Handle max_tokens / max_completion_tokens based on model
-        max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 4096
-        data.update(get_token_limit_kwargs(model, max_tokens))
+    # Build headers using unified utility
+    headers = build_auth_headers(api_key, binding)
+
+    # Build messages
+    if messages:
+        msg_list = messages
+    else:
+        msg_list = [
+            {"role": "system", "content": system_prompt},
+            *(history_messages or []),
+            {"role": "user", "content": prompt},
+        ]
 
-        # Include response_format if present in kwargs
-        if "response_format" in kwargs:
-            data["response_format"] = kwargs["response_format"]
+    data = {
+        "model": model,
+        "messages": msg_list,
+        "temperature": get_effective_temperature(binding, model, kwargs.get("temperature", 0.7)),
+    }
 
-        timeout = aiohttp.ClientTimeout(total=120)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, headers=headers, json=data) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    if "choices" in result and result["choices"]:
-                        msg = result["choices"][0].get("message", {})
-                        # Use unified response extraction
-                        content = extract_response_content(msg)
-                else:
-                    error_text = await resp.text()
-                    raise LLMAPIError(
-                        f"OpenAI API error: {error_text}",
-                        status_code=resp.status,
-                        provider=binding or "openai",
-                    )
-
-    if content is not None:
-        # Clean thinking tags from response using unified utility
-        return clean_thinking_tags(content, binding, model)
-
-    raise LLMConfigError("Cloud completion failed: no valid configuration")
+    # Handle max_tokens / max_completion_tokens based on model
+    max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 4096
+    data.update(get_token_limit_kwargs(model, max_tokens))
+
+    # Only send response_format to providers that support it (e.g., not DeepSeek)
+    if "response_format" in kwargs and supports_response_format(binding, model):
+        data["response_format"] = kwargs["response_format"]
+
+    for param in _OPENAI_PASSTHROUGH_PARAMS:
+        if kwargs.get(param) is not None:
+            data[param] = kwargs[param]
+
+    _add_prompt_cache_key(data, binding, model, effective_base, kwargs.get("prompt_cache"))
+
+    timeout = aiohttp.ClientTimeout(total=kwargs.get("timeout", 120))
+    session = get_llm_session(url)
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as resp:
+        if resp.status != 200:
+            raise map_http_error(
+                resp.status,
+                await resp.text(),
+                provider=binding or "openai",
+                retry_after=resp.headers.get("Retry-After"),
+                model=model,
+            )
+        result = await resp.json()
+
+    choices = result.get("choices") or []
+    if not choices:
+        raise LLMAPIError(
+            f"OpenAI API returned no choices: {result}",
+            status_code=200,
+            provider=binding or "openai",
+        )
+
+    record_usage(parse_usage(result))
+
+    # Use unified response extraction, then clean thinking tags
+    content = extract_response_content(choices[0].get("message", {}))
+    return clean_thinking_tags(content, binding, model)
 
 
 async def _openai_stream(
@@ -309,55 +311,66 @@ async def _openai_stream(
     if "response_format" in kwargs:
         data["response_format"] = kwargs["response_format"]
 
+    # Ask for a final usage chunk where the API supports it
+    if supports_stream_usage(binding, model):
+        data["stream_options"] = {"include_usage": True}
+
+    _add_prompt_cache_key(data, binding, model, effective_base, kwargs.get("prompt_cache"))
+
     timeout = aiohttp.ClientTimeout(total=300)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, headers=headers, json=data) as resp:
-            if resp.status != 200:
-                error_text = await resp.text()
-                raise LLMAPIError(
-                    f"OpenAI stream error: {error_text}",
-                    status_code=resp.status,
-                    provider=binding or "openai",
-                )
-
-            # Track thinking block state for streaming
-            in_thinking_block = False
-            thinking_buffer = ""
-
-            async for line in resp.content:
-                line_str = line.decode("utf-8").strip()
-                if not line_str or not line_str.startswith("data:"):
-                    continue
-
-                data_str = line_str[5:].strip()
-                if data_str == "[DONE]":
-                    break
-
-                try:
-                    chunk_data = json.loads(data_str)
-                    if "choices" in chunk_data and chunk_data["choices"]:
-                        delta = chunk_data["choices"][0].get("delta", {})
-                        content = delta.get("content")
-                        if content:
-                            # Handle thinking tags in streaming
-                            if "<think>" in content:
-                                in_thinking_block = True
-                                thinking_buffer = content
-                                continue
-                            elif in_thinking_block:
-                                thinking_buffer += content
-                                if "</think>" in thinking_buffer:
-                                    # End of thinking block, clean and yield
-                                    cleaned = clean_thinking_tags(thinking_buffer, binding, model)
-                                    if cleaned:
-                                        yield cleaned
-                                    in_thinking_block = False
-                                    thinking_buffer = ""
-                                continue
-                            else:
-                                yield content
-                except json.JSONDecodeError:
-                    continue
+    session = get_llm_session(url)
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as resp:
+        if resp.status != 200:
+            raise map_http_error(
+                resp.status,
+                f"OpenAI stream error: {await resp.text()}",
+                provider=binding or "openai",
+                retry_after=resp.headers.get("Retry-After"),
+                model=model,
+            )
+
+        # Track thinking block state for streaming
+        in_thinking_block = False
+        thinking_buffer = ""
+        usage = None
+
+        async for line in resp.content:
+            line_str = line.decode("utf-8").strip()
+            if not line_str or not line_str.startswith("data:"):
+                continue
+
+            data_str = line_str[5:].strip()
+            if data_str == "[DONE]":
+                break
+
+            try:
+                chunk_data = json.loads(data_str)
+                usage = parse_usage(chunk_data) or usage
+                if "choices" in chunk_data and chunk_data["choices"]:
+                    delta = chunk_data["choices"][0].get("delta", {})
+                    content = delta.get("content")
+                    if content:
+                        # Handle thinking tags in streaming
+                        if "<think>" in content:
+                            in_thinking_block = True
+                            thinking_buffer = content
+                            continue
+                        elif in_thinking_block:
+                            thinking_buffer += content
+                            if "</think>" in thinking_buffer:
+                                # End of thinking block, clean and yield
+                                cleaned = clean_thinking_tags(thinking_buffer, binding, model)
+                                if cleaned:
+                                    yield cleaned
+                                in_thinking_block = False
+                                thinking_buffer = ""
+                            continue
+                        else:
+                            yield content
+            except json.JSONDecodeError:
+                continue
+
+        record_usage(usage)
 
 
 async def _anthropic_complete(
@@ -393,6 +406,10 @@ async def _anthropic_complete(
         msg_list = [{"role": "user", "content": prompt}]
         system_content = system_prompt
 
+    # Mark the stable prefix (system prompt, earlier turns) for caching
+    if prompt_cache_enabled(kwargs.get("prompt_cache")):
+        system_content, msg_list = anthropic_cache_blocks(system_content, msg_list)
+
     data = {
         "model": model,
         "system": system_content,
@@ -402,18 +419,20 @@ async def _anthropic_complete(
     }
 
     timeout = aiohttp.ClientTimeout(total=120)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise LLMAPIError(
-                    f"Anthropic API error: {error_text}",
-                    status_code=response.status,
-                    provider="anthropic",
-                )
-
-            result = await response.json()
-            return result["content"][0]["text"]
+    session = get_llm_session(url)
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as response:
+        if response.status != 200:
+            raise map_http_error(
+                response.status,
+                f"Anthropic API error: {await response.text()}",
+                provider="anthropic",
+                retry_after=response.headers.get("Retry-After"),
+                model=model,
+            )
+
+        result = await response.json()
+        record_usage(parse_usage(result))
+        return result["content"][0]["text"]
 
 
 async def _anthropic_stream(
@@ -451,6 +470,10 @@ async def _anthropic_stream(
         msg_list = [{"role": "user", "content": prompt}]
         system_content = system_prompt
 
+    # Mark the stable prefix (system prompt, earlier turns) for caching
+    if prompt_cache_enabled(kwargs.get("prompt_cache")):
+        system_content, msg_list = anthropic_cache_blocks(system_content, msg_list)
+
     data = {
         "model": model,
         "system": system_content,
@@ -461,35 +484,43 @@ async def _anthropic_stream(
     }
 
     timeout = aiohttp.ClientTimeout(total=300)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise LLMAPIError(
-                    f"Anthropic stream error: {error_text}",
-                    status_code=response.status,
-                    provider="anthropic",
-                )
-
-            async for line in response.content:
-                line_str = line.decode("utf-8").strip()
-                if not line_str or not line_str.startswith("data:"):
-                    continue
-
-                data_str = line_str[5:].strip()
-                if not data_str:
-                    continue
-
-                try:
-                    chunk_data = json.loads(data_str)
-                    event_type = chunk_data.get("type")
-                    if event_type == "content_block_delta":
-                        delta = chunk_data.get("delta", {})
-                        text = delta.get("text")
-                        if text:
-                            yield text
-                except json.JSONDecodeError:
-                    continue
+    session = get_llm_session(url)
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as response:
+        if response.status != 200:
+            raise map_http_error(
+                response.status,
+                f"Anthropic stream error: {await response.text()}",
+                provider="anthropic",
+                retry_after=response.headers.get("Retry-After"),
+                model=model,
+            )
+
+        # message_start carries input tokens, message_delta the output total
+        usage = None
+
+        async for line in response.content:
+            line_str = line.decode("utf-8").strip()
+            if not line_str or not line_str.startswith("data:"):
+                continue
+
+            data_str = line_str[5:].strip()
+            if not data_str:
+                continue
+
+            try:
+                chunk_data = json.loads(data_str)
+                event_type = chunk_data.get("type")
+                if event_type == "content_block_delta":
+                    delta = chunk_data.get("delta", {})
+                    text = delta.get("text")
+                    if text:
+                        yield text
+                elif event_type in ("message_start", "message_delta"):
+                    usage = merge_usage(usage, parse_usage(chunk_data))
+            except json.JSONDecodeError:
+                continue
+
+        record_usage(usage)
 
 
 async def fetch_models(
@@ -5,6 +5,7 @@ Error Mapping - Map provider-specific errors to unified exceptions.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import logging
 from typing import Callable, List, Optional, Type
@@ -14,7 +15,9 @@ from .exceptions import (
     LLMAPIError,
     LLMAuthenticationError,
     LLMError,
+    LLMModelNotFoundError,
     LLMRateLimitError,
+    LLMTimeoutError,
     ProviderContextWindowError,
 )
 
@@ -52,6 +55,12 @@ def _message_contains(*needles: str) -> ErrorClassifier:
 
 
 _GLOBAL_RULES: List[MappingRule] = [
+    MappingRule(
+        classifier=_instance_of(asyncio.TimeoutError, TimeoutError),
+        factory=lambda exc, provider: LLMTimeoutError(
+            str(exc) or "Request timed out", provider=provider
+        ),
+    ),
     MappingRule(
         classifier=_message_contains("rate limit", "429", "quota"),
         factory=lambda exc, provider: LLMRateLimitError(str(exc), provider=provider),
@@ -90,8 +99,14 @@ except ImportError:
 
 def map_error(exc: Exception, provider: Optional[str] = None) -> LLMError:
     """Map provider-specific errors to unified internal exceptions."""
-    # Heuristic check for status codes before rules
     status_code = getattr(exc, "status_code", None)
+
+    # Already unified (e.g. from map_http_error): keep the type and retry_after.
+    # A generic LLMAPIError carrying 401/429 is still narrowed below.
+    if isinstance(exc, LLMError) and not (type(exc) is LLMAPIError and status_code in (401, 429)):
+        return exc
+
+    # Heuristic check for status codes before rules
     if status_code == 401:
         return LLMAuthenticationError(str(exc), provider=provider)
     if status_code == 429:
@@ -102,3 +117,46 @@ def map_error(exc: Exception, provider: Optional[str] = None) -> LLMError:
             return rule.factory(exc, provider)
 
     return LLMAPIError(str(exc), status_code=status_code, provider=provider)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None  # HTTP-date form; fall back to the scheduler's default pause
+
+
+def map_http_error(
+    status: int,
+    body: str,
+    provider: Optional[str] = None,
+    retry_after: Optional[str] = None,
+    model: Optional[str] = None,
+) -> LLMError:
+    """
+    Map a non-2xx HTTP response from a provider to a unified exception.
+
+    Args:
+        status: HTTP status code
+        body: Response body text
+        provider: Provider name
+        retry_after: Value of the Retry-After header, if any
+        model: Requested model
+
+    Returns:
+        LLMError subclass to raise
+    """
+    message = body.strip() or f"HTTP {status}"
+    if status == 401:
+        return LLMAuthenticationError(message, provider=provider)
+    if status == 429:
+        return LLMRateLimitError(
+            message, retry_after=_parse_retry_after(retry_after), provider=provider
+        )
+    if status == 404 and "model" in message.lower():
+        return LLMModelNotFoundError(message, model=model, provider=provider)
+    if status in (408, 504):
+        return LLMTimeoutError(message, provider=provider)
+    if _message_contains("context length", "maximum context")(Exception(message)):
+        return ProviderContextWindowError(message, status_code=status, provider=provider)
+    return LLMAPIError(message, status_code=status, provider=provider)
@@ -117,6 +117,23 @@ class LLMModelNotFoundError(LLMAPIError):
         self.model = model
 
 
+class LLMStreamInterruptedError(LLMAPIError):
+    """
+    Raised when a stream fails after output was already delivered and cannot
+    be resumed. ``partial`` holds the text the caller has received.
+    """
+
+    def __init__(
+        self,
+        message: str = "Stream interrupted",
+        partial: str = "",
+        status_code: Optional[int] = None,
+        provider: Optional[str] = None,
+    ):
+        super().__init__(message, status_code=status_code, provider=provider)
+        self.partial = partial
+
+
 class LLMParseError(LLMError):
     """Raised when parsing LLM output fails."""
 
@@ -147,6 +164,7 @@ __all__ = [
     "LLMRateLimitError",
     "LLMAuthenticationError",
     "LLMModelNotFoundError",
+    "LLMStreamInterruptedError",
     "LLMParseError",
     "ProviderQuotaExceededError",
     "ProviderContextWindowError",
@@ -25,14 +25,40 @@ Routing:
 - Automatically routes to local_provider for local URLs (localhost, 127.0.0.1, etc.)
 - Routes to cloud_provider for all other URLs
 
+Response Cache:
+- complete() serves repeated prompts from response_cache (opt in per call
+  with cache=True; temperature-0 calls are cached by default)
+
+Token Usage:
+- Providers report the usage block of each response; after complete() or
+  a finished stream(), usage.get_last_usage() returns the counts (None if
+  the provider reported none or the response was cached)
+
+Prompt Caching:
+- Providers receive prompt-caching hints (Anthropic cache_control blocks,
+  OpenAI prompt_cache_key) so stable prompt prefixes are reused
+
+Scheduling:
+- Every request waits for a slot from the LLM scheduler, which enforces
+  per-(binding, model) RPM/TPM budgets, priorities and fair queuing
+
+Hedging:
+- complete() can race a duplicate request (optionally to a secondary
+  provider) against calls slower than the lane's learned latency
+  percentile, within a per-session budget (opt in with hedge=True or
+  LLM_HEDGE_ENABLED, see hedging.py)
+
 Retry Mechanism:
 - Automatic retry with exponential backoff for transient errors
+- stream() never re-yields delivered chunks: a mid-stream failure resumes
+  from the delivered prefix or raises LLMStreamInterruptedError
 - Configurable max_retries, retry_delay, and exponential_backoff
 - Only retries on retriable errors (timeout, rate limit, server errors)
 """
 
 import asyncio
-from typing import Any, AsyncGenerator, Dict, List, Optional
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import tenacity
 
@@ -44,8 +70,20 @@ from .exceptions import (
     LLMAPIError,
     LLMAuthenticationError,
     LLMRateLimitError,
+    LLMStreamInterruptedError,
     LLMTimeoutError,
 )
+from .hedging import get_llm_hedger, hedge_enabled, hedge_target
+from .response_cache import (
+    get_response_cache,
+    make_cache_key,
+    make_cache_scope,
+    mark_cache_hit,
+    should_cache,
+)
+from .scheduler import Priority, estimate_tokens, get_llm_scheduler, get_llm_session
+from .telemetry import StreamTimer
+from .usage import LLMUsage, get_last_usage, record_usage
 from .utils import is_local_llm_server
 
 # Initialize logger
@@ -56,6 +94,14 @@ DEFAULT_MAX_RETRIES = 5  # Increased for complex agents like Research
 DEFAULT_RETRY_DELAY = 2.0  # seconds
 DEFAULT_EXPONENTIAL_BACKOFF = True
 
+# Resuming an interrupted stream
+RESUME_INSTRUCTION = (
+    "Continue exactly where your previous message stopped. "
+    "Do not repeat any text you have already written."
+)
+RESUME_OVERLAP_WINDOW = 200  # characters buffered to detect re-sent text
+RESUME_MIN_OVERLAP = 8  # shorter matches are treated as coincidence
+
 
 def _is_retriable_error(error: Exception) -> bool:
     """
@@ -100,6 +146,27 @@ def _is_retriable_error(error: Exception) -> bool:
     return True
 
 
+def _estimate_request_tokens(
+    prompt: str,
+    system_prompt: str,
+    messages: Optional[List[Dict[str, Any]]],
+    kwargs: Dict[str, Any],
+) -> Tuple[int, int]:
+    """
+    Estimate a request's prompt tokens and the budget to reserve for it.
+
+    Returns:
+        (prompt tokens, prompt tokens + completion limit)
+    """
+    if messages:
+        texts = [str(m.get("content", "")) for m in messages]
+    else:
+        texts = [system_prompt or "", prompt or ""]
+    prompt_tokens = sum(estimate_tokens(t) for t in texts)
+    max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 0
+    return prompt_tokens, prompt_tokens + int(max_tokens)
+
+
 def _should_use_local(base_url: Optional[str]) -> bool:
     """
     Determine if we should use the local provider based on URL.
@@ -125,6 +192,10 @@ async def complete(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     exponential_backoff: bool = DEFAULT_EXPONENTIAL_BACKOFF,
+    cache: Optional[bool] = None,
+    priority: Optional[Priority] = None,
+    prompt_cache: Optional[bool] = None,
+    hedge: Optional[bool] = None,
     **kwargs,
 ) -> str:
     """
@@ -145,6 +216,13 @@ async def complete(
         max_retries: Maximum number of retry attempts (default: 5)
         retry_delay: Initial delay between retries in seconds (default: 2.0)
         exponential_backoff: Whether to use exponential backoff (default: True)
+        cache: Use the response cache (True/False); None caches only
+            temperature-0 calls
+        priority: Scheduling class (default: from scheduler.set_llm_context)
+        prompt_cache: Send provider prompt-caching hints (default:
+            LLM_PROMPT_CACHE, see prompt_cache.py)
+        hedge: Race a duplicate request against a slow call (default:
+            LLM_HEDGE_ENABLED, see hedging.py)
         **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
     Returns:
@@ -193,6 +271,11 @@ async def complete(
     # Calculate total attempts for logging (1 initial + max_retries)
     total_attempts = max_retries + 1
 
+    scheduler = get_llm_scheduler()
+    hedger = get_llm_hedger()
+    lane = binding or ("local" if use_local else "openai")
+    prompt_tokens, reserve = _estimate_request_tokens(prompt, system_prompt, messages, kwargs)
+
     # Define the actual completion function with tenacity retry
     @tenacity.retry(
         retry=(
@@ -207,19 +290,76 @@ async def complete(
             f"retrying in {retry_state.upcoming_sleep:.1f}s... Error: {str(retry_state.outcome.exception())}"
         ),
     )
-    async def _do_complete(**call_kwargs):
+    async def _do_complete(
+        local: bool, call_lane: str, sent: Optional[asyncio.Event] = None, **call_kwargs
+    ):
+        call_model = call_kwargs["model"]
         try:
-            if use_local:
-                return await local_provider.complete(**call_kwargs)
-            else:
-                return await cloud_provider.complete(**call_kwargs)
+            # Wait for the (binding, model) lane's rate budget before sending
+            async with scheduler.slot(
+                call_lane, call_model, tokens=reserve, priority=priority
+            ) as settle:
+                if sent is not None:
+                    sent.set()
+                started = time.monotonic()
+                if local:
+                    response = await local_provider.complete(**call_kwargs)
+                else:
+                    response = await cloud_provider.complete(**call_kwargs)
+                hedger.observe(call_lane, call_model, time.monotonic() - started)
+                usage = get_last_usage()
+                settle(
+                    usage.total_tokens if usage else prompt_tokens + estimate_tokens(response or "")
+                )
+                return response
         except Exception as e:
             # Map raw SDK exceptions to unified exceptions for retry logic
             from .error_mapping import map_error
 
             mapped_error = map_error(e, provider=call_kwargs.get("binding", "unknown"))
+            if isinstance(mapped_error, LLMRateLimitError):
+                scheduler.report_rate_limit(call_lane, call_model, mapped_error.retry_after)
             raise mapped_error from e
 
+    async def _attempt(
+        local: bool,
+        call_lane: str,
+        attempt_kwargs: Dict[str, Any],
+        sent: Optional[asyncio.Event] = None,
+    ):
+        # Hedged attempts run as separate tasks; hand their usage back explicitly
+        response = await _do_complete(local, call_lane, sent, **attempt_kwargs)
+        return response, get_last_usage()
+
+    async def _run(call_kwargs: Dict[str, Any]) -> str:
+        if not hedge_enabled(hedge):
+            return await _do_complete(use_local, lane, **call_kwargs)
+
+        # The duplicate goes to the secondary provider when one is configured
+        target = hedge_target()
+        backup_kwargs = {**call_kwargs, **target}
+        backup_local = _should_use_local(backup_kwargs.get("base_url"))
+        backup_lane = target.get("binding") or lane
+        if not backup_local:
+            backup_kwargs.setdefault("api_version", api_version)
+            backup_kwargs["binding"] = backup_lane
+        else:
+            backup_kwargs.pop("api_version", None)
+            backup_kwargs.pop("binding", None)
+
+        # The hedge timer starts once the original request has a scheduler slot
+        sent = asyncio.Event()
+        response, usage = await hedger.run(
+            lambda: _attempt(use_local, lane, call_kwargs, sent),
+            lambda: _attempt(backup_local, backup_lane, backup_kwargs),
+            lane=lane,
+            model=model,
+            session_id=get_llm_session(),
+            sent=sent,
+        )
+        record_usage(usage)
+        return response
+
     # Build call kwargs
     call_kwargs = {
         "prompt": prompt,
@@ -228,6 +368,7 @@ async def complete(
         "api_key": api_key,
         "base_url": base_url,
         "messages": messages,
+        "prompt_cache": prompt_cache,
         **kwargs,
     }
 
@@ -236,8 +377,48 @@ async def complete(
         call_kwargs["api_version"] = api_version
         call_kwargs["binding"] = binding or "openai"
 
+    mark_cache_hit(False)
+    record_usage(None)
+    if not should_cache(cache, kwargs.get("temperature")):
+        # Execute with retry (handled by tenacity decorator)
+        return await _run(call_kwargs)
+
+    response_cache = get_response_cache()
+    full_messages = messages or [
+        {"role": "system", "content": system_prompt},
+        *(kwargs.get("history_messages") or []),
+        {"role": "user", "content": prompt},
+    ]
+    # Every request parameter that can change the answer is part of the key
+    keyed = ("temperature", "response_format", "max_tokens", "max_completion_tokens")
+    cache_args = {
+        "model": model,
+        "messages": full_messages,
+        "temperature": kwargs.get("temperature"),
+        "response_format": kwargs.get("response_format"),
+        "binding": binding,
+        "base_url": base_url,
+        "params": {k: v for k, v in kwargs.items() if k not in keyed and k != "history_messages"},
+    }
+    key = make_cache_key(
+        **cache_args,
+        max_tokens=kwargs.get("max_tokens") or kwargs.get("max_completion_tokens"),
+    )
+    scope = make_cache_scope(**cache_args)
+    prompt_text = "\n".join(
+        str(m.get("content", "")) for m in full_messages if m.get("role") != "system"
+    )
+
+    cached = await response_cache.get(key, scope, prompt_text)
+    if cached is not None:
+        mark_cache_hit(True)
+        return cached
+
     # Execute with retry (handled by tenacity decorator)
-    return await _do_complete(**call_kwargs)
+    response = await _run(call_kwargs)
+    if response:
+        await response_cache.put(key, scope, prompt_text, response)
+    return response
 
 
 async def stream(
@@ -252,6 +433,9 @@ async def stream(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     exponential_backoff: bool = DEFAULT_EXPONENTIAL_BACKOFF,
+    priority: Optional[Priority] = None,
+    resume: bool = True,
+    prompt_cache: Optional[bool] = None,
     **kwargs,
 ) -> AsyncGenerator[str, None]:
     """
@@ -260,8 +444,14 @@ async def stream(
     Routes to cloud_provider or local_provider based on configuration.
     Includes automatic retry with exponential backoff for connection errors.
 
-    Note: Retry only applies to initial connection errors. Once streaming
-    starts, errors during streaming will not be automatically retried.
+    Chunks are never yielded twice. An error before the first chunk retries
+    the request from scratch; an error after output was delivered resumes
+    with a continuation request that replays the delivered text as an
+    assistant turn (or, with ``resume=False``, fails cleanly). When the
+    stream cannot be completed after partial output,
+    LLMStreamInterruptedError is raised with the delivered text attached.
+
+    First-token and inter-token latency are recorded in telemetry.stream_stats().
 
     Args:
         prompt: The user prompt
@@ -275,6 +465,11 @@ async def stream(
         max_retries: Maximum number of retry attempts (default: 5)
         retry_delay: Initial delay between retries in seconds (default: 2.0)
         exponential_backoff: Whether to use exponential backoff (default: True)
+        priority: Scheduling class (default: from scheduler.set_llm_context)
+        resume: Continue an interrupted stream from the delivered prefix
+            instead of failing (default: True)
+        prompt_cache: Send provider prompt-caching hints (default:
+            LLM_PROMPT_CACHE, see prompt_cache.py)
         **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
     Yields:
@@ -300,6 +495,7 @@ async def stream(
         "api_key": api_key,
         "base_url": base_url,
         "messages": messages,
+        "prompt_cache": prompt_cache,
         **kwargs,
     }
 
@@ -311,50 +507,160 @@ async def stream(
     # Retry logic for streaming (retry on connection errors)
     # Total attempts = 1 initial + max_retries
     total_attempts = max_retries + 1
-    last_exception = None
     delay = retry_delay
     max_delay = 120  # Cap maximum delay at 120 seconds (consistent with complete())
 
-    for attempt in range(total_attempts):
-        try:
-            # Route to appropriate provider
-            if use_local:
-                async for chunk in local_provider.stream(**call_kwargs):
-                    yield chunk
-            else:
-                async for chunk in cloud_provider.stream(**call_kwargs):
-                    yield chunk
-            # If we get here, streaming completed successfully
-            return
-        except Exception as e:
-            last_exception = e
-
-            # Check if we should retry
-            if attempt >= max_retries or not _is_retriable_error(e):
-                raise
-
-            # Calculate delay for next attempt
-            if exponential_backoff:
-                current_delay = min(delay * (2**attempt), max_delay)
-            else:
-                current_delay = delay
-
-            # Special handling for rate limit errors with retry_after
-            if isinstance(e, LLMRateLimitError) and e.retry_after:
-                current_delay = max(current_delay, e.retry_after)
-
-            # Log retry attempt (consistent with complete() function)
-            logger.warning(
-                f"LLM streaming failed (attempt {attempt + 1}/{total_attempts}), "
-                f"retrying in {current_delay:.1f}s... Error: {str(e)}"
-            )
-
-            # Wait before retrying
-            await asyncio.sleep(current_delay)
-
-    # Should not reach here, but just in case
-    if last_exception:
-        raise last_exception
+    scheduler = get_llm_scheduler()
+    lane = binding or ("local" if use_local else "openai")
+    prompt_tokens, reserve = _estimate_request_tokens(prompt, system_prompt, messages, kwargs)
+    timer = StreamTimer(f"{lane}/{model}")
+
+    # Text already yielded to the caller; never sent twice
+    delivered: List[str] = []
+    interrupted = True
+    # Provider-reported usage, summed over resumed attempts
+    total_usage: Optional[LLMUsage] = None
+    record_usage(None)
+
+    try:
+        for attempt in range(total_attempts):
+            sent = "".join(delivered)
+            attempt_kwargs = call_kwargs
+            if sent:
+                attempt_kwargs = {
+                    **call_kwargs,
+                    "messages": _continuation_messages(prompt, system_prompt, messages, sent, lane),
+                }
+                timer.resumes += 1
+            try:
+                # Hold a scheduler slot for the whole stream
+                async with scheduler.slot(lane, model, tokens=reserve, priority=priority) as settle:
+                    streamed = 0
+                    # Buffer the start of a continuation to drop re-sent text
+                    pending = "" if sent else None
+                    # Route to appropriate provider
+                    provider = local_provider if use_local else cloud_provider
+                    record_usage(None)
+                    async for chunk in provider.stream(**attempt_kwargs):
+                        streamed += len(chunk)
+                        if pending is not None:
+                            pending += chunk
+                            if len(pending) < RESUME_OVERLAP_WINDOW:
+                                continue
+                            chunk, pending = _trim_overlap(sent, pending), None
+                        if chunk:
+                            delivered.append(chunk)
+                            timer.tick()
+                            yield chunk
+                    if pending:
+                        chunk = _trim_overlap(sent, pending)
+                        if chunk:
+                            delivered.append(chunk)
+                            timer.tick()
+                            yield chunk
+                    usage = get_last_usage()
+                    settle(usage.total_tokens if usage else prompt_tokens + streamed // 4)
+                # If we get here, streaming completed successfully
+                if usage:
+                    total_usage = total_usage + usage if total_usage else usage
+                record_usage(total_usage)
+                interrupted = False
+                return
+            except Exception as e:
+                if isinstance(e, LLMRateLimitError):
+                    scheduler.report_rate_limit(lane, model, e.retry_after)
+
+                partial = "".join(delivered)
+                retriable = attempt < max_retries and _is_retriable_error(e)
+                if not retriable or (partial and not resume):
+                    if not partial:
+                        raise
+                    # Output already reached the caller: fail without replaying it
+                    raise LLMStreamInterruptedError(
+                        f"Stream interrupted after {len(partial)} characters: {e}",
+                        partial=partial,
+                        status_code=getattr(e, "status_code", None),
+                        provider=lane,
+                    ) from e
+
+                # Calculate delay for next attempt
+                if exponential_backoff:
+                    current_delay = min(delay * (2**attempt), max_delay)
+                else:
+                    current_delay = delay
+
+                # Special handling for rate limit errors with retry_after
+                if isinstance(e, LLMRateLimitError) and e.retry_after:
+                    current_delay = max(current_delay, e.retry_after)
+
+                # Log retry attempt (consistent with complete() function)
+                action = f"resuming after {len(partial)} chars" if partial else "retrying"
+                logger.warning(
+                    f"LLM streaming failed (attempt {attempt + 1}/{total_attempts}), "
+                    f"{action} in {current_delay:.1f}s... Error: {str(e)}"
+                )
+
+                # Wait before retrying
+                await asyncio.sleep(current_delay)
+    finally:
+        timer.finish(interrupted=interrupted)
+
+
+def _continuation_messages(
+    prompt: str,
+    system_prompt: str,
+    messages: Optional[List[Dict[str, Any]]],
+    sent: str,
+    binding: str,
+) -> List[Dict[str, Any]]:
+    """
+    Build the messages of a request that continues an interrupted stream.
+
+    The text already delivered is replayed as an assistant turn. Anthropic
+    continues a trailing assistant message natively; OpenAI-compatible APIs
+    get an explicit instruction to carry on from it.
+
+    Args:
+        prompt: The user prompt
+        system_prompt: System prompt for context
+        messages: Pre-built messages array of the original request
+        sent: Text already delivered to the caller
+        binding: Provider binding (or "local")
+
+    Returns:
+        Messages array for the continuation request
+    """
+    base = (
+        list(messages)
+        if messages
+        else [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+    )
+    # Anthropic rejects a final assistant turn ending in whitespace
+    continued = base + [{"role": "assistant", "content": sent.rstrip()}]
+    if binding != "anthropic":
+        continued.append({"role": "user", "content": RESUME_INSTRUCTION})
+    return continued
+
+
+def _trim_overlap(sent: str, continuation: str) -> str:
+    """
+    Drop the head of ``continuation`` that repeats the tail of ``sent``.
+
+    Args:
+        sent: Text already delivered
+        continuation: Start of the continuation stream
+
+    Returns:
+        The continuation without the repeated text
+    """
+    longest = min(len(sent), len(continuation))
+    for size in range(longest, RESUME_MIN_OVERLAP - 1, -1):
+        if sent.endswith(continuation[:size]):
+            return continuation[size:]
+    return continuation
 
 
 async def fetch_models(
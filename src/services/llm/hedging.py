@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Hedged LLM Requests
+===================
+
+Cuts tail latency of ``factory.complete``: when a call has not answered
+after the usual latency of its (binding, model) lane, a duplicate request
+is sent and whichever answers first wins; the other one is cancelled.
+
+- The hedge delay is a latency percentile learned from recent successful
+  calls of the lane (nothing is hedged until enough calls were seen)
+- The duplicate can go to a secondary provider (LLM_HEDGE_MODEL /
+  LLM_HEDGE_BASE_URL ...), otherwise it repeats the same request
+- Each session (see scheduler.set_llm_context) may hedge at most
+  LLM_HEDGE_BUDGET requests, so duplicates cannot double the bill
+- Hedging is opt-in: per call with ``complete(..., hedge=True)`` or for
+  every call with LLM_HEDGE_ENABLED
+
+Configuration (environment):
+    LLM_HEDGE_ENABLED       Hedge calls that do not pass ``hedge`` (default: false)
+    LLM_HEDGE_PERCENTILE    Latency percentile that triggers the hedge (default: 0.95)
+    LLM_HEDGE_MIN_SAMPLES   Calls observed per lane before hedging (default: 20)
+    LLM_HEDGE_MIN_DELAY     Never hedge earlier than this, in seconds (default: 2.0)
+    LLM_HEDGE_BUDGET        Hedged requests allowed per session (default: 20)
+    LLM_HEDGE_MODEL         Secondary provider for the duplicate request
+    LLM_HEDGE_BINDING       (default: the primary request's settings)
+    LLM_HEDGE_BASE_URL
+    LLM_HEDGE_API_KEY
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+import math
+import os
+import threading
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from src.logging.logger import get_logger
+
+logger = get_logger("LLMHedger")
+
+DEFAULT_PERCENTILE = 0.95
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_MIN_DELAY = 2.0
+DEFAULT_BUDGET = 20
+# Latencies kept per lane
+LATENCY_WINDOW = 200
+# Sessions whose budget is tracked (oldest are forgotten)
+MAX_SESSIONS = 1024
+
+
+def hedge_enabled(override: Optional[bool] = None) -> bool:
+    """
+    Decide whether a completion may be hedged.
+
+    Args:
+        override: Per-call setting, or None for LLM_HEDGE_ENABLED
+
+    Returns:
+        True if the call may send a duplicate request
+    """
+    if override is not None:
+        return override
+    return os.getenv("LLM_HEDGE_ENABLED", "false").lower() in ("true", "1", "yes")
+
+
+def hedge_target() -> Dict[str, Any]:
+    """
+    Secondary provider settings for duplicate requests.
+
+    Returns:
+        Subset of {model, binding, base_url, api_key} configured through
+        LLM_HEDGE_*; empty to repeat the primary request
+    """
+    target = {
+        "model": os.getenv("LLM_HEDGE_MODEL"),
+        "binding": os.getenv("LLM_HEDGE_BINDING"),
+        "base_url": os.getenv("LLM_HEDGE_BASE_URL"),
+        "api_key": os.getenv("LLM_HEDGE_API_KEY"),
+    }
+    return {key: value for key, value in target.items() if value}
+
+
+class LLMHedger:
+    """
+    Learns per-lane latency and races a duplicate request against slow calls.
+    """
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        min_delay: float = DEFAULT_MIN_DELAY,
+        budget: int = DEFAULT_BUDGET,
+    ):
+        """
+        Initialize the hedger.
+
+        Args:
+            percentile: Latency percentile (0-1) after which a duplicate is sent
+            min_samples: Successful calls observed per lane before hedging
+            min_delay: Lower bound of the hedge delay in seconds
+            budget: Hedged requests allowed per session
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.budget = budget
+        self._latencies: Dict[Tuple[str, str], Deque[float]] = {}
+        self._spent: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+
+    def observe(self, lane: str, model: str, seconds: float) -> None:
+        """
+        Record the latency of a successful request.
+
+        Args:
+            lane: Provider binding of the request
+            model: Model name
+            seconds: Time from sending the request to the full response
+        """
+        with self._lock:
+            window = self._latencies.setdefault((lane, model), deque(maxlen=LATENCY_WINDOW))
+            window.append(seconds)
+
+    def delay(self, lane: str, model: str) -> Optional[float]:
+        """
+        Seconds to wait for a response before hedging.
+
+        Args:
+            lane: Provider binding of the request
+            model: Model name
+
+        Returns:
+            Hedge delay, or None while too few calls were observed
+        """
+        with self._lock:
+            window = self._latencies.get((lane, model))
+            if window is None or len(window) < self.min_samples:
+                return None
+            ordered = sorted(window)
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return max(self.min_delay, ordered[max(index, 0)])
+
+    def try_spend(self, session_id: str) -> bool:
+        """
+        Take one hedge from a session's budget.
+
+        Args:
+            session_id: Session of the request
+
+        Returns:
+            True if the session may send another duplicate request
+        """
+        with self._lock:
+            spent = self._spent.get(session_id, 0)
+            if spent >= self.budget:
+                self.budget_denied += 1
+                return False
+            self._spent[session_id] = spent + 1
+            self._spent.move_to_end(session_id)
+            while len(self._spent) > MAX_SESSIONS:
+                self._spent.popitem(last=False)
+            self.hedged += 1
+            return True
+
+    async def run(
+        self,
+        primary: Callable[[], Awaitable[Any]],
+        backup: Callable[[], Awaitable[Any]],
+        lane: str,
+        model: str,
+        session_id: str,
+        sent: Optional[asyncio.Event] = None,
+    ) -> Any:
+        """
+        Run a request, racing a duplicate against it if it is slow.
+
+        The learned delay is service time only, so when ``sent`` is given the
+        hedge timer starts once it is set (the original request left the
+        scheduler queue). A request still waiting for a slot is never hedged;
+        a duplicate would only add load to the congested lane.
+
+        Args:
+            primary: Starts the original request
+            backup: Starts the duplicate request
+            lane: Provider binding of the original request
+            model: Model of the original request
+            session_id: Session charged for the duplicate
+            sent: Set by the original request when it is actually sent
+
+        Returns:
+            Result of the first request that succeeds
+
+        Raises:
+            The original request's error if both requests fail
+        """
+        delay = self.delay(lane, model)
+        if delay is None:
+            return await primary()
+
+        first = asyncio.ensure_future(primary())
+        second = None
+        try:
+            if sent is not None and not sent.is_set():
+                waiter = asyncio.ensure_future(sent.wait())
+                try:
+                    await asyncio.wait({first, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    waiter.cancel()
+                if first.done():
+                    return await first
+
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            if done or not self.try_spend(session_id):
+                return await first
+
+            logger.info(f"No response from {lane}/{model} after {delay:.1f}s, hedging")
+            second = asyncio.ensure_future(backup())
+            pending = {first, second}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return task.result()
+            # Both failed: surface the original request's error
+            return first.result()
+        finally:
+            for task in (first, second):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hedge counters and the current delay of each lane."""
+        with self._lock:
+            lanes = list(self._latencies)
+            counters = {
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "budget_denied": self.budget_denied,
+                "budget_per_session": self.budget,
+            }
+        counters["delays"] = {f"{lane}/{model}": self.delay(lane, model) for lane, model in lanes}
+        return counters
+
+
+# Singleton instance
+_hedger: Optional[LLMHedger] = None
+_hedger_lock = threading.Lock()
+
+
+def get_llm_hedger() -> LLMHedger:
+    """
+    Get or create the process-wide hedger.
+
+    Returns:
+        LLMHedger instance
+    """
+    global _hedger
+    if _hedger is None:
+        with _hedger_lock:
+            if _hedger is None:
+                _hedger = LLMHedger(
+                    percentile=float(os.getenv("LLM_HEDGE_PERCENTILE", DEFAULT_PERCENTILE)),
+                    min_samples=int(os.getenv("LLM_HEDGE_MIN_SAMPLES", DEFAULT_MIN_SAMPLES)),
+                    min_delay=float(os.getenv("LLM_HEDGE_MIN_DELAY", DEFAULT_MIN_DELAY)),
+                    budget=int(os.getenv("LLM_HEDGE_BUDGET", DEFAULT_BUDGET)),
+                )
+    return _hedger
+
+
+def reset_llm_hedger():
+    """Reset the singleton hedger (forgets latencies and budgets)."""
+    global _hedger
+    _hedger = None
+
+
+__all__ = [
+    "LLMHedger",
+    "hedge_enabled",
+    "hedge_target",
+    "get_llm_hedger",
+    "reset_llm_hedger",
+]
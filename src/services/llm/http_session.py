@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+LLM HTTP Session Pool
+=====================
+
+Long-lived ``aiohttp.ClientSession`` objects shared by the cloud and local
+providers, so the dozens of LLM calls in one solve/research run reuse
+keep-alive connections instead of repeating TCP/TLS setup on every call.
+
+- One session per (event loop, scheme://host:port); sessions cannot cross
+  event loops, and keying by origin keeps each host's pool separate
+- Connector limits and DNS caching are configurable (see below)
+- Per-host counters (requests, new vs. reused connections, DNS cache hits)
+  are collected with an ``aiohttp.TraceConfig``
+- The FastAPI lifespan closes every session on shutdown
+  (``close_llm_sessions``)
+
+Configuration (environment):
+    LLM_HTTP_MAX_CONNECTIONS           Total connections per session (default: 100)
+    LLM_HTTP_MAX_CONNECTIONS_PER_HOST  Connections per host (default: 32)
+    LLM_HTTP_KEEPALIVE_TIMEOUT         Idle keep-alive lifetime in seconds (default: 60)
+    LLM_HTTP_DNS_CACHE_TTL             DNS cache lifetime in seconds (default: 300)
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict, Tuple
+from urllib.parse import urlsplit
+import weakref
+
+import aiohttp
+
+from src.logging.logger import get_logger
+
+logger = get_logger("LLMHTTPSession")
+
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]]" = weakref.WeakKeyDictionary()
+_host_stats: Dict[str, Dict[str, int]] = {}
+_lock = threading.Lock()
+
+
+def _origin(url: str) -> str:
+    """Reduce a URL to scheme://host:port, the unit of connection pooling."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+def _count(origin: str, field: str) -> None:
+    with _lock:
+        stats = _host_stats.setdefault(
+            origin,
+            {
+                "requests": 0,
+                "errors": 0,
+                "new_connections": 0,
+                "reused_connections": 0,
+                "dns_cache_hits": 0,
+                "dns_cache_misses": 0,
+            },
+        )
+        stats[field] += 1
+
+
+def _trace_config(origin: str) -> aiohttp.TraceConfig:
+    """Counters for one origin's session."""
+    trace = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params):
+        _count(origin, "requests")
+
+    async def on_request_exception(session, ctx, params):
+        _count(origin, "errors")
+
+    async def on_connection_create_end(session, ctx, params):
+        _count(origin, "new_connections")
+
+    async def on_connection_reuseconn(session, ctx, params):
+        _count(origin, "reused_connections")
+
+    async def on_dns_cache_hit(session, ctx, params):
+        _count(origin, "dns_cache_hits")
+
+    async def on_dns_cache_miss(session, ctx, params):
+        _count(origin, "dns_cache_misses")
+
+    trace.on_request_start.append(on_request_start)
+    trace.on_request_exception.append(on_request_exception)
+    trace.on_connection_create_end.append(on_connection_create_end)
+    trace.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace.on_dns_cache_hit.append(on_dns_cache_hit)
+    trace.on_dns_cache_miss.append(on_dns_cache_miss)
+    return trace
+
+
+def _connector_settings() -> Tuple[int, int, float, int]:
+    return (
+        int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", 100)),
+        int(os.getenv("LLM_HTTP_MAX_CONNECTIONS_PER_HOST", 32)),
+        float(os.getenv("LLM_HTTP_KEEPALIVE_TIMEOUT", 60)),
+        int(os.getenv("LLM_HTTP_DNS_CACHE_TTL", 300)),
+    )
+
+
+def get_llm_session(url: str) -> aiohttp.ClientSession:
+    """
+    Get the pooled session for the host of ``url`` on the running event loop.
+
+    Callers must not close the returned session; pass a per-request
+    ``timeout=aiohttp.ClientTimeout(...)`` to ``session.post``/``get`` instead
+    of configuring one on the session.
+
+    Args:
+        url: Request URL (only scheme, host and port are used)
+
+    Returns:
+        Shared aiohttp.ClientSession
+    """
+    loop = asyncio.get_running_loop()
+    origin = _origin(url)
+    with _lock:
+        sessions = _sessions.setdefault(loop, {})
+        session = sessions.get(origin)
+        if session is None or session.closed:
+            limit, limit_per_host, keepalive, dns_ttl = _connector_settings()
+            connector = aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=keepalive,
+                use_dns_cache=True,
+                ttl_dns_cache=dns_ttl,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[_trace_config(origin)]
+            )
+            sessions[origin] = session
+            logger.debug(f"Opened pooled LLM session for {origin}")
+    return session
+
+
+async def close_llm_sessions() -> int:
+    """
+    Close the pooled sessions that belong to the running event loop.
+
+    Sessions bound to other (possibly finished) loops are dropped without
+    awaiting, since they can only be closed from their own loop.
+
+    Returns:
+        Number of sessions closed
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        own = list(_sessions.pop(loop, {}).values())
+        _sessions.clear()
+
+    for session in own:
+        if not session.closed:
+            await session.close()
+    return len(own)
+
+
+def llm_session_stats() -> Dict[str, Any]:
+    """
+    Per-host connection counters and currently open sessions.
+
+    Returns:
+        Dictionary with "hosts" (origin -> counters) and "open_sessions"
+    """
+    with _lock:
+        open_sessions = sum(
+            1 for sessions in _sessions.values() for s in sessions.values() if not s.closed
+        )
+        return {
+            "open_sessions": open_sessions,
+            "hosts": {origin: dict(stats) for origin, stats in _host_stats.items()},
+        }
+
+
+def reset_llm_session_stats() -> None:
+    """Clear the per-host counters."""
+    with _lock:
+        _host_stats.clear()
+
+
+__all__ = [
+    "get_llm_session",
+    "close_llm_sessions",
+    "llm_session_stats",
+    "reset_llm_session_stats",
+]
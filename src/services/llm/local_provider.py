@@ -10,6 +10,7 @@ Key features:
 - Uses aiohttp (httpx has known 502 issues with some local servers like LM Studio)
 - Handles thinking tags (<think>) from reasoning models like Qwen
 - Extended timeouts for potentially slower local inference
+- Reuses pooled keep-alive sessions (see http_session)
 """
 
 import json
@@ -18,6 +19,8 @@ from typing import AsyncGenerator, Dict, List, Optional
 import aiohttp
 
 from .exceptions import LLMAPIError, LLMConfigError
+from .http_session import get_llm_session
+from .usage import parse_usage, record_usage
 from .utils import (
     build_auth_headers,
     build_chat_url,
@@ -89,27 +92,28 @@ async def complete(
 
     timeout = aiohttp.ClientTimeout(total=kwargs.get("timeout", DEFAULT_TIMEOUT))
 
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise LLMAPIError(
-                    f"Local LLM error: {error_text}",
-                    status_code=response.status,
-                    provider="local",
-                )
+    session = get_llm_session(url)
+    async with session.post(url, json=data, headers=headers, timeout=timeout) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise LLMAPIError(
+                f"Local LLM error: {error_text}",
+                status_code=response.status,
+                provider="local",
+            )
 
-            result = await response.json()
+        result = await response.json()
+        record_usage(parse_usage(result))
 
-            if "choices" in result and result["choices"]:
-                msg = result["choices"][0].get("message", {})
-                # Use unified response extraction
-                content = extract_response_content(msg)
-                # Clean thinking tags using unified utility
-                content = clean_thinking_tags(content)
-                return content
+        if "choices" in result and result["choices"]:
+            msg = result["choices"][0].get("message", {})
+            # Use unified response extraction
+            content = extract_response_content(msg)
+            # Clean thinking tags using unified utility
+            content = clean_thinking_tags(content)
+            return content
 
-            return ""
+        return ""
 
 
 async def stream(
@@ -172,75 +176,81 @@ async def stream(
     timeout = aiohttp.ClientTimeout(total=kwargs.get("timeout", DEFAULT_TIMEOUT))
 
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=data, headers=headers) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise LLMAPIError(
-                        f"Local LLM stream error: {error_text}",
-                        status_code=response.status,
-                        provider="local",
-                    )
-
-                # Track if we're inside a thinking block
-                in_thinking_block = False
-                thinking_buffer = ""
-
-                async for line in response.content:
-                    line_str = line.decode("utf-8").strip()
-
-                    # Skip empty lines
-                    if not line_str:
-                        continue
-
-                    # Handle SSE format
-                    if line_str.startswith("data:"):
-                        data_str = line_str[5:].strip()
-
-                        if data_str == "[DONE]":
-                            break
-
-                        try:
-                            chunk_data = json.loads(data_str)
-                            if "choices" in chunk_data and chunk_data["choices"]:
-                                delta = chunk_data["choices"][0].get("delta", {})
-                                content = delta.get("content")
-
-                                if content:
-                                    # Handle thinking tags in streaming
-                                    if "<think>" in content:
-                                        in_thinking_block = True
-                                        thinking_buffer = content
-                                        continue
-                                    elif in_thinking_block:
-                                        thinking_buffer += content
-                                        if "</think>" in thinking_buffer:
-                                            # End of thinking block, clean and yield
-                                            cleaned = clean_thinking_tags(thinking_buffer)
-                                            if cleaned:
-                                                yield cleaned
-                                            in_thinking_block = False
-                                            thinking_buffer = ""
-                                        continue
-                                    else:
-                                        yield content
-
-                        except json.JSONDecodeError:
-                            # Non-JSON response, might be raw text
-                            if data_str and not data_str.startswith("{"):
-                                yield data_str
-
-                    # Some servers don't use SSE format
-                    elif line_str.startswith("{"):
-                        try:
-                            chunk_data = json.loads(line_str)
-                            if "choices" in chunk_data and chunk_data["choices"]:
-                                delta = chunk_data["choices"][0].get("delta", {})
-                                content = delta.get("content")
-                                if content:
+        session = get_llm_session(url)
+        async with session.post(url, json=data, headers=headers, timeout=timeout) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise LLMAPIError(
+                    f"Local LLM stream error: {error_text}",
+                    status_code=response.status,
+                    provider="local",
+                )
+
+            # Track if we're inside a thinking block
+            in_thinking_block = False
+            thinking_buffer = ""
+            usage = None
+
+            async for line in response.content:
+                line_str = line.decode("utf-8").strip()
+
+                # Skip empty lines
+                if not line_str:
+                    continue
+
+                # Handle SSE format
+                if line_str.startswith("data:"):
+                    data_str = line_str[5:].strip()
+
+                    if data_str == "[DONE]":
+                        break
+
+                    try:
+                        chunk_data = json.loads(data_str)
+                        usage = parse_usage(chunk_data) or usage
+                        if "choices" in chunk_data and chunk_data["choices"]:
+                            delta = chunk_data["choices"][0].get("delta", {})
+                            content = delta.get("content")
+
+                            if content:
+                                # Handle thinking tags in streaming
+                                if "<think>" in content:
+                                    in_thinking_block = True
+                                    thinking_buffer = content
+                                    continue
+                                elif in_thinking_block:
+                                    thinking_buffer += content
+                                    if "</think>" in thinking_buffer:
+                                        # End of thinking block, clean and yield
+                                        cleaned = clean_thinking_tags(thinking_buffer)
+                                        if cleaned:
+                                            yield cleaned
+                                        in_thinking_block = False
+                                        thinking_buffer = ""
+                                    continue
+                                else:
                                     yield content
-                        except json.JSONDecodeError:
-                            pass
+
+                    except json.JSONDecodeError:
+                        # Non-JSON response, might be raw text
+                        if data_str and not data_str.startswith("{"):
+                            yield data_str
+
+                # Some servers don't use SSE format
+                elif line_str.startswith("{"):
+                    try:
+                        chunk_data = json.loads(line_str)
+                        # Ollama native streams end with prompt_eval_count/eval_count
+                        usage = parse_usage(chunk_data) or usage
+                        if "choices" in chunk_data and chunk_data["choices"]:
+                            delta = chunk_data["choices"][0].get("delta", {})
+                            content = delta.get("content")
+                            if content:
+                                yield content
+                    except json.JSONDecodeError:
+                        pass
+
+            record_usage(usage)
 
     except LLMAPIError:
         raise  # Re-raise LLM errors as-is
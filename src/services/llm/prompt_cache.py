@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Provider Prompt Caching
+=======================
+
+Hints that let providers reuse the long, stable prefix of a prompt (YAML
+system prompts, earlier conversation turns) across the iterations of a
+solve or research loop, instead of re-processing it on every call.
+
+- Anthropic caches only what is marked: the system prompt and the
+  conversation prefix (every turn before the final user message) get
+  ``cache_control`` breakpoints
+- OpenAI caches identical prefixes automatically; requests are sent with a
+  ``prompt_cache_key`` derived from the system prompt so calls sharing it
+  are routed to the same cache, and system messages are kept first
+  (``system_first``) so the stable part really is the prefix. The key is
+  only sent to OpenAI/Azure endpoints: other OpenAI-compatible servers
+  share the "openai" binding and may reject unknown parameters
+
+Cache read/write token counts come back in the usage block (see usage.py).
+
+Configuration (environment):
+    LLM_PROMPT_CACHE   Send prompt-caching hints (default: true); a call can
+                       override it with ``prompt_cache=True/False``
+"""
+
+import copy
+import hashlib
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .capabilities import get_capability
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Hosts that accept prompt_cache_key (suffix match)
+PROMPT_CACHE_KEY_HOSTS = ("api.openai.com", ".openai.azure.com")
+
+
+def prompt_cache_enabled(override: Optional[bool] = None) -> bool:
+    """
+    Decide whether prompt-caching hints are sent.
+
+    Args:
+        override: Per-call setting, or None for LLM_PROMPT_CACHE
+
+    Returns:
+        True if hints should be added to the request
+    """
+    if override is not None:
+        return override
+    return os.getenv("LLM_PROMPT_CACHE", "true").lower() in ("true", "1", "yes")
+
+
+def system_first(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Move system messages ahead of the conversation, keeping relative order.
+
+    Args:
+        messages: Chat messages
+
+    Returns:
+        Messages with every system message first
+    """
+    system = [m for m in messages if m.get("role") == "system"]
+    if not system or messages[: len(system)] == system:
+        return messages
+    return system + [m for m in messages if m.get("role") != "system"]
+
+
+def prompt_cache_key(
+    binding: str, model: str, system_content: Any, base_url: Optional[str] = None
+) -> Optional[str]:
+    """
+    Routing key for providers with automatic prefix caching.
+
+    Args:
+        binding: Provider binding
+        model: Model name
+        system_content: System prompt of the request
+        base_url: Endpoint the request is sent to
+
+    Returns:
+        Short digest of the system prompt, or None if the endpoint takes no key
+    """
+    if not system_content or not get_capability(binding, "supports_prompt_cache_key", model):
+        return None
+    host = (urlparse(base_url or "").hostname or "").lower()
+    if not any(host == h.lstrip(".") or host.endswith(h) for h in PROMPT_CACHE_KEY_HOSTS):
+        return None
+    text = system_content if isinstance(system_content, str) else repr(system_content)
+    return hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()[:32]
+
+
+def _with_breakpoint(content: Any) -> List[Dict[str, Any]]:
+    """Turn message content into text blocks whose last block is cached."""
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = copy.deepcopy(list(content))
+    if blocks:
+        blocks[-1]["cache_control"] = CACHE_CONTROL
+    return blocks
+
+
+def anthropic_cache_blocks(
+    system_content: Any,
+    messages: List[Dict[str, Any]],
+) -> Tuple[Any, List[Dict[str, Any]]]:
+    """
+    Add Anthropic ``cache_control`` breakpoints to a request.
+
+    The system prompt is cached, and so is the conversation up to (but not
+    including) the final message, which is the part that changes per call.
+
+    Args:
+        system_content: Value of the "system" request field
+        messages: Non-system messages
+
+    Returns:
+        (system, messages) ready for the request body
+    """
+    system = _with_breakpoint(system_content) if system_content else system_content
+
+    messages = list(messages)
+    if len(messages) > 1 and messages[-2].get("content"):
+        prefix_end = dict(messages[-2])
+        prefix_end["content"] = _with_breakpoint(prefix_end["content"])
+        messages[-2] = prefix_end
+    return system, messages
+
+
+__all__ = [
+    "prompt_cache_enabled",
+    "system_first",
+    "prompt_cache_key",
+    "anthropic_cache_blocks",
+]
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Response Cache
+==================
+
+Reuses completions for repeated prompts so deterministic calls (JSON
+extraction, relevance analysis, numbered-item extraction) are not billed
+again when a KB or question set is regenerated.
+
+Tiers:
+- Exact: key = sha256 over (binding, base_url, model, messages,
+  temperature, response_format, token limit, every other request parameter
+  such as tools/stop/seed/top_p)
+- Semantic (optional): cosine similarity between prompt embeddings, only
+  among entries with the same endpoint, model, request parameters and
+  system prompt
+
+Entries expire after a TTL and the oldest are evicted once the cache holds
+``max_entries``. ``factory.complete`` consults the cache when a call opts in
+(``cache=True``) or, by default, when it runs at temperature 0.
+
+Configuration (environment):
+    LLM_RESPONSE_CACHE_ENABLED       Enable the cache (default: true)
+    LLM_RESPONSE_CACHE_TTL           Entry lifetime in seconds (default: 86400)
+    LLM_RESPONSE_CACHE_MAX_ENTRIES   Entries kept before eviction (default: 2000)
+    LLM_RESPONSE_CACHE_SEMANTIC      Enable the embedding tier (default: false)
+    LLM_RESPONSE_CACHE_SIMILARITY    Minimum cosine similarity (default: 0.97)
+"""
+
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.logging.logger import get_logger
+
+logger = get_logger("LLMResponseCache")
+
+DEFAULT_TTL = 86400
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_SIMILARITY = 0.97
+
+# Whether the most recent factory.complete() in this context was a cache hit
+_last_hit: ContextVar[bool] = ContextVar("llm_response_cache_last_hit", default=False)
+
+
+@dataclass
+class _Entry:
+    response: str
+    expires_at: float
+    scope: str
+    embedding: Optional[np.ndarray] = None
+
+
+def make_cache_scope(
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    binding: Optional[str] = None,
+    base_url: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build the semantic-tier scope: the settings two prompts must share before
+    their texts are compared.
+
+    Args:
+        model: Model name
+        messages: Full chat messages (only system messages are used)
+        temperature: Sampling temperature
+        response_format: Requested response format
+        binding: Provider binding
+        base_url: Endpoint the request is sent to
+        params: Remaining request parameters (tools, tool_choice, stop, seed, ...)
+
+    Returns:
+        Hex digest
+    """
+    system = [m.get("content") for m in messages if m.get("role") == "system"]
+    payload = [binding, base_url, model, temperature, response_format, params or {}, system]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    binding: Optional[str] = None,
+    base_url: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    Build the exact-match key of one completion request.
+
+    Args:
+        model: Model name
+        messages: Full chat messages (system + history + user)
+        temperature: Sampling temperature
+        response_format: Requested response format
+        binding: Provider binding
+        base_url: Endpoint the request is sent to (routed tiers may serve the
+            same model name from another endpoint)
+        params: Remaining request parameters (tools, tool_choice, stop, seed, ...)
+        max_tokens: Token limit (a shorter limit can truncate the answer)
+
+    Returns:
+        Hex digest
+    """
+    payload = [
+        binding,
+        base_url,
+        model,
+        messages,
+        temperature,
+        response_format,
+        params or {},
+        max_tokens,
+    ]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    In-memory exact (+ optional semantic) cache of LLM completions.
+
+    Subclass and override ``get``/``put`` to back the cache with another
+    store; install it with ``set_response_cache``.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        semantic: bool = False,
+        similarity_threshold: float = DEFAULT_SIMILARITY,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Entry lifetime in seconds
+            max_entries: Entries kept before the oldest are evicted
+            semantic: Also match prompts by embedding similarity
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.semantic = semantic
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(
+        self,
+        key: str,
+        scope: str,
+        prompt_text: str,
+    ) -> Optional[str]:
+        """
+        Look up a response, exact key first and then by similarity.
+
+        Args:
+            key: Exact key from make_cache_key()
+            scope: Settings scope for the semantic tier
+            prompt_text: Text embedded for the semantic tier
+
+        Returns:
+            Cached response, or None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.response
+            if entry is not None:
+                del self._entries[key]
+
+        if self.semantic:
+            embedding = await self._embed(prompt_text)
+            if embedding is not None:
+                response = self._nearest(scope, embedding, now)
+                if response is not None:
+                    with self._lock:
+                        self.semantic_hits += 1
+                    return response
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    async def put(self, key: str, scope: str, prompt_text: str, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Exact key from make_cache_key()
+            scope: Settings scope for the semantic tier
+            prompt_text: Text embedded for the semantic tier
+            response: Completion text
+        """
+        embedding = await self._embed(prompt_text) if self.semantic else None
+        with self._lock:
+            self._entries[key] = _Entry(
+                response=response,
+                expires_at=time.time() + self.ttl,
+                scope=scope,
+                embedding=embedding,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters and current occupancy."""
+        with self._lock:
+            hits = self.hits + self.semantic_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "semantic": self.semantic,
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def _nearest(self, scope: str, embedding: np.ndarray, now: float) -> Optional[str]:
+        with self._lock:
+            candidates = [
+                e
+                for e in self._entries.values()
+                if e.scope == scope and e.embedding is not None and e.expires_at > now
+            ]
+        if not candidates:
+            return None
+        matrix = np.stack([e.embedding for e in candidates])
+        similarities = matrix @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.similarity_threshold:
+            return candidates[best].response
+        return None
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        try:
+            from src.services.embedding import get_embedding_client
+
+            vector = np.asarray((await get_embedding_client().embed([text]))[0], dtype=np.float32)
+        except Exception as e:
+            logger.debug(f"Semantic cache lookup skipped: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+
+def should_cache(cache: Optional[bool], temperature: Optional[float]) -> bool:
+    """
+    Decide whether a completion goes through the response cache.
+
+    Args:
+        cache: Per-call override (True/False), or None for the default policy
+        temperature: Sampling temperature of the call
+
+    Returns:
+        True if the cache should be consulted and filled
+    """
+    if get_response_cache() is None:
+        return False
+    if cache is not None:
+        return cache
+    return temperature is not None and temperature == 0
+
+
+def was_cache_hit() -> bool:
+    """True if the last factory.complete() awaited in this context hit the cache."""
+    return _last_hit.get()
+
+
+def mark_cache_hit(hit: bool) -> None:
+    """Record the cache outcome of the current factory.complete() call."""
+    _last_hit.set(hit)
+
+
+# Singleton instance
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get or create the process-wide LLM response cache.
+
+    Returns:
+        LLMResponseCache instance, or None if LLM_RESPONSE_CACHE_ENABLED is off
+    """
+    global _cache
+    if os.getenv("LLM_RESPONSE_CACHE_ENABLED", "true").lower() not in ("true", "1", "yes"):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(
+                    ttl=float(os.getenv("LLM_RESPONSE_CACHE_TTL", DEFAULT_TTL)),
+                    max_entries=int(
+                        os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+                    ),
+                    semantic=os.getenv("LLM_RESPONSE_CACHE_SEMANTIC", "false").lower()
+                    in ("true", "1", "yes"),
+                    similarity_threshold=float(
+                        os.getenv("LLM_RESPONSE_CACHE_SIMILARITY", DEFAULT_SIMILARITY)
+                    ),
+                )
+    return _cache
+
+
+def set_response_cache(cache: Optional[LLMResponseCache]) -> None:
+    """Install a custom response cache implementation."""
+    global _cache
+    _cache = cache
+
+
+def reset_response_cache():
+    """Reset the singleton LLM response cache."""
+    global _cache
+    _cache = None
+
+
+__all__ = [
+    "LLMResponseCache",
+    "make_cache_key",
+    "make_cache_scope",
+    "should_cache",
+    "was_cache_hit",
+    "get_response_cache",
+    "set_response_cache",
+    "reset_response_cache",
+]
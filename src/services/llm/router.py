@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Model Routing
+=============
+
+Sends lightweight agent stages (deduplication, query rephrasing, tool-result
+summaries, precision answers) to a cheaper/faster model tier, while the
+reasoning-heavy stages keep the primary model.
+
+- Stages are the ``stage=`` labels passed to ``BaseAgent.call_llm``; the
+  ``model_routing`` section of config/agents.yaml maps them to tiers, and
+  a ``"module.stage"`` entry overrides ``"stage"`` for one module
+- A tier without a model is disabled, so routing is opt-in
+- ``BaseAgent.call_llm`` retries a failed routed call once on the primary
+  model
+- Per-stage latency, tokens, cost and fallbacks are kept for the metrics
+  endpoint
+
+Configuration (environment):
+    LLM_MODEL_TIER_<TIER>   Model of a tier, overriding agents.yaml
+                            (e.g. LLM_MODEL_TIER_FAST=gpt-4o-mini)
+"""
+
+from dataclasses import dataclass
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from src.logging.logger import get_logger
+
+from .usage import LLMUsage
+
+logger = get_logger("ModelRouter")
+
+
+@dataclass
+class ModelRoute:
+    """Model settings of the tier a stage is routed to."""
+
+    tier: str
+    model: str
+    # None keeps the agent's own binding / endpoint / key
+    binding: Optional[str] = None
+    base_url: Optional[str] = None
+    api_key: Optional[str] = None
+
+
+class ModelRouter:
+    """
+    Maps agent stages to model tiers and keeps per-stage telemetry.
+    """
+
+    def __init__(
+        self,
+        tiers: Optional[Dict[str, Dict[str, Any]]] = None,
+        stages: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            tiers: Tier name -> {model, binding, base_url, api_key_env}
+            stages: Stage label (or "module.stage") -> tier name
+        """
+        self.tiers = tiers or {}
+        self.stages = stages or {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, stage: Optional[str], module: Optional[str] = None) -> Optional[ModelRoute]:
+        """
+        Find the tier model for a stage.
+
+        Args:
+            stage: Stage label of the call
+            module: Module of the calling agent (solve, research, ...)
+
+        Returns:
+            ModelRoute, or None if the stage uses the primary model
+        """
+        if not stage:
+            return None
+        tier = self.stages.get(f"{module}.{stage}") if module else None
+        tier = tier or self.stages.get(stage)
+        if not tier:
+            return None
+
+        settings = self.tiers.get(tier) or {}
+        model = os.getenv(f"LLM_MODEL_TIER_{tier.upper()}") or settings.get("model")
+        if not model:
+            return None
+
+        api_key_env = settings.get("api_key_env")
+        return ModelRoute(
+            tier=tier,
+            model=model,
+            binding=settings.get("binding") or None,
+            base_url=settings.get("base_url") or None,
+            api_key=os.getenv(api_key_env) if api_key_env else None,
+        )
+
+    def record(
+        self,
+        stage: str,
+        tier: str,
+        model: str,
+        duration: float,
+        usage: Optional[LLMUsage] = None,
+        ok: bool = True,
+        fallback: bool = False,
+    ) -> None:
+        """
+        Record one call of a stage.
+
+        Args:
+            stage: Stage label
+            tier: Tier that served the call ("primary" for the default model)
+            model: Model that served the call
+            duration: Call latency in seconds
+            usage: Token usage of the call, if known
+            ok: Whether the call succeeded
+            fallback: Whether a routed call failed and the primary model took over
+        """
+        cost = 0.0
+        if usage is not None:
+            # Import here to avoid circular imports
+            from src.logging.stats import get_pricing
+
+            pricing = get_pricing(model)
+            cost = (usage.prompt_tokens / 1000.0) * pricing["input"] + (
+                usage.completion_tokens / 1000.0
+            ) * pricing["output"]
+
+        with self._lock:
+            entry = self._stats.setdefault(
+                f"{stage}:{tier}",
+                {
+                    "stage": stage,
+                    "tier": tier,
+                    "model": model,
+                    "calls": 0,
+                    "failures": 0,
+                    "fallbacks": 0,
+                    "total_latency": 0.0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "cost_usd": 0.0,
+                },
+            )
+            entry["model"] = model
+            entry["calls"] += 1
+            entry["failures"] += 0 if ok else 1
+            entry["fallbacks"] += 1 if fallback else 0
+            entry["total_latency"] += duration
+            if usage is not None:
+                entry["prompt_tokens"] += usage.prompt_tokens
+                entry["completion_tokens"] += usage.completion_tokens
+            entry["cost_usd"] += cost
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the routing table and per-stage counters."""
+        with self._lock:
+            stages = {
+                key: {
+                    **entry,
+                    "avg_latency": entry["total_latency"] / entry["calls"]
+                    if entry["calls"]
+                    else 0.0,
+                }
+                for key, entry in self._stats.items()
+            }
+        return {"routes": dict(self.stages), "stages": stages}
+
+
+# Singleton instance
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """
+    Get or create the process-wide model router from config/agents.yaml.
+
+    Returns:
+        ModelRouter instance
+    """
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                # Import here to avoid circular imports
+                from src.services.config import get_model_routing_config
+
+                routing = get_model_routing_config()
+                _router = ModelRouter(tiers=routing["tiers"], stages=routing["stages"])
+                if _router.stages:
+                    logger.debug(f"Model routing loaded for {len(_router.stages)} stages")
+    return _router
+
+
+def reset_model_router():
+    """Reset the singleton model router (reloads the routing table)."""
+    global _router
+    _router = None
+
+
+__all__ = [
+    "ModelRoute",
+    "ModelRouter",
+    "get_model_router",
+    "reset_model_router",
+]
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Request Scheduler
+=====================
+
+Central admission control for every LLM request, so concurrent chat, solve,
+research and KB-indexing work share provider quotas instead of tripping
+429 storms and long retry backoffs.
+
+Per (binding, model) "lane":
+- Requests-per-minute and tokens-per-minute token buckets
+- A cap on in-flight requests
+- Priority classes: INTERACTIVE (chat, guided learning) before NORMAL
+  (solve, question, research) before BACKGROUND (KB indexing)
+- Fair queuing: within a priority class, waiting sessions take turns
+- A 429 pauses the lane for the provider's retry-after instead of letting
+  every queued request hit the limit again
+
+Priority and session are read from context variables, so a websocket
+handler or background task sets them once with ``set_llm_context`` and all
+LLM calls made beneath it inherit them.
+
+Configuration (environment):
+    LLM_RPM_LIMIT          Requests per minute per lane (default: 0 = unlimited)
+    LLM_TPM_LIMIT          Tokens per minute per lane (default: 0 = unlimited)
+    LLM_MAX_CONCURRENCY    In-flight requests per lane (default: 16)
+    LLM_RATE_LIMITS        JSON overrides per "binding/model", e.g.
+                           {"openai/gpt-4o": {"rpm": 500, "tpm": 30000, "max_concurrency": 8}}
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.logging.logger import get_logger
+
+logger = get_logger("LLMScheduler")
+
+DEFAULT_MAX_CONCURRENCY = 16
+# Pause applied after a 429 that carries no retry-after hint
+DEFAULT_RATE_LIMIT_PAUSE = 5.0
+# Longest a queued request sleeps before re-checking budgets
+POLL_INTERVAL = 1.0
+
+
+class Priority(IntEnum):
+    """Scheduling class of an LLM request (lower runs first)."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.NORMAL)
+_session: ContextVar[str] = ContextVar("llm_session", default="default")
+
+
+def set_llm_context(priority: Optional[Priority] = None, session_id: Optional[str] = None) -> None:
+    """
+    Set the priority class and session for LLM calls made in this context.
+
+    Tasks created afterwards inherit the values.
+
+    Args:
+        priority: Scheduling class
+        session_id: Session used for fair queuing
+    """
+    if priority is not None:
+        _priority.set(Priority(priority))
+    if session_id is not None:
+        _session.set(str(session_id))
+
+
+def get_llm_session() -> str:
+    """Session set with ``set_llm_context`` for this context ("default" if none)."""
+    return _session.get()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of text (about 4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class _Bucket:
+    """Token bucket refilled continuously at ``per_minute`` per minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if available now)."""
+        self._refill(now)
+        # A request larger than the bucket waits for a full bucket
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+    def give_back(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    tokens: int
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+class _Lane:
+    """Queues and budgets of one (binding, model)."""
+
+    def __init__(self, rpm: int, tpm: int, max_concurrency: int):
+        self.rpm = _Bucket(rpm) if rpm > 0 else None
+        self.tpm = _Bucket(tpm) if tpm > 0 else None
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.paused_until = 0.0
+        # priority -> session -> waiters; sessions rotate for fairness
+        self.queues: Dict[Priority, "OrderedDict[str, Deque[_Waiter]]"] = {
+            p: OrderedDict() for p in Priority
+        }
+        self.granted = 0
+        self.rate_limited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def depth(self) -> Dict[str, int]:
+        return {
+            p.name.lower(): sum(
+                1 for q in self.queues[p].values() for w in q if not w.future.done()
+            )
+            for p in Priority
+        }
+
+    def next_waiter(self) -> Optional[Tuple[Priority, str, _Waiter]]:
+        for priority in Priority:
+            sessions = self.queues[priority]
+            while sessions:
+                session, waiters = next(iter(sessions.items()))
+                while waiters and waiters[0].future.done():
+                    waiters.popleft()  # Cancelled while queued
+                if waiters:
+                    return priority, session, waiters[0]
+                del sessions[session]
+        return None
+
+    def admission_delay(self, tokens: int, now: float) -> float:
+        """Seconds before a request of ``tokens`` may start (0 = now)."""
+        delay = max(0.0, self.paused_until - now)
+        if self.rpm is not None:
+            delay = max(delay, self.rpm.wait_time(1, now))
+        if self.tpm is not None:
+            delay = max(delay, self.tpm.wait_time(tokens, now))
+        return delay
+
+
+class LLMScheduler:
+    """
+    Admission control for LLM requests across every lane.
+    """
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        tpm: int = 0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        overrides: Optional[Dict[str, Dict[str, int]]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            rpm: Default requests-per-minute budget per lane (0 = unlimited)
+            tpm: Default tokens-per-minute budget per lane (0 = unlimited)
+            max_concurrency: Default in-flight request cap per lane
+            overrides: "binding/model" -> {"rpm", "tpm", "max_concurrency"}
+        """
+        self.defaults = {"rpm": rpm, "tpm": tpm, "max_concurrency": max_concurrency}
+        self.overrides = overrides or {}
+        self._lanes: Dict[str, _Lane] = {}
+        self._lock = threading.Lock()
+
+    def _lane(self, name: str) -> _Lane:
+        lane = self._lanes.get(name)
+        if lane is None:
+            settings = {**self.defaults, **self.overrides.get(name, {})}
+            lane = _Lane(
+                rpm=int(settings["rpm"]),
+                tpm=int(settings["tpm"]),
+                max_concurrency=max(1, int(settings["max_concurrency"])),
+            )
+            self._lanes[name] = lane
+        return lane
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        binding: Optional[str],
+        model: Optional[str],
+        tokens: int = 1,
+        priority: Optional[Priority] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[Callable[[int], None]]:
+        """
+        Wait for permission to send one request.
+
+        Args:
+            binding: Provider binding
+            model: Model name
+            tokens: Estimated prompt + completion tokens
+            priority: Scheduling class (default: from set_llm_context)
+            session_id: Fair-queuing session (default: from set_llm_context)
+
+        Yields:
+            ``settle(actual_tokens)``, which returns unused token budget once
+            the real usage is known
+        """
+        name = f"{binding or 'openai'}/{model or 'default'}"
+        priority = Priority(priority if priority is not None else _priority.get())
+        session_id = session_id or _session.get()
+        waiter = _Waiter(future=asyncio.get_running_loop().create_future(), tokens=tokens)
+
+        with self._lock:
+            lane = self._lane(name)
+            lane.queues[priority].setdefault(session_id, deque()).append(waiter)
+            delay = self._dispatch(lane)
+
+        try:
+            while not waiter.future.done():
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(waiter.future),
+                        timeout=delay if delay is not None else POLL_INTERVAL,
+                    )
+                except asyncio.TimeoutError:
+                    with self._lock:
+                        delay = self._dispatch(lane)
+        except BaseException:
+            with self._lock:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    self._release(lane)
+                else:
+                    waiter.future.cancel()
+                    self._dispatch(lane)
+            raise
+
+        reserved = tokens
+
+        def settle(actual_tokens: int) -> None:
+            nonlocal reserved
+            if lane.tpm is not None and actual_tokens < reserved:
+                with self._lock:
+                    lane.tpm.give_back(reserved - actual_tokens)
+                reserved = actual_tokens
+
+        try:
+            yield settle
+        finally:
+            with self._lock:
+                self._release(lane)
+
+    def report_rate_limit(
+        self, binding: Optional[str], model: Optional[str], retry_after: Optional[float]
+    ) -> None:
+        """
+        Pause a lane after the provider answered 429.
+
+        Args:
+            binding: Provider binding
+            model: Model name
+            retry_after: Provider hint in seconds, if any
+        """
+        pause = retry_after if retry_after else DEFAULT_RATE_LIMIT_PAUSE
+        with self._lock:
+            lane = self._lane(f"{binding or 'openai'}/{model or 'default'}")
+            lane.paused_until = max(lane.paused_until, time.monotonic() + pause)
+            lane.rate_limited += 1
+        logger.warning(f"Rate limited by {binding}/{model}, pausing lane for {pause:.1f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-lane queue depth, in-flight count and wait times."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                name: {
+                    "in_flight": lane.in_flight,
+                    "max_concurrency": lane.max_concurrency,
+                    "queue_depth": lane.depth(),
+                    "granted": lane.granted,
+                    "rate_limited": lane.rate_limited,
+                    "paused_for": max(0.0, lane.paused_until - now),
+                    "avg_wait_ms": 1000 * lane.total_wait / lane.granted if lane.granted else 0.0,
+                    "max_wait_ms": 1000 * lane.max_wait,
+                }
+                for name, lane in self._lanes.items()
+            }
+
+    def _release(self, lane: _Lane) -> None:
+        lane.in_flight -= 1
+        self._dispatch(lane)
+
+    def _dispatch(self, lane: _Lane) -> Optional[float]:
+        """
+        Grant queued requests while budget allows (caller holds the lock).
+
+        Returns:
+            Seconds until budget for the next waiter refills, or None if the
+            lane is only waiting for an in-flight request to finish
+        """
+        while lane.in_flight < lane.max_concurrency:
+            head = lane.next_waiter()
+            if head is None:
+                return None
+            priority, session, waiter = head
+
+            now = time.monotonic()
+            delay = lane.admission_delay(waiter.tokens, now)
+            if delay > 0:
+                return delay
+
+            sessions = lane.queues[priority]
+            sessions[session].popleft()
+            # Next turn goes to another session of the same class
+            sessions.move_to_end(session)
+            if not sessions[session]:
+                del sessions[session]
+
+            if lane.rpm is not None:
+                lane.rpm.take(1)
+            if lane.tpm is not None:
+                lane.tpm.take(waiter.tokens)
+            lane.in_flight += 1
+            lane.granted += 1
+            waited = now - waiter.enqueued
+            lane.total_wait += waited
+            lane.max_wait = max(lane.max_wait, waited)
+            _grant(waiter.future)
+        return None
+
+
+def _grant(future: asyncio.Future) -> None:
+    """Resolve a waiter from whichever thread/event loop runs the dispatch."""
+
+    def _set():
+        if not future.done():
+            future.set_result(True)
+
+    loop = future.get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        _set()
+    else:
+        loop.call_soon_threadsafe(_set)
+
+
+def governed(binding: Optional[str], model: Optional[str]) -> Callable:
+    """
+    Decorate an async LLM function (e.g. a LightRAG model func) so every call
+    waits for a scheduler slot.
+
+    Args:
+        binding: Provider binding
+        model: Model name
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(prompt: str = "", *args: Any, **kwargs: Any) -> Any:
+            texts: List[str] = [prompt or "", kwargs.get("system_prompt") or ""]
+            texts += [str(m.get("content", "")) for m in kwargs.get("history_messages") or []]
+            texts += [str(m.get("content", "")) for m in kwargs.get("messages") or []]
+            tokens = sum(estimate_tokens(t) for t in texts) + int(kwargs.get("max_tokens") or 0)
+            async with get_llm_scheduler().slot(binding, model, tokens=tokens):
+                return await func(prompt, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Singleton instance
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """
+    Get or create the process-wide LLM scheduler.
+
+    Returns:
+        LLMScheduler configured from LLM_RPM_LIMIT, LLM_TPM_LIMIT,
+        LLM_MAX_CONCURRENCY and LLM_RATE_LIMITS
+    """
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                try:
+                    overrides = json.loads(os.getenv("LLM_RATE_LIMITS") or "{}")
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Ignoring invalid LLM_RATE_LIMITS: {e}")
+                    overrides = {}
+                _scheduler = LLMScheduler(
+                    rpm=int(os.getenv("LLM_RPM_LIMIT", 0)),
+                    tpm=int(os.getenv("LLM_TPM_LIMIT", 0)),
+                    max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+                    overrides=overrides,
+                )
+    return _scheduler
+
+
+def reset_llm_scheduler():
+    """Reset the singleton LLM scheduler."""
+    global _scheduler
+    _scheduler = None
+
+
+__all__ = [
+    "Priority",
+    "LLMScheduler",
+    "set_llm_context",
+    "get_llm_session",
+    "estimate_tokens",
+    "governed",
+    "get_llm_scheduler",
+    "reset_llm_scheduler",
+]
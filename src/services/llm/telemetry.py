@@ -3,15 +3,22 @@
 LLM Telemetry
 =============
 
-Basic telemetry tracking for LLM calls.
+Basic telemetry tracking for LLM calls, plus first-token and inter-token
+latency of every stream (see StreamTimer / stream_stats).
 """
 
+from collections import deque
 import functools
 import logging
-from typing import Any, Callable
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Recent streams kept per (binding, model) for latency percentiles
+STREAM_WINDOW = 1000
+
 
 def track_llm_call(provider_name: str):
     """
@@ -39,3 +46,108 @@ def track_llm_call(provider_name: str):
         return wrapper
 
     return decorator
+
+
+class StreamTimer:
+    """
+    Latency of one streamed response.
+
+    Call ``tick()`` for every chunk delivered to the caller and ``finish()``
+    once the stream ends.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the timer.
+
+        Args:
+            name: Stream lane, e.g. "openai/gpt-4o"
+        """
+        self.name = name
+        self.started = time.monotonic()
+        self.first_token: Optional[float] = None
+        self.gaps: List[float] = []
+        self._last: Optional[float] = None
+        self.resumes = 0
+
+    def tick(self) -> None:
+        """Record delivery of one chunk."""
+        now = time.monotonic()
+        if self.first_token is None:
+            self.first_token = now - self.started
+        else:
+            self.gaps.append(now - self._last)
+        self._last = now
+
+    def finish(self, interrupted: bool = False) -> None:
+        """Fold this stream into the process-wide stream statistics."""
+        _record_stream(self, interrupted)
+        if self.first_token is not None:
+            mean_gap = sum(self.gaps) / len(self.gaps) if self.gaps else 0.0
+            logger.debug(
+                f"Stream {self.name}: first token {self.first_token * 1000:.0f}ms, "
+                f"{len(self.gaps) + 1} chunks, mean gap {mean_gap * 1000:.1f}ms"
+            )
+
+
+class _StreamLane:
+    def __init__(self):
+        self.streams = 0
+        self.interrupted = 0
+        self.resumes = 0
+        self.first_token: Deque[float] = deque(maxlen=STREAM_WINDOW)
+        self.mean_gap: Deque[float] = deque(maxlen=STREAM_WINDOW)
+        self.max_gap: Deque[float] = deque(maxlen=STREAM_WINDOW)
+
+
+_stream_lanes: Dict[str, _StreamLane] = {}
+_stream_lock = threading.Lock()
+
+
+def _record_stream(timer: StreamTimer, interrupted: bool) -> None:
+    with _stream_lock:
+        lane = _stream_lanes.setdefault(timer.name, _StreamLane())
+        lane.streams += 1
+        lane.interrupted += int(interrupted)
+        lane.resumes += timer.resumes
+        if timer.first_token is not None:
+            lane.first_token.append(timer.first_token)
+        if timer.gaps:
+            lane.mean_gap.append(sum(timer.gaps) / len(timer.gaps))
+            lane.max_gap.append(max(timer.gaps))
+
+
+def _percentile(values: Deque[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def stream_stats() -> Dict[str, Any]:
+    """
+    Per-lane streaming latency over the most recent streams.
+
+    Returns:
+        "binding/model" -> counts and first-token / inter-token latency (ms)
+    """
+    with _stream_lock:
+        return {
+            name: {
+                "streams": lane.streams,
+                "interrupted": lane.interrupted,
+                "resumes": lane.resumes,
+                "first_token_ms_p50": 1000 * _percentile(lane.first_token, 0.5),
+                "first_token_ms_p95": 1000 * _percentile(lane.first_token, 0.95),
+                "inter_token_ms_p50": 1000 * _percentile(lane.mean_gap, 0.5),
+                "inter_token_ms_p95": 1000 * _percentile(lane.mean_gap, 0.95),
+                "max_gap_ms_p95": 1000 * _percentile(lane.max_gap, 0.95),
+            }
+            for name, lane in _stream_lanes.items()
+        }
+
+
+def reset_stream_stats() -> None:
+    """Clear the streaming latency statistics."""
+    with _stream_lock:
+        _stream_lanes.clear()
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Token Counting Service
+======================
+
+One place to count tokens for prompts, history turns and documents, so
+callers stop creating a fresh tiktoken encoding (and re-encoding the same
+system prompt) on every call.
+
+- Encodings are loaded once per model (``get_encoding``); a model tiktoken
+  does not know falls back to cl100k_base
+- ``TokenCounter`` keeps an LRU of counts keyed by a digest of the text, so
+  repeated strings (system prompts, earlier history turns) are counted once
+- ``count_many`` encodes all misses with a single ``encode_batch`` call
+- ``count_async`` moves very long texts to a worker thread
+- Without tiktoken (or its encoding files) counts fall back to ~4 characters
+  per token
+
+Configuration (environment):
+    LLM_TOKEN_COUNT_CACHE_SIZE   Counts kept per model (default: 4096)
+"""
+
+import asyncio
+from collections import OrderedDict
+import functools
+import hashlib
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.logging.logger import get_logger
+
+logger = get_logger("TokenCounter")
+
+DEFAULT_ENCODING = "cl100k_base"
+DEFAULT_CACHE_SIZE = 4096
+# Texts longer than this (characters) are counted off the event loop
+OFFLOAD_THRESHOLD = 20000
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(model: Optional[str] = None) -> Optional[Any]:
+    """
+    Get the tiktoken encoding for a model, loading it at most once.
+
+    Args:
+        model: Model name; None selects cl100k_base
+
+    Returns:
+        tiktoken.Encoding, or None if tiktoken or its encoding files are
+        unavailable
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        if model:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                pass
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens from length: {e}")
+        return None
+
+
+class TokenCounter:
+    """
+    Memoizing token counter for one encoding.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        encoding: Optional[Any] = None,
+    ):
+        """
+        Initialize the counter.
+
+        Args:
+            model: Model name used to pick the encoding
+            cache_size: Number of text counts kept in the LRU
+            encoding: Explicit encoding (anything with encode/encode_batch);
+                defaults to get_encoding(model)
+        """
+        self.model = model
+        self.encoding = encoding if encoding is not None else get_encoding(model)
+        self.cache_size = cache_size
+        self._counts: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, text: str) -> int:
+        """
+        Count the tokens of one text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Token count
+        """
+        return self.count_many([text])[0]
+
+    def count_many(self, texts: Sequence[str]) -> List[int]:
+        """
+        Count the tokens of several texts, encoding the uncached ones in one batch.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Token counts aligned with texts
+        """
+        keys = [self._key(text or "") for text in texts]
+        counts: List[Optional[int]] = [None] * len(texts)
+        missing: Dict[bytes, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._counts.get(key)
+                if cached is not None:
+                    self._counts.move_to_end(key)
+                    counts[i] = cached
+                    self.hits += 1
+                else:
+                    missing.setdefault(key, []).append(i)
+            self.misses += len(missing)
+
+        if missing:
+            unique = [texts[positions[0]] or "" for positions in missing.values()]
+            measured = self._encode_lengths(unique)
+            with self._lock:
+                for (key, positions), n in zip(missing.items(), measured):
+                    for i in positions:
+                        counts[i] = n
+                    self._counts[key] = n
+                    self._counts.move_to_end(key)
+                while len(self._counts) > self.cache_size:
+                    self._counts.popitem(last=False)
+
+        return counts
+
+    async def count_async(self, text: str) -> int:
+        """
+        Count tokens, in a worker thread when the text is long.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Token count
+        """
+        if len(text) > OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(self.count, text)
+        return self.count(text)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters and the encoding in use."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "encoding": getattr(self.encoding, "name", None),
+                "entries": len(self._counts),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _encode_lengths(self, texts: List[str]) -> List[int]:
+        if self.encoding is None:
+            return [len(text) // 4 for text in texts]
+        try:
+            # Count special-token text such as "<|endoftext|>" as plain text
+            if len(texts) > 1:
+                batch = self.encoding.encode_batch(texts, disallowed_special=())
+                return [len(tokens) for tokens in batch]
+            return [len(self.encoding.encode(texts[0], disallowed_special=()))]
+        except Exception as e:
+            logger.debug(f"Token encoding failed, estimating from length: {e}")
+            return [len(text) // 4 for text in texts]
+
+
+# Counters per model
+_counters: Dict[Optional[str], TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: Optional[str] = None) -> TokenCounter:
+    """
+    Get or create the shared counter for a model.
+
+    Args:
+        model: Model name; None uses cl100k_base
+
+    Returns:
+        TokenCounter instance
+    """
+    counter = _counters.get(model)
+    if counter is None:
+        with _counters_lock:
+            counter = _counters.get(model)
+            if counter is None:
+                counter = TokenCounter(
+                    model=model,
+                    cache_size=int(os.getenv("LLM_TOKEN_COUNT_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+                )
+                _counters[model] = counter
+    return counter
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count the tokens of a text with the shared counter of ``model``.
+
+    Args:
+        text: Input text
+        model: Model name (selects the encoding)
+
+    Returns:
+        Token count
+    """
+    return get_token_counter(model).count(text)
+
+
+def token_counter_stats() -> Dict[str, Any]:
+    """
+    Counters of every shared token counter.
+
+    Returns:
+        Model name -> cache statistics
+    """
+    with _counters_lock:
+        counters = dict(_counters)
+    return {str(model or "default"): counter.stats() for model, counter in counters.items()}
+
+
+def reset_token_counters():
+    """Drop the shared counters (encodings stay loaded)."""
+    with _counters_lock:
+        _counters.clear()
+
+
+__all__ = [
+    "TokenCounter",
+    "get_encoding",
+    "get_token_counter",
+    "count_tokens",
+    "token_counter_stats",
+    "reset_token_counters",
+]
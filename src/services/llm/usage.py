@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Token Usage
+===============
+
+Token counts reported by the provider for each call, so trackers do not
+have to re-tokenize prompts and responses afterwards.
+
+Providers parse the ``usage`` block of their response (OpenAI
+``prompt_tokens``/``completion_tokens``, Anthropic ``input_tokens``/
+``output_tokens``, Ollama ``prompt_eval_count``/``eval_count``) and record
+it with ``record_usage``. ``factory.complete``/``stream`` run in the
+caller's context, so after awaiting them the caller reads the counts with
+``get_last_usage()``; concurrent tasks each see their own value.
+
+When a provider reports nothing, ``estimate_usage`` counts tokens locally;
+call it through ``asyncio.to_thread`` so tokenizing long prompts does not
+block the event loop.
+"""
+
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from .tokenizer import get_token_counter
+
+
+@dataclass
+class LLMUsage:
+    """Token usage of one LLM call."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # "api" when reported by the provider, otherwise how it was estimated
+    source: str = "api"
+    # Prompt tokens served from / written to the provider's prompt cache
+    # (both are included in prompt_tokens)
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def __add__(self, other: "LLMUsage") -> "LLMUsage":
+        return LLMUsage(
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            completion_tokens=self.completion_tokens + other.completion_tokens,
+            source=self.source if self.source == other.source else "mixed",
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
+        )
+
+    def to_token_counts(self) -> Dict[str, int]:
+        """Counts in the ``token_counts`` shape accepted by TokenTracker.add_usage."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "total_tokens": self.total_tokens}
+
+
+# Usage of the most recent provider call in this context
+_last_usage: ContextVar[Optional[LLMUsage]] = ContextVar("llm_last_usage", default=None)
+
+
+def parse_usage(payload: Optional[Dict[str, Any]]) -> Optional[LLMUsage]:
+    """
+    Extract token usage from a provider response or stream chunk.
+
+    Args:
+        payload: Decoded JSON response body or stream event
+
+    Returns:
+        LLMUsage, or None if the payload carries no usage
+    """
+    if not isinstance(payload, dict):
+        return None
+
+    # Ollama native responses report counts at the top level
+    if "prompt_eval_count" in payload or "eval_count" in payload:
+        return LLMUsage(
+            prompt_tokens=int(payload.get("prompt_eval_count") or 0),
+            completion_tokens=int(payload.get("eval_count") or 0),
+        )
+
+    usage = payload.get("usage")
+    # Anthropic stream events nest usage inside "message"
+    if not isinstance(usage, dict) and isinstance(payload.get("message"), dict):
+        usage = payload["message"].get("usage")
+    if not isinstance(usage, dict):
+        return None
+
+    if "input_tokens" in usage or "output_tokens" in usage:
+        # Anthropic: input_tokens excludes the cached part of the prompt
+        cache_read = int(usage.get("cache_read_input_tokens") or 0)
+        cache_write = int(usage.get("cache_creation_input_tokens") or 0)
+        return LLMUsage(
+            prompt_tokens=int(usage.get("input_tokens") or 0) + cache_read + cache_write,
+            completion_tokens=int(usage.get("output_tokens") or 0),
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+        )
+    if "prompt_tokens" in usage or "completion_tokens" in usage:
+        # OpenAI: prompt_tokens_details.cached_tokens; DeepSeek: prompt_cache_hit_tokens
+        details = usage.get("prompt_tokens_details") or {}
+        cache_read = details.get("cached_tokens") or usage.get("prompt_cache_hit_tokens")
+        return LLMUsage(
+            prompt_tokens=int(usage.get("prompt_tokens") or 0),
+            completion_tokens=int(usage.get("completion_tokens") or 0),
+            cache_read_tokens=int(cache_read or 0),
+        )
+    return None
+
+
+def merge_usage(current: Optional[LLMUsage], update: Optional[LLMUsage]) -> Optional[LLMUsage]:
+    """
+    Combine partial usage reports of one streamed response.
+
+    Stream events report prompt and completion counts separately (e.g.
+    Anthropic message_start / message_delta); non-zero fields of the newer
+    report win.
+    """
+    if update is None:
+        return current
+    if current is None:
+        return update
+    return LLMUsage(
+        prompt_tokens=update.prompt_tokens or current.prompt_tokens,
+        completion_tokens=update.completion_tokens or current.completion_tokens,
+        source=update.source,
+        cache_read_tokens=update.cache_read_tokens or current.cache_read_tokens,
+        cache_write_tokens=update.cache_write_tokens or current.cache_write_tokens,
+    )
+
+
+def record_usage(usage: Optional[LLMUsage]) -> None:
+    """Record the usage of the provider call that just finished (None clears it)."""
+    _last_usage.set(usage)
+
+
+def get_last_usage() -> Optional[LLMUsage]:
+    """
+    Usage reported for the last factory.complete()/stream() in this context.
+
+    Returns:
+        LLMUsage, or None if the provider did not report usage (or the
+        response came from the response cache)
+    """
+    return _last_usage.get()
+
+
+def estimate_usage(model: str, prompt_text: str, response_text: str) -> LLMUsage:
+    """
+    Count tokens locally for a call whose provider reported no usage.
+
+    Uses the shared token counter (tiktoken, ~4 characters per token without
+    it). CPU-bound on long texts: run it with ``asyncio.to_thread``.
+
+    Args:
+        model: Model name (selects the tiktoken encoding)
+        prompt_text: Full prompt text (system + user)
+        response_text: Response text
+
+    Returns:
+        Estimated LLMUsage
+    """
+    counter = get_token_counter(model)
+    prompt_tokens, completion_tokens = counter.count_many([prompt_text, response_text])
+    return LLMUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        source="tiktoken" if counter.encoding is not None else "estimated",
+    )
+
+
+__all__ = [
+    "LLMUsage",
+    "parse_usage",
+    "merge_usage",
+    "record_usage",
+    "get_last_usage",
+    "estimate_usage",
+]
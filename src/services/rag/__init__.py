@@ -38,7 +38,15 @@ Usage:
     )
 """
 
-from .factory import get_pipeline, has_pipeline, list_pipelines, register_pipeline
+from .factory import (
+    get_pipeline,
+    get_shared_pipeline,
+    has_pipeline,
+    invalidate_pipelines,
+    list_pipelines,
+    pipeline_stats,
+    register_pipeline,
+)
 from .pipeline import RAGPipeline
 from .service import RAGService
 from .types import Chunk, Document, SearchResult
@@ -78,6 +86,9 @@ __all__ = [
     "RAGPipeline",
     # Factory
     "get_pipeline",
+    "get_shared_pipeline",
+    "invalidate_pipelines",
+    "pipeline_stats",
     "list_pipelines",
     "register_pipeline",
     "has_pipeline",
@@ -5,16 +5,40 @@ Vector Indexer
 
 Vector-based indexer using dense embeddings with FAISS.
 Provides fast similarity search for RAG retrieval.
+
+The FAISS index type is configurable per KB through the ``vector_index`` entry
+of the knowledge base config, e.g. ``{"type": "hnsw", "ef_search": 128}``;
+by default it is chosen by corpus size (see utils.ann_index).
 """
 
-import json
+import asyncio
 from pathlib import Path
-import pickle
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
-from ...types import Document
+from ...types import Chunk, Document
+from ...utils.ann_index import build_ann_index, resolve_index_type, self_check
+from ...utils.index_cache import get_index_cache
+from ...utils.vector_store import (
+    STORE_FORMAT,
+    ChunkStore,
+    add_tombstones,
+    append_chunks,
+    append_embeddings,
+    compact_store,
+    find_rows,
+    is_current_format,
+    load_info,
+    load_tombstones,
+    migrate_legacy_store,
+    normalize_rows,
+    open_embeddings,
+    save_info,
+    store_lock,
+    write_chunks,
+    write_embeddings,
+)
 from ..base import BaseComponent
 
 
@@ -24,16 +48,40 @@ class VectorIndexer(BaseComponent):
 
     Creates and stores vector embeddings for efficient retrieval.
     Falls back to simple vector storage if FAISS is not available.
+
+    Large stores get an approximate (HNSW / IVF / IVF-PQ) index whose recall is
+    checked against exact search at build time.
+
+    Supports incremental updates: ``process(..., append=True)`` adds only the
+    new chunks, ``delete_documents()`` tombstones a document's chunks, and a
+    background compaction rewrites the store once enough rows are tombstoned.
     """
 
     name = "vector_indexer"
 
-    def __init__(self, kb_base_dir: Optional[str] = None):
+    # Pending background compactions, keyed by vector_store path
+    _compactions: Dict[str, asyncio.Future] = {}
+
+    def __init__(
+        self,
+        kb_base_dir: Optional[str] = None,
+        vector_dtype: str = "float32",
+        compaction_threshold: float = 0.2,
+        index_type: Optional[str] = None,
+        index_params: Optional[Dict[str, Any]] = None,
+    ):
         """
         Initialize vector indexer.
 
         Args:
             kb_base_dir: Base directory for knowledge bases
+            vector_dtype: Storage dtype for embeddings.npy ("float32" or "float16")
+            compaction_threshold: Fraction of tombstoned rows that triggers a
+                background compaction
+            index_type: FAISS index type ("auto", "flat", "ivf_flat", "hnsw",
+                "ivf_pq"). Overrides the KB config; defaults to "auto".
+            index_params: Build/search parameter overrides (nlist, nprobe, m,
+                nbits, M, ef_construction, ef_search)
         """
         super().__init__()
         self.kb_base_dir = kb_base_dir or str(
@@ -41,6 +89,10 @@ class VectorIndexer(BaseComponent):
             / "data"
             / "knowledge_bases"
         )
+        self.vector_dtype = vector_dtype
+        self.compaction_threshold = compaction_threshold
+        self.index_type = index_type
+        self.index_params = index_params
 
         # Try to import FAISS, fallback to simple storage if not available
         self.use_faiss = False
@@ -58,17 +110,24 @@ class VectorIndexer(BaseComponent):
         Index documents using vector embeddings.
 
         Creates FAISS index for fast similarity search or falls back to
-        simple JSON storage if FAISS is unavailable.
+        a memory-mapped .npy matrix if FAISS is unavailable. Chunk records
+        are stored as offset-indexed JSON lines (see utils.vector_store).
 
         Args:
             kb_name: Knowledge base name
             documents: List of documents to index
             **kwargs: Additional arguments
+                append: Add to the existing store instead of rebuilding it.
+                    Chunks of documents already in the store are replaced.
 
         Returns:
             True if successful
         """
-        self.logger.info(f"Indexing {len(documents)} documents into vector store for {kb_name}")
+        append = kwargs.get("append", False)
+        self.logger.info(
+            f"{'Appending' if append else 'Indexing'} {len(documents)} documents "
+            f"into vector store for {kb_name}"
+        )
 
         # Collect all chunks with embeddings
         all_chunks = []
@@ -76,7 +135,7 @@ class VectorIndexer(BaseComponent):
             for chunk in doc.chunks:
                 # Check if embedding exists (handles numpy arrays and lists)
                 if chunk.embedding is not None and len(chunk.embedding) > 0:
-                    all_chunks.append(chunk)
+                    all_chunks.append((self._doc_id(doc), chunk))
 
         if not all_chunks:
             self.logger.warning("No chunks with embeddings to index")
@@ -92,56 +151,289 @@ class VectorIndexer(BaseComponent):
         embeddings = np.array(
             [
                 chunk.embedding if isinstance(chunk.embedding, list) else chunk.embedding.tolist()
-                for chunk in all_chunks
+                for _, chunk in all_chunks
             ],
             dtype=np.float32,
         )
 
-        # Store metadata separately
-        metadata = []
-        for i, chunk in enumerate(all_chunks):
-            metadata.append(
-                {
-                    "id": i,
-                    "content": chunk.content,
-                    "type": chunk.chunk_type,
-                    "metadata": chunk.metadata,
-                }
+        loop = asyncio.get_running_loop()
+        if append and (kb_dir / "info.json").exists():
+            num_docs = len({doc_id for doc_id, _ in all_chunks})
+            await loop.run_in_executor(
+                None, self._append_store, kb_dir, all_chunks, embeddings, num_docs
             )
+            self._maybe_schedule_compaction(kb_dir)
+        else:
+            await loop.run_in_executor(
+                None, self._write_store, kb_dir, all_chunks, embeddings, len(documents)
+            )
+
+        # Drop any loaded copy so the next search in this process sees the new index
+        get_index_cache().invalidate(kb_dir)
+
+        self.logger.info(f"Vector index saved to {kb_dir}")
+        return True
 
-        # Save metadata
-        with open(kb_dir / "metadata.json", "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+    async def delete_documents(self, kb_name: str, doc_ids: List[str]) -> int:
+        """
+        Tombstone every chunk of the given documents.
 
-        if self.use_faiss:
-            # Create FAISS index for inner product (cosine similarity with normalized vectors)
-            dimension = embeddings.shape[1]
-            index = self.faiss.IndexFlatIP(dimension)  # Inner product for cosine similarity
+        Args:
+            kb_name: Knowledge base name
+            doc_ids: Document identifiers (source file paths used at index time)
 
-            # Normalize vectors for cosine similarity (inner product of normalized vectors = cosine similarity)
-            self.faiss.normalize_L2(embeddings)
+        Returns:
+            Number of chunks tombstoned
+        """
+        kb_dir = Path(self.kb_base_dir) / kb_name / "vector_store"
+        if not is_current_format(load_info(kb_dir)):
+            self.logger.warning(f"No current-format vector store at {kb_dir}")
+            return 0
 
-            # Add vectors to index
-            index.add(embeddings)
+        def tombstone() -> int:
+            with store_lock(kb_dir):
+                rows = find_rows(kb_dir, doc_ids)
+                if rows:
+                    add_tombstones(kb_dir, rows)
+                    info = load_info(kb_dir)
+                    info["num_documents"] = max(
+                        0, info.get("num_documents", 0) - self._count_documents(kb_dir, rows)
+                    )
+                    save_info(kb_dir, info)
+                return len(rows)
 
-            # Save FAISS index
-            self.faiss.write_index(index, str(kb_dir / "index.faiss"))
-            self.logger.info(f"FAISS index saved with {index.ntotal} vectors")
-        else:
-            # Simple storage: save embeddings as pickle
-            with open(kb_dir / "embeddings.pkl", "wb") as f:
-                pickle.dump(embeddings, f)
-            self.logger.info(f"Embeddings saved for {len(all_chunks)} chunks")
-
-        # Save index info
-        info = {
-            "num_chunks": len(all_chunks),
-            "num_documents": len(documents),
-            "embedding_dim": embeddings.shape[1],
-            "use_faiss": self.use_faiss,
+        removed = await asyncio.get_running_loop().run_in_executor(None, tombstone)
+        if removed:
+            get_index_cache().invalidate(kb_dir)
+            self._maybe_schedule_compaction(kb_dir)
+        self.logger.info(f"Tombstoned {removed} chunks from {len(doc_ids)} documents")
+        return removed
+
+    async def compact(self, kb_name: str) -> int:
+        """
+        Rewrite the store without tombstoned rows, waiting for completion.
+
+        Args:
+            kb_name: Knowledge base name
+
+        Returns:
+            Number of rows removed
+        """
+        kb_dir = Path(self.kb_base_dir) / kb_name / "vector_store"
+        return await asyncio.get_running_loop().run_in_executor(None, self._compact_store, kb_dir)
+
+    @staticmethod
+    def _doc_id(doc: Document) -> str:
+        """Stable identifier used to find a document's chunks again."""
+        return doc.file_path or doc.metadata.get("filename", "")
+
+    @staticmethod
+    def _count_documents(kb_dir: Path, rows: List[int]) -> int:
+        """Number of distinct documents the given rows belong to."""
+        if not rows:
+            return 0
+        return len({record.get("doc_id") for record in ChunkStore(kb_dir).get_many(rows)})
+
+    @staticmethod
+    def _chunk_record(row_id: int, doc_id: str, chunk: Chunk) -> dict:
+        return {
+            "id": row_id,
+            "doc_id": doc_id,
+            "content": chunk.content,
+            "type": chunk.chunk_type,
+            "metadata": chunk.metadata,
         }
-        with open(kb_dir / "info.json", "w", encoding="utf-8") as f:
-            json.dump(info, f, indent=2)
 
-        self.logger.info(f"Vector index saved to {kb_dir}")
-        return True
+    def _index_settings(self, kb_dir: Path) -> Dict[str, Any]:
+        """
+        Resolve the configured index type and parameters for a store.
+
+        Constructor arguments take precedence over the KB's ``vector_index``
+        config entry.
+        """
+        settings: Dict[str, Any] = {}
+        try:
+            from src.services.config import get_kb_config_service
+
+            settings = dict(
+                get_kb_config_service().get_kb_config(kb_dir.parent.name).get("vector_index") or {}
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not read vector index config: {e}")
+
+        configured_type = settings.pop("type", None)
+        index_type = self.index_type or configured_type or "auto"
+        return {"type": index_type, "params": {**settings, **(self.index_params or {})}}
+
+    def _build_faiss_index(self, kb_dir: Path, vectors: np.ndarray) -> Dict[str, Any]:
+        """
+        Build, self-check and save a FAISS index from normalized vectors.
+
+        Args:
+            kb_dir: Path to the KB's vector_store directory
+            vectors: L2-normalized (N, D) float32 matrix
+
+        Returns:
+            info.json entries describing the index (type, tuned parameters and
+            the recall/latency self-check report)
+        """
+        settings = self._index_settings(kb_dir)
+        # Inner product of normalized vectors = cosine similarity
+        index, index_type, params = build_ann_index(
+            vectors, index_type=settings["type"], params=settings["params"]
+        )
+        report = self_check(index, vectors, index_type, params)
+        self.faiss.write_index(index, str(kb_dir / "index.faiss"))
+        self.logger.info(
+            f"FAISS {index_type} index saved with {index.ntotal} vectors "
+            f"(recall@{report['k']}={report['recall']}, "
+            f"{report['ann_ms_per_query']} ms/query vs {report['exact_ms_per_query']} ms exact)"
+        )
+        return {"index_type": index_type, "index_params": params, "index_self_check": report}
+
+    def _write_store(self, kb_dir: Path, all_chunks, embeddings: np.ndarray, num_documents: int):
+        """Write a complete store from scratch (runs in an executor thread)."""
+        with store_lock(kb_dir):
+            # Store chunk records separately (offset-indexed JSON lines)
+            num_records = write_chunks(
+                kb_dir,
+                (
+                    self._chunk_record(i, doc_id, chunk)
+                    for i, (doc_id, chunk) in enumerate(all_chunks)
+                ),
+            )
+
+            # Canonical pre-normalized matrix, memory-mapped at query time
+            write_embeddings(kb_dir, embeddings, dtype=self.vector_dtype)
+            index_info = {}
+            if self.use_faiss:
+                index_info = self._build_faiss_index(kb_dir, normalize_rows(embeddings))
+            else:
+                (kb_dir / "index.faiss").unlink(missing_ok=True)
+            self.logger.info(f"Embeddings saved for {num_records} chunks")
+
+            # Save index info last so readers never see it ahead of the data files
+            info = {
+                "format": STORE_FORMAT,
+                "num_chunks": num_records,
+                "num_documents": num_documents,
+                "embedding_dim": embeddings.shape[1],
+                "use_faiss": self.use_faiss,
+                "normalized": True,
+                "dtype": self.vector_dtype,
+                **index_info,
+            }
+            (kb_dir / "tombstones.json").unlink(missing_ok=True)
+            save_info(kb_dir, info)
+
+            # Remove files from the legacy layout so they are not mistaken for current data
+            for legacy_name in ("metadata.json", "embeddings.pkl"):
+                (kb_dir / legacy_name).unlink(missing_ok=True)
+
+    def _append_store(self, kb_dir: Path, all_chunks, embeddings: np.ndarray, num_documents: int):
+        """Append chunks to an existing store (runs in an executor thread)."""
+        with store_lock(kb_dir):
+            info = load_info(kb_dir)
+            if not is_current_format(info):
+                info = migrate_legacy_store(kb_dir, dtype=self.vector_dtype, remove_legacy=True)
+                if info is None:
+                    raise FileNotFoundError(f"No chunk metadata found in {kb_dir}")
+            self._ensure_canonical_embeddings(kb_dir)
+
+            if info.get("embedding_dim") and info["embedding_dim"] != embeddings.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension {embeddings.shape[1]} does not match "
+                    f"existing index ({info['embedding_dim']}) in {kb_dir}"
+                )
+
+            # Re-added documents replace their previous chunks
+            replaced = find_rows(kb_dir, {doc_id for doc_id, _ in all_chunks})
+            readded = self._count_documents(kb_dir, replaced)
+            if replaced:
+                add_tombstones(kb_dir, replaced)
+                self.logger.info(f"Tombstoned {len(replaced)} chunks of re-added documents")
+
+            start = int(info.get("num_chunks", 0))
+            append_chunks(
+                kb_dir,
+                (
+                    self._chunk_record(start + i, doc_id, chunk)
+                    for i, (doc_id, chunk) in enumerate(all_chunks)
+                ),
+            )
+            append_embeddings(kb_dir, embeddings)
+
+            total = start + len(all_chunks)
+            if info.get("use_faiss", False):
+                if not self.use_faiss:
+                    raise RuntimeError(f"FAISS is required to append to {kb_dir}")
+                wanted = resolve_index_type(self._index_settings(kb_dir)["type"], total)
+                if wanted != info.get("index_type", "flat"):
+                    # The KB outgrew its index type; rebuild from the canonical matrix
+                    self.logger.info(
+                        f"Rebuilding {info.get('index_type', 'flat')} index as {wanted} "
+                        f"for {total} vectors"
+                    )
+                    vectors = np.asarray(open_embeddings(kb_dir), dtype=np.float32)
+                    info.update(self._build_faiss_index(kb_dir, vectors))
+                else:
+                    index = self.faiss.read_index(str(kb_dir / "index.faiss"))
+                    index.add(normalize_rows(embeddings))
+                    self.faiss.write_index(index, str(kb_dir / "index.faiss"))
+
+            info["num_chunks"] = total
+            info["num_documents"] = max(0, info.get("num_documents", 0) + num_documents - readded)
+            save_info(kb_dir, info)
+            self.logger.info(f"Appended {len(all_chunks)} chunks (total {info['num_chunks']})")
+
+    def _ensure_canonical_embeddings(self, kb_dir: Path) -> None:
+        """
+        Recreate embeddings.npy from a flat FAISS index for stores written
+        before the matrix was kept alongside the index.
+        """
+        if (kb_dir / "embeddings.npy").exists():
+            return
+        if not (self.use_faiss and (kb_dir / "index.faiss").exists()):
+            raise FileNotFoundError(f"Embeddings file not found: {kb_dir / 'embeddings.npy'}")
+        index = self.faiss.read_index(str(kb_dir / "index.faiss"))
+        write_embeddings(kb_dir, index.reconstruct_n(0, index.ntotal), dtype=self.vector_dtype)
+
+    def _compact_store(self, kb_dir: Path) -> int:
+        """Compact a store under its write lock (runs in an executor thread)."""
+        with store_lock(kb_dir):
+            info = load_info(kb_dir)
+            if len(load_tombstones(kb_dir)):
+                # Migrated FAISS stores may not have the matrix compaction rewrites
+                self._ensure_canonical_embeddings(kb_dir)
+            build_index = None
+            if info.get("use_faiss", False) and self.use_faiss:
+
+                def build_index(vectors):
+                    return self._build_faiss_index(kb_dir, vectors)
+
+            removed = compact_store(kb_dir, build_index=build_index)
+        if removed:
+            get_index_cache().invalidate(kb_dir)
+        return removed
+
+    def _maybe_schedule_compaction(self, kb_dir: Path) -> None:
+        """Start a background compaction if enough rows are tombstoned."""
+        total = load_info(kb_dir).get("num_chunks", 0)
+        dead = len(load_tombstones(kb_dir))
+        if not total or dead / total < self.compaction_threshold:
+            return
+
+        key = str(kb_dir.resolve())
+        pending = self._compactions.get(key)
+        if pending is not None and not pending.done():
+            return
+
+        self.logger.info(f"Scheduling compaction of {kb_dir} ({dead}/{total} rows tombstoned)")
+        future = asyncio.get_running_loop().run_in_executor(None, self._compact_store, kb_dir)
+
+        def on_done(fut: asyncio.Future):
+            if not fut.cancelled() and fut.exception() is not None:
+                self.logger.error(f"Background compaction failed for {kb_dir}: {fut.exception()}")
+
+        future.add_done_callback(on_done)
+        self._compactions[key] = future
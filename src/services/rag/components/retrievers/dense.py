@@ -6,15 +6,30 @@ Dense Retriever
 Dense vector-based retriever using FAISS or cosine similarity.
 """
 
+import asyncio
 import json
 from pathlib import Path
 import pickle
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from ...utils.ann_index import search_parameters, set_search_params
+from ...utils.index_cache import CachedIndex, get_index_cache
+from ...utils.numpy_search import NumpySearchEngine, RowFilter, search_rows
+from ...utils.vector_store import (
+    ChunkStore,
+    is_current_format,
+    load_info,
+    load_tombstones,
+    open_embeddings,
+    store_lock,
+)
 from ..base import BaseComponent
 
+# Filters allowing at most this fraction of rows are searched exactly over those rows
+EXACT_FILTER_FRACTION = 0.05
+
 
 class DenseRetriever(BaseComponent):
     """
@@ -59,112 +74,150 @@ class DenseRetriever(BaseComponent):
         Args:
             query: Search query
             kb_name: Knowledge base name
-            **kwargs: Additional arguments (mode, top_k, etc.)
+            **kwargs: Additional arguments (mode, top_k, filters, etc.)
 
         Returns:
             Search results dictionary with answer and sources
         """
-        top_k = kwargs.get("top_k", self.top_k)
-        self.logger.info(f"Dense search in {kb_name}: {query[:50]}... (top_k={top_k})")
+        return (await self.process_batch([query], kb_name, **kwargs))[0]
 
-        from src.services.embedding import get_embedding_client
+    async def process_batch(
+        self, queries: List[str], kb_name: str, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries with one embedding request and one index search.
 
-        # Get query embedding
-        client = get_embedding_client()
-        query_embedding = np.array((await client.embed([query]))[0], dtype=np.float32)
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            **kwargs: Additional arguments
+                top_k: Number of results per query
+                filters: Field -> allowed value(s) on chunk records or their
+                    metadata, e.g. ``{"doc_id": ["a.pdf"]}``
 
-        # Load index
+        Returns:
+            One search results dictionary per query, in input order
+        """
+        top_k = kwargs.get("top_k", self.top_k)
+        filters = kwargs.get("filters")
+        self.logger.info(
+            f"Dense search in {kb_name}: {len(queries)} queries, "
+            f"{queries[0][:50] if queries else ''}... (top_k={top_k})"
+        )
+        if not queries:
+            return []
+
+        # Load index (served from the process-wide cache when unchanged on disk)
         kb_dir = Path(self.kb_base_dir) / kb_name / "vector_store"
-        metadata_file = kb_dir / "metadata.json"
-        info_file = kb_dir / "info.json"
 
-        if not metadata_file.exists():
+        if not (kb_dir / "info.json").exists() and not (kb_dir / "metadata.json").exists():
             self.logger.warning(f"No vector index found at {kb_dir}")
-            return {
-                "query": query,
-                "answer": "No documents indexed. Please upload documents first.",
-                "content": "",
-                "mode": "dense",
-                "provider": "llamaindex",
-                "results": [],
-            }
-
-        # Load metadata and info (info.json is optional)
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
-
-        if info_file.exists():
-            with open(info_file, "r", encoding="utf-8") as f:
-                info = json.load(f)
-        else:
-            info = {"use_faiss": False}
+            return [
+                {
+                    "query": query,
+                    "answer": "No documents indexed. Please upload documents first.",
+                    "content": "",
+                    "mode": "dense",
+                    "provider": "llamaindex",
+                    "results": [],
+                }
+                for query in queries
+            ]
 
-        use_faiss = info.get("use_faiss", False)
-
-        if use_faiss and self.use_faiss:
-            # Use FAISS for fast search
-            index_file = kb_dir / "index.faiss"
-            if not index_file.exists():
-                self.logger.error(f"FAISS index file not found: {index_file}")
-                return self._empty_response(query)
+        from src.services.embedding import get_embedding_client
 
-            # Load FAISS index
-            index = self.faiss.read_index(str(index_file))
+        # Embed all queries in one request
+        client = get_embedding_client()
+        query_embeddings = np.array(await client.embed(list(queries)), dtype=np.float32)
 
-            # Normalize query vector for cosine similarity without modifying original
-            norm = np.linalg.norm(query_embedding)
-            if norm > 0:
-                query_vec = (query_embedding / norm).reshape(1, -1)
-            else:
-                query_vec = query_embedding.reshape(1, -1)
-
-            # Search
-            distances, indices = index.search(query_vec, min(top_k, len(metadata)))
-
-            # Build results
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx < len(metadata):  # Valid index
-                    score = 1.0 / (1.0 + dist)  # Convert distance to similarity score
-                    results.append((score, metadata[idx]))
+        loop = asyncio.get_running_loop()
+        try:
+            store = await loop.run_in_executor(
+                None, get_index_cache().get, kb_dir, self._load_store
+            )
+        except FileNotFoundError as e:
+            self.logger.error(str(e))
+            return [self._empty_response(query) for query in queries]
+
+        if store.index is not None:
+            hits = await loop.run_in_executor(
+                None, self._faiss_search, store, query_embeddings, top_k, filters
+            )
         else:
-            # Fallback: Load embeddings and use cosine similarity
-            embeddings_file = kb_dir / "embeddings.pkl"
-            if not embeddings_file.exists():
-                self.logger.error(f"Embeddings file not found: {embeddings_file}")
-                return self._empty_response(query)
-
-            with open(embeddings_file, "rb") as f:
-                embeddings = pickle.load(f)
-
-            # Normalize for cosine similarity (avoid division by zero)
-            query_norm = np.linalg.norm(query_embedding)
-            if query_norm > 0:
-                query_vec = query_embedding / query_norm
-            else:
-                query_vec = query_embedding  # Keep as is if zero norm
-
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            # Replace zero norms with 1 to avoid division by zero
-            norms = np.where(norms == 0, 1, norms)
-            doc_vecs = embeddings / norms
-
-            # Compute similarities
-            similarities = np.dot(doc_vecs, query_vec)
-
-            # Get top-k results
-            top_indices = np.argsort(similarities)[::-1][:top_k]
+            hits = await loop.run_in_executor(
+                None, store.engine.search, query_embeddings, top_k, filters
+            )
+
+        return [
+            self._build_response(query, store.metadata, query_hits)
+            for query, query_hits in zip(queries, hits)
+        ]
+
+    def _faiss_search(
+        self,
+        store: CachedIndex,
+        query_embeddings: np.ndarray,
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Batched FAISS search that skips deleted and filtered-out rows.
 
-            results = []
-            for idx in top_indices:
-                score = float(similarities[idx])
-                results.append((score, metadata[idx]))
+        Excluded rows are removed inside FAISS with an ID selector, so the
+        search never asks for more than top_k candidates. Selective filters
+        (and queries an IVF/HNSW probe leaves short) are answered by an exact
+        search over the allowed rows of the canonical matrix, when present.
+        """
+        index = store.index
+        num_rows = min(len(store.metadata), index.ntotal)
+        allowed = store.row_filter.mask(filters)[:num_rows]
+        allowed_count = int(allowed.sum())
+        if allowed_count == 0:
+            return [[] for _ in range(len(query_embeddings))]
+
+        # Normalize query vectors for cosine similarity
+        norms = np.linalg.norm(query_embeddings, axis=1, keepdims=True)
+        query_vecs = np.ascontiguousarray(query_embeddings / np.where(norms == 0, 1, norms))
+        wanted = min(top_k, allowed_count)
+
+        if allowed_count < num_rows and store.embeddings is not None:
+            if allowed_count <= max(top_k, EXACT_FILTER_FRACTION * num_rows):
+                return search_rows(store.embeddings, np.flatnonzero(allowed), query_vecs, top_k)
+
+        params = None
+        if allowed_count < index.ntotal:
+            bitmap = np.packbits(allowed, bitorder="little")
+            params = search_parameters(index, self.faiss.IDSelectorBitmap(bitmap))
+        similarities, indices = index.search(query_vecs, wanted, params=params)
+
+        # FAISS pads with -1; inner-product indexes return the cosine similarity itself
+        hits = [
+            [(int(idx), float(sim)) for sim, idx in zip(row_sims, row_ids) if 0 <= idx < num_rows]
+            for row_sims, row_ids in zip(similarities, indices)
+        ]
+
+        # Approximate indexes only see the rows they probe; fill short results exactly
+        short = [i for i, query_hits in enumerate(hits) if len(query_hits) < wanted]
+        if short and store.embeddings is not None:
+            exact = search_rows(store.embeddings, np.flatnonzero(allowed), query_vecs[short], top_k)
+            for i, query_hits in zip(short, exact):
+                hits[i] = query_hits
+        return hits
+
+    @staticmethod
+    def _build_response(query: str, metadata, hits: List[Tuple[int, float]]) -> Dict[str, Any]:
+        """Format ranked (row id, score) hits as a search response."""
+        records = (
+            metadata.get_many([idx for idx, _ in hits])
+            if hasattr(metadata, "get_many")
+            else [metadata[idx] for idx, _ in hits]
+        )
 
         # Build response content
         # Format chunks cleanly for LLM context (without score annotations)
         content_parts = []
         sources = []
-        for score, item in results:
+        for (_, score), item in zip(hits, records):
             content = item.get("content", "").strip()
             if content:  # Only include non-empty chunks
                 # Add chunk without score prefix for clean LLM input
@@ -189,6 +242,97 @@ class DenseRetriever(BaseComponent):
             "results": sources,
         }
 
+    def _load_store(self, kb_dir: Path) -> CachedIndex:
+        """
+        Load a vector store from disk (cache loader, runs in an executor thread).
+
+        Args:
+            kb_dir: Path to the KB's vector_store directory
+
+        Returns:
+            CachedIndex with the FAISS index or embedding matrix loaded
+
+        Raises:
+            FileNotFoundError: If the index or embeddings file is missing
+        """
+        # Writers (append/compaction) hold the same lock, so the files opened
+        # below always belong to one consistent version of the store
+        with store_lock(kb_dir):
+            return self._open_store(kb_dir)
+
+    def _open_store(self, kb_dir: Path) -> CachedIndex:
+        """Open the files of a vector store (caller holds its store lock)."""
+        # info.json is optional for legacy stores
+        info = load_info(kb_dir) or {"use_faiss": False}
+
+        tombstones = load_tombstones(kb_dir)
+        if is_current_format(info):
+            metadata = ChunkStore(kb_dir)
+            nbytes = metadata.nbytes + tombstones.nbytes
+        else:
+            self.logger.info(
+                f"Vector store at {kb_dir} uses the legacy layout; "
+                "run scripts/migrate_vector_store.py to convert it"
+            )
+            metadata_file = kb_dir / "metadata.json"
+            with open(metadata_file, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+            nbytes = metadata_file.stat().st_size
+
+        # Tombstone mask plus lazily-built metadata columns for filters
+        row_filter = RowFilter(metadata, tombstones)
+        nbytes += row_filter.alive.nbytes
+
+        if info.get("use_faiss", False) and self.use_faiss:
+            index_file = kb_dir / "index.faiss"
+            if not index_file.exists():
+                raise FileNotFoundError(f"FAISS index file not found: {index_file}")
+            index = self.faiss.read_index(str(index_file))
+            # Query-time knobs (nprobe / ef_search) tuned at build time
+            set_search_params(index, info.get("index_params", {}))
+            nbytes += index_file.stat().st_size
+            self.logger.info(f"Loaded FAISS index with {index.ntotal} vectors from {kb_dir}")
+            # Memory-mapped canonical matrix for exact search under selective filters
+            embeddings = None
+            if is_current_format(info) and (kb_dir / "embeddings.npy").exists():
+                embeddings = open_embeddings(kb_dir)
+            return CachedIndex(
+                info=info,
+                metadata=metadata,
+                index=index,
+                embeddings=embeddings,
+                tombstones=tombstones,
+                row_filter=row_filter,
+                nbytes=nbytes,
+            )
+
+        if is_current_format(info):
+            if not (kb_dir / "embeddings.npy").exists():
+                raise FileNotFoundError(f"Embeddings file not found: {kb_dir / 'embeddings.npy'}")
+            # Memory-mapped: pages are owned by the OS page cache, so they are
+            # not counted against the cache's byte budget
+            embeddings = open_embeddings(kb_dir)
+        else:
+            embeddings_file = kb_dir / "embeddings.pkl"
+            if not embeddings_file.exists():
+                raise FileNotFoundError(f"Embeddings file not found: {embeddings_file}")
+            with open(embeddings_file, "rb") as f:
+                embeddings = pickle.load(f)
+
+        # Legacy matrices are normalized once here instead of on every query
+        engine = NumpySearchEngine(embeddings, row_filter, normalized=info.get("normalized", False))
+        nbytes += engine.nbytes
+        self.logger.info(f"Loaded {len(embeddings)} embeddings from {kb_dir}")
+        return CachedIndex(
+            info=info,
+            metadata=metadata,
+            embeddings=engine.embeddings,
+            tombstones=tombstones,
+            row_filter=row_filter,
+            engine=engine,
+            nbytes=nbytes,
+        )
+
     def _empty_response(self, query: str) -> Dict[str, Any]:
         """Return empty response when no results found."""
         return {
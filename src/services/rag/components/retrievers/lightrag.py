@@ -6,9 +6,10 @@ LightRAG Retriever
 Pure LightRAG retriever (text-only, no multimodal).
 """
 
+import asyncio
 from pathlib import Path
 import sys
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from ..base import BaseComponent
 
@@ -101,7 +102,56 @@ class LightRAGRetriever(BaseComponent):
             Search results dictionary
         """
         self.logger.info(f"LightRAG search ({mode}) in {kb_name}: {query[:50]}...")
+        result = (await self._query_all([query], kb_name, mode, only_need_context))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
+    async def process_batch(
+        self,
+        queries: List[str],
+        kb_name: str,
+        mode: str = "hybrid",
+        only_need_context: bool = False,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries, initializing the LightRAG storages once.
+
+        LightRAG embeds each query internally, so the queries themselves run
+        concurrently against the shared instance.
+
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            mode: Search mode (hybrid, local, global, naive)
+            only_need_context: Whether to only return context without answer
+            **kwargs: Additional arguments
+
+        Returns:
+            Search results dictionaries, in input order. A query that fails
+            gets an empty answer and an ``error`` message instead of failing
+            the whole batch.
+        """
+        results = await self._query_all(queries, kb_name, mode, only_need_context)
+        return [
+            {
+                "query": query,
+                "answer": "",
+                "content": "",
+                "mode": mode,
+                "provider": "lightrag",
+                "error": str(result) or type(result).__name__,
+            }
+            if isinstance(result, Exception)
+            else result
+            for query, result in zip(queries, results)
+        ]
+
+    async def _query_all(
+        self, queries: List[str], kb_name: str, mode: str, only_need_context: bool
+    ) -> List[Any]:
+        """Run the queries concurrently; failed queries yield their exception"""
         from src.logging.adapters import LightRAGLogContext
 
         with LightRAGLogContext(scene="LightRAG-Search"):
@@ -116,15 +166,20 @@ class LightRAGRetriever(BaseComponent):
             # Import QueryParam for proper query parameter passing
             from lightrag import QueryParam
 
-            # Use LightRAG's native query method with QueryParam object
-            query_param = QueryParam(mode=mode, only_need_context=only_need_context)
-            answer = await rag.aquery(query, param=query_param)
-            answer_str = answer if isinstance(answer, str) else str(answer)
-
-            return {
-                "query": query,
-                "answer": answer_str,
-                "content": answer_str,
-                "mode": mode,
-                "provider": "lightrag",
-            }
+            async def run(query: str) -> Dict[str, Any]:
+                # Use LightRAG's native query method with QueryParam object
+                query_param = QueryParam(mode=mode, only_need_context=only_need_context)
+                answer = await rag.aquery(query, param=query_param)
+                answer_str = answer if isinstance(answer, str) else str(answer)
+
+                return {
+                    "query": query,
+                    "answer": answer_str,
+                    "content": answer_str,
+                    "mode": mode,
+                    "provider": "lightrag",
+                }
+
+            return list(
+                await asyncio.gather(*[run(query) for query in queries], return_exceptions=True)
+            )
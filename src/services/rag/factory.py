@@ -7,11 +7,23 @@ Factory for creating and managing RAG pipelines.
 
 Note: Pipeline imports are lazy to avoid importing heavy dependencies (lightrag, llama_index, etc.)
 at module load time. This allows the core services to be imported without RAG dependencies.
+
+Pipelines used for serving searches are kept warm in a process-wide registry
+keyed by (provider, kb_base_dir), see get_shared_pipeline(). Entries are
+dropped with invalidate_pipelines() when a KB is deleted or its configuration
+changes, and build/teardown timings are reported by pipeline_stats().
 """
 
-from typing import Callable, Dict, List, Optional
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import warnings
 
+from src.logging import get_logger
+
+logger = get_logger("PipelineFactory")
+
 # Pipeline registry - populated lazily
 _PIPELINES: Dict[str, Callable] = {}
 _PIPELINES_INITIALIZED = False
@@ -103,6 +115,137 @@ def get_pipeline(name: str = "raganything", kb_base_dir: Optional[str] = None, *
         ) from e
 
 
+# Warm pipeline instances, keyed by (provider, resolved kb_base_dir)
+_SHARED: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_SHARED_LOCK = threading.Lock()
+# Per-provider startup/teardown counters
+_STATS: Dict[str, Dict[str, float]] = {}
+
+
+def _shared_key(name: str, kb_base_dir: Optional[str]) -> Tuple[str, str]:
+    return name, str(Path(kb_base_dir).resolve()) if kb_base_dir else ""
+
+
+def _provider_stats(name: str) -> Dict[str, float]:
+    return _STATS.setdefault(
+        name,
+        {
+            "builds": 0,
+            "build_seconds": 0.0,
+            "reuses": 0,
+            "teardowns": 0,
+            "teardown_seconds": 0.0,
+        },
+    )
+
+
+def get_shared_pipeline(name: str = "raganything", kb_base_dir: Optional[str] = None):
+    """
+    Get a warm, process-wide pipeline instance.
+
+    The pipeline is built on first use and reused afterwards, so per-KB state
+    such as RAG-Anything instances and LlamaIndex settings survives across
+    searches.
+
+    Args:
+        name: Pipeline name (raganything, raganything_docling, lightrag, llamaindex)
+        kb_base_dir: Base directory for knowledge bases
+
+    Returns:
+        Pipeline instance
+
+    Raises:
+        ValueError: If pipeline name is not found
+    """
+    key = _shared_key(name, kb_base_dir)
+    with _SHARED_LOCK:
+        entry = _SHARED.get(key)
+        if entry is not None:
+            entry["uses"] += 1
+            _provider_stats(name)["reuses"] += 1
+            return entry["pipeline"]
+
+        # Built under the lock so concurrent first searches share one instance
+        start = time.perf_counter()
+        pipeline = get_pipeline(name, kb_base_dir=kb_base_dir)
+        elapsed = time.perf_counter() - start
+
+        _SHARED[key] = {
+            "pipeline": pipeline,
+            "built_at": time.time(),
+            "build_seconds": elapsed,
+            "uses": 1,
+        }
+        stats = _provider_stats(name)
+        stats["builds"] += 1
+        stats["build_seconds"] += elapsed
+    logger.info(f"Built shared '{name}' pipeline in {elapsed * 1000:.1f} ms")
+    return pipeline
+
+
+def invalidate_pipelines(name: Optional[str] = None, kb_base_dir: Optional[str] = None) -> int:
+    """
+    Drop warm pipelines so the next search rebuilds them.
+
+    Call after deleting a KB or changing configuration the pipelines captured
+    at build time (LLM/embedding settings, KB provider).
+
+    Args:
+        name: Only drop pipelines of this provider
+        kb_base_dir: Only drop pipelines serving this base directory
+
+    Returns:
+        Number of pipelines dropped
+    """
+    base = _shared_key("", kb_base_dir)[1] if kb_base_dir else None
+    with _SHARED_LOCK:
+        keys = [
+            key
+            for key in _SHARED
+            if (name is None or key[0] == name) and (base is None or key[1] == base)
+        ]
+        for key in keys:
+            start = time.perf_counter()
+            entry = _SHARED.pop(key)
+            close = getattr(entry["pipeline"], "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"Failed to close '{key[0]}' pipeline: {e}")
+            stats = _provider_stats(key[0])
+            stats["teardowns"] += 1
+            stats["teardown_seconds"] += time.perf_counter() - start
+    if keys:
+        logger.info(f"Invalidated {len(keys)} shared pipeline(s)")
+    return len(keys)
+
+
+def pipeline_stats() -> Dict[str, Any]:
+    """
+    Report warm pipelines and per-provider startup/teardown metrics.
+
+    Returns:
+        Dict with "providers" (build/reuse/teardown counters and timings) and
+        "active" (one entry per warm pipeline)
+    """
+    now = time.time()
+    with _SHARED_LOCK:
+        return {
+            "providers": {name: dict(stats) for name, stats in _STATS.items()},
+            "active": [
+                {
+                    "provider": name,
+                    "kb_base_dir": base,
+                    "build_seconds": entry["build_seconds"],
+                    "uses": entry["uses"],
+                    "age_seconds": now - entry["built_at"],
+                }
+                for (name, base), entry in _SHARED.items()
+            ],
+        }
+
+
 def list_pipelines() -> List[Dict[str, str]]:
     """
     List available pipelines.
@@ -144,6 +287,8 @@ def register_pipeline(name: str, factory: Callable):
     """
     _init_pipelines()
     _PIPELINES[name] = factory
+    # Drop warm instances built by a previous factory of the same name
+    invalidate_pipelines(name)
 
 
 def has_pipeline(name: str) -> bool:
@@ -16,6 +16,7 @@ from src.logging import get_logger
 from .components.base import Component
 from .components.routing import FileTypeRouter
 from .types import Document
+from .utils.index_cache import get_index_cache
 
 # Default knowledge base directory
 DEFAULT_KB_BASE_DIR = str(
@@ -184,6 +185,44 @@ class RAGPipeline:
 
         return await self._retriever.process(query, kb_name=kb_name, **kwargs)
 
+    async def search_many(self, queries: List[str], kb_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Search the knowledge base with several queries.
+
+        Uses the retriever's ``process_batch`` when it has one, otherwise runs
+        the queries concurrently. A query that fails gets an empty answer and
+        an ``error`` message instead of failing the whole batch.
+
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            **kwargs: Additional arguments passed to retriever
+
+        Returns:
+            Search results dictionaries, in input order
+        """
+        if not self._retriever:
+            raise ValueError("No retriever configured. Use .retriever() to set one")
+
+        if hasattr(self._retriever, "process_batch"):
+            return await self._retriever.process_batch(queries, kb_name=kb_name, **kwargs)
+
+        results = await asyncio.gather(
+            *[self._retriever.process(query, kb_name=kb_name, **kwargs) for query in queries],
+            return_exceptions=True,
+        )
+        return [
+            {
+                "query": query,
+                "answer": "",
+                "content": "",
+                "error": str(result) or type(result).__name__,
+            }
+            if isinstance(result, Exception)
+            else result
+            for query, result in zip(queries, results)
+        ]
+
     async def delete(self, kb_name: str) -> bool:
         """
         Delete a knowledge base.
@@ -209,6 +248,7 @@ class RAGPipeline:
 
         if kb_dir.exists():
             shutil.rmtree(kb_dir)
+            get_index_cache().invalidate(kb_dir / "vector_store")
             self.logger.info(f"Deleted KB directory: {kb_dir}")
             return True
 
@@ -19,10 +19,13 @@ from llama_index.core import (
 )
 from llama_index.core.base.embeddings.base import BaseEmbedding
 from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.schema import QueryBundle
 
 from src.logging import get_logger
 from src.services.embedding import get_embedding_client, get_embedding_config
 
+from ..utils.index_cache import LLAMAINDEX_FILES, CachedIndex, get_llamaindex_cache
+
 # Default knowledge base directory
 DEFAULT_KB_BASE_DIR = str(
     Path(__file__).resolve().parent.parent.parent.parent.parent / "data" / "knowledge_bases"
@@ -90,6 +93,10 @@ class LlamaIndexPipeline:
     - CustomEmbedding for OpenAI-compatible embeddings
     - SentenceSplitter for chunking
     - StorageContext for persistence
+
+    Loaded indexes stay resident in a process-wide LRU cache (see
+    utils.index_cache.get_llamaindex_cache) and are reloaded only after the
+    storage files change.
     """
 
     def __init__(self, kb_base_dir: Optional[str] = None):
@@ -183,6 +190,7 @@ class LlamaIndexPipeline:
 
             # Persist index
             index.storage_context.persist(persist_dir=str(storage_dir))
+            get_llamaindex_cache().invalidate(storage_dir)
             self.logger.info(f"Index persisted to {storage_dir}")
 
             self.logger.info(f"KB '{kb_name}' initialized successfully with LlamaIndex")
@@ -233,64 +241,136 @@ class LlamaIndexPipeline:
             Search results dictionary
         """
         self.logger.info(f"Searching KB '{kb_name}' with query: {query[:50]}...")
+        return (await self.search_many([query], kb_name, mode=mode, **kwargs))[0]
+
+    async def search_many(
+        self,
+        queries: List[str],
+        kb_name: str,
+        mode: str = "hybrid",
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries with one embedding request and one index load.
 
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            mode: Search mode (ignored, LlamaIndex uses similarity)
+            **kwargs: Additional arguments (top_k, etc.)
+
+        Returns:
+            Search results dictionaries, in input order
+        """
         kb_dir = Path(self.kb_base_dir) / kb_name
         storage_dir = kb_dir / "llamaindex_storage"
 
         if not storage_dir.exists():
             self.logger.warning(f"No LlamaIndex storage found at {storage_dir}")
-            return {
-                "query": query,
-                "answer": "No documents indexed. Please upload documents first.",
-                "content": "",
-                "mode": mode,
-                "provider": "llamaindex",
-            }
+            return [
+                {
+                    "query": query,
+                    "answer": "No documents indexed. Please upload documents first.",
+                    "content": "",
+                    "mode": mode,
+                    "provider": "llamaindex",
+                }
+                for query in queries
+            ]
 
         try:
+            # Embed every query in a single request
+            query_embeddings = await get_embedding_client().embed(list(queries))
+
             # Load index from storage (run in thread pool)
             loop = asyncio.get_event_loop()
 
             def load_and_retrieve():
-                storage_context = StorageContext.from_defaults(persist_dir=str(storage_dir))
-                index = load_index_from_storage(storage_context)
+                index = get_llamaindex_cache().get(storage_dir, self._load_index).index
                 top_k = kwargs.get("top_k", 5)
 
                 # Use retriever instead of query_engine to avoid LLM requirement
                 retriever = index.as_retriever(similarity_top_k=top_k)
-                nodes = retriever.retrieve(query)
-                return nodes
+                return [
+                    retriever.retrieve(QueryBundle(query_str=query, embedding=embedding))
+                    for query, embedding in zip(queries, query_embeddings)
+                ]
 
             # Execute retrieval in thread pool to avoid blocking
-            nodes = await loop.run_in_executor(None, load_and_retrieve)
-
-            # Extract text from retrieved nodes
-            context_parts = []
-            for node in nodes:
-                context_parts.append(node.node.text)
-
-            content = "\n\n".join(context_parts) if context_parts else ""
-
-            return {
-                "query": query,
-                "answer": content,  # Return context for ChatAgent to use
-                "content": content,
-                "mode": mode,
-                "provider": "llamaindex",
-            }
+            nodes_per_query = await loop.run_in_executor(None, load_and_retrieve)
+
+            results = []
+            for query, nodes in zip(queries, nodes_per_query):
+                # Extract text from retrieved nodes
+                context_parts = [node.node.text for node in nodes]
+                content = "\n\n".join(context_parts) if context_parts else ""
+
+                results.append(
+                    {
+                        "query": query,
+                        "answer": content,  # Return context for ChatAgent to use
+                        "content": content,
+                        "mode": mode,
+                        "provider": "llamaindex",
+                    }
+                )
+            return results
 
         except Exception as e:
             self.logger.error(f"Search failed: {e}")
             import traceback
 
             self.logger.error(traceback.format_exc())
-            return {
-                "query": query,
-                "answer": f"Search failed: {str(e)}",
-                "content": "",
-                "mode": mode,
-                "provider": "llamaindex",
-            }
+            return [
+                {
+                    "query": query,
+                    "answer": f"Search failed: {str(e)}",
+                    "content": "",
+                    "mode": mode,
+                    "provider": "llamaindex",
+                    "error": str(e),
+                }
+                for query in queries
+            ]
+
+    def _load_index(self, storage_dir: Path) -> CachedIndex:
+        """
+        Load a persisted index (cache loader, runs in an executor thread).
+
+        Args:
+            storage_dir: Path to the KB's llamaindex_storage directory
+
+        Returns:
+            CachedIndex holding the VectorStoreIndex
+        """
+        storage_context = StorageContext.from_defaults(persist_dir=str(storage_dir))
+        index = load_index_from_storage(storage_context)
+        # JSON size on disk approximates the resident size of the loaded stores
+        nbytes = sum(
+            (storage_dir / name).stat().st_size
+            for name in LLAMAINDEX_FILES
+            if (storage_dir / name).exists()
+        )
+        self.logger.info(f"Loaded LlamaIndex index from {storage_dir} ({nbytes / 1e6:.1f} MB)")
+        return CachedIndex(info={}, metadata=[], index=index, nbytes=nbytes)
+
+    async def warm_up(self, kb_name: str) -> bool:
+        """
+        Load a KB's index into the resident cache ahead of the first search.
+
+        Args:
+            kb_name: Knowledge base name
+
+        Returns:
+            True if an index was loaded
+        """
+        storage_dir = Path(self.kb_base_dir) / kb_name / "llamaindex_storage"
+        if not storage_dir.exists():
+            return False
+
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, get_llamaindex_cache().get, storage_dir, self._load_index)
+        return True
 
     async def add_documents(self, kb_name: str, file_paths: List[str], **kwargs) -> bool:
         """
@@ -380,6 +460,9 @@ class LlamaIndexPipeline:
                 num_added = await loop.run_in_executor(None, create_index)
                 self.logger.info(f"Created new index with {num_added} documents")
 
+            # Drop the resident copy so the next search loads the new documents
+            get_llamaindex_cache().invalidate(storage_dir)
+
             self.logger.info(f"Successfully added documents to KB '{kb_name}'")
             return True
 
@@ -406,6 +489,7 @@ class LlamaIndexPipeline:
 
         if kb_dir.exists():
             shutil.rmtree(kb_dir)
+            get_llamaindex_cache().invalidate(kb_dir / "llamaindex_storage")
             self.logger.info(f"Deleted KB '{kb_name}'")
             return True
 
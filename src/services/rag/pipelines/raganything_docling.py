@@ -7,6 +7,7 @@ End-to-end pipeline wrapping RAG-Anything with Docling parser for document proce
 Uses Docling instead of MinerU for better Office document and HTML support.
 """
 
+import asyncio
 from pathlib import Path
 import sys
 from typing import Any, Dict, List, Optional
@@ -325,20 +326,75 @@ class RAGAnythingDoclingPipeline:
         Returns:
             Search results dictionary
         """
-        with LightRAGLogContext(scene="rag_search"):
-            rag = self._get_rag_instance(kb_name)
-            await rag._ensure_lightrag_initialized()
+        result = (await self._query_all([query], kb_name, mode, only_need_context))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-            answer = await rag.aquery(query, mode=mode, only_need_context=only_need_context)
-            answer_str = answer if isinstance(answer, str) else str(answer)
+    async def search_many(
+        self,
+        queries: List[str],
+        kb_name: str,
+        mode: str = "hybrid",
+        only_need_context: bool = False,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries against one initialized RAG-Anything instance.
+
+        RAG-Anything embeds each query inside aquery(), so the queries run
+        concurrently rather than sharing one embedding request.
 
-            return {
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            mode: Search mode (hybrid, local, global, naive)
+            only_need_context: Whether to only return context without answer
+            **kwargs: Additional arguments
+
+        Returns:
+            Search results dictionaries, in input order. A query that fails
+            gets an empty answer and an ``error`` message instead of failing
+            the whole batch.
+        """
+        results = await self._query_all(queries, kb_name, mode, only_need_context)
+        return [
+            {
                 "query": query,
-                "answer": answer_str,
-                "content": answer_str,
+                "answer": "",
+                "content": "",
                 "mode": mode,
                 "provider": "raganything_docling",
+                "error": str(result) or type(result).__name__,
             }
+            if isinstance(result, Exception)
+            else result
+            for query, result in zip(queries, results)
+        ]
+
+    async def _query_all(
+        self, queries: List[str], kb_name: str, mode: str, only_need_context: bool
+    ) -> List[Any]:
+        """Run the queries concurrently; failed queries yield their exception"""
+        with LightRAGLogContext(scene="rag_search"):
+            rag = self._get_rag_instance(kb_name)
+            await rag._ensure_lightrag_initialized()
+
+            async def run(query: str) -> Dict[str, Any]:
+                answer = await rag.aquery(query, mode=mode, only_need_context=only_need_context)
+                answer_str = answer if isinstance(answer, str) else str(answer)
+
+                return {
+                    "query": query,
+                    "answer": answer_str,
+                    "content": answer_str,
+                    "mode": mode,
+                    "provider": "raganything_docling",
+                }
+
+            return list(
+                await asyncio.gather(*[run(query) for query in queries], return_exceptions=True)
+            )
 
     async def delete(self, kb_name: str) -> bool:
         """
@@ -6,6 +6,7 @@ RAG Service
 Unified RAG service providing a single entry point for all RAG operations.
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -14,7 +15,7 @@ from typing import Any, Dict, List, Optional
 
 from src.logging import get_logger
 
-from .factory import get_pipeline, has_pipeline, list_pipelines
+from .factory import get_shared_pipeline, has_pipeline, invalidate_pipelines, list_pipelines
 
 # Default knowledge base directory
 DEFAULT_KB_BASE_DIR = str(
@@ -59,13 +60,10 @@ class RAGService:
         self.logger = get_logger("RAGService")
         self.kb_base_dir = kb_base_dir or DEFAULT_KB_BASE_DIR
         self.provider = provider or os.getenv("RAG_PROVIDER", "raganything")
-        self._pipeline = None
 
     def _get_pipeline(self):
-        """Get or create pipeline instance."""
-        if self._pipeline is None:
-            self._pipeline = get_pipeline(self.provider, kb_base_dir=self.kb_base_dir)
-        return self._pipeline
+        """Get the warm shared pipeline for the instance provider."""
+        return get_shared_pipeline(self.provider, kb_base_dir=self.kb_base_dir)
 
     async def initialize(self, kb_name: str, file_paths: List[str], **kwargs) -> bool:
         """
@@ -119,12 +117,76 @@ class RAGService:
             f"Searching KB '{kb_name}' with provider '{provider}' and query: {query[:50]}..."
         )
 
-        # Get pipeline for the specific provider
-        pipeline = get_pipeline(provider, kb_base_dir=self.kb_base_dir)
+        # Get the warm pipeline for the specific provider
+        pipeline = get_shared_pipeline(provider, kb_base_dir=self.kb_base_dir)
 
         result = await pipeline.search(query=query, kb_name=kb_name, mode=mode, **kwargs)
 
-        # Ensure consistent return format
+        return self._normalize_result(result, query, provider, mode)
+
+    async def search_many(
+        self, queries: List[str], kb_name: str, mode: str = "hybrid", **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Search a knowledge base with several queries at once.
+
+        Pipelines that implement ``search_many`` embed all queries in one
+        request and load the index once; others are searched concurrently.
+
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            mode: Search mode (hybrid, local, global, naive)
+            **kwargs: Additional arguments passed to pipeline
+
+        Returns:
+            One search results dictionary per query (same keys as search()),
+            in input order. A query that fails gets an empty answer and an
+            ``error`` message instead of failing the whole batch.
+
+        Example:
+            service = RAGService()
+            results = await service.search_many(["What is ML?", "What is DL?"], "textbook")
+        """
+        if not queries:
+            return []
+
+        provider = self._get_provider_for_kb(kb_name)
+        self.logger.info(
+            f"Searching KB '{kb_name}' with provider '{provider}' and {len(queries)} queries"
+        )
+
+        pipeline = get_shared_pipeline(provider, kb_base_dir=self.kb_base_dir)
+
+        if hasattr(pipeline, "search_many"):
+            results = await pipeline.search_many(
+                queries=list(queries), kb_name=kb_name, mode=mode, **kwargs
+            )
+        else:
+            results = await asyncio.gather(
+                *[
+                    pipeline.search(query=query, kb_name=kb_name, mode=mode, **kwargs)
+                    for query in queries
+                ],
+                return_exceptions=True,
+            )
+            results = [
+                {"answer": "", "content": "", "error": str(result) or type(result).__name__}
+                if isinstance(result, Exception)
+                else result
+                for result in results
+            ]
+
+        return [
+            self._normalize_result(result, query, provider, mode)
+            for query, result in zip(queries, results)
+        ]
+
+    @staticmethod
+    def _normalize_result(
+        result: Dict[str, Any], query: str, provider: str, mode: str
+    ) -> Dict[str, Any]:
+        """Ensure a pipeline result has the standard search keys."""
         if "query" not in result:
             result["query"] = query
         if "answer" not in result and "content" in result:
@@ -138,6 +200,26 @@ class RAGService:
 
         return result
 
+    async def warm_up(self, kb_name: str) -> bool:
+        """
+        Preload a knowledge base so its first search skips index loading.
+
+        Only pipelines that implement ``warm_up`` (e.g. llamaindex) do any work.
+
+        Args:
+            kb_name: Knowledge base name
+
+        Returns:
+            True if the pipeline loaded something
+        """
+        provider = self._get_provider_for_kb(kb_name)
+        pipeline = get_shared_pipeline(provider, kb_base_dir=self.kb_base_dir)
+        if not hasattr(pipeline, "warm_up"):
+            return False
+
+        self.logger.info(f"Warming up KB '{kb_name}' with provider '{provider}'")
+        return await pipeline.warm_up(kb_name)
+
     def _get_provider_for_kb(self, kb_name: str) -> str:
         """
         Get the RAG provider for a specific knowledge base from its metadata.
@@ -187,16 +269,20 @@ class RAGService:
         self.logger.info(f"Deleting KB '{kb_name}'")
         pipeline = self._get_pipeline()
 
-        if hasattr(pipeline, "delete"):
-            return await pipeline.delete(kb_name=kb_name)
-
-        # Fallback: delete directory manually
-        kb_dir = Path(self.kb_base_dir) / kb_name
-        if kb_dir.exists():
-            shutil.rmtree(kb_dir)
-            self.logger.info(f"Deleted KB directory: {kb_dir}")
-            return True
-        return False
+        try:
+            if hasattr(pipeline, "delete"):
+                return await pipeline.delete(kb_name=kb_name)
+
+            # Fallback: delete directory manually
+            kb_dir = Path(self.kb_base_dir) / kb_name
+            if kb_dir.exists():
+                shutil.rmtree(kb_dir)
+                self.logger.info(f"Deleted KB directory: {kb_dir}")
+                return True
+            return False
+        finally:
+            # Warm pipelines may hold instances bound to the deleted KB
+            invalidate_pipelines(kb_base_dir=self.kb_base_dir)
 
     @staticmethod
     def list_providers() -> List[Dict[str, str]]:
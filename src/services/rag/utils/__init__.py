@@ -10,8 +10,22 @@ from .image_migration import (
     cleanup_parser_output_dirs,
     migrate_images_and_update_paths,
 )
+from .index_cache import (
+    CachedIndex,
+    VectorIndexCache,
+    get_index_cache,
+    get_llamaindex_cache,
+    reset_index_cache,
+    reset_llamaindex_cache,
+)
 
 __all__ = [
     "migrate_images_and_update_paths",
     "cleanup_parser_output_dirs",
+    "CachedIndex",
+    "VectorIndexCache",
+    "get_index_cache",
+    "reset_index_cache",
+    "get_llamaindex_cache",
+    "reset_llamaindex_cache",
 ]
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+Approximate Nearest-Neighbour Indexes
+=====================================
+
+FAISS index construction for the ``vector_store/`` layout.
+
+A flat (brute-force) inner-product index costs O(N) per query, which dominates
+retrieval time once a KB reaches hundreds of thousands of chunks. This module
+builds one of the following, chosen per KB or automatically by corpus size:
+
+- ``flat``: exact ``IndexFlatIP`` (small corpora)
+- ``hnsw``: ``IndexHNSWFlat`` graph, tuned at query time with ``ef_search``
+- ``ivf_flat``: inverted lists over full vectors, tuned with ``nprobe``
+- ``ivf_pq``: inverted lists over product-quantized codes (very large corpora,
+  ~1/32 of the flat index size), tuned with ``nprobe``
+
+Trained indexes are trained on a random sample of the corpus. After building,
+``self_check()`` measures recall@k against exact search on sampled vectors and
+raises ``nprobe``/``ef_search`` until the target recall is met; the resulting
+parameters are stored in info.json and re-applied whenever the index is loaded.
+All vectors are expected to be L2-normalized, so inner product is cosine similarity.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.logging import get_logger
+
+logger = get_logger("ANNIndex")
+
+INDEX_TYPES = ("flat", "ivf_flat", "hnsw", "ivf_pq")
+
+# Automatic selection thresholds (number of vectors)
+FLAT_MAX_VECTORS = 50_000
+HNSW_MAX_VECTORS = 1_000_000
+
+# Below this size a trained index has too little data to train on
+MIN_TRAIN_VECTORS = 1_000
+
+# FAISS recommends at least 39 training points per centroid
+MIN_POINTS_PER_CENTROID = 39
+MAX_TRAIN_VECTORS = 256 * 1024
+
+TARGET_RECALL = 0.9
+MAX_EF_SEARCH = 1024
+
+
+def select_index_type(num_vectors: int) -> str:
+    """
+    Choose an index type for a corpus size.
+
+    Args:
+        num_vectors: Number of vectors in the store
+
+    Returns:
+        One of INDEX_TYPES
+    """
+    if num_vectors <= FLAT_MAX_VECTORS:
+        return "flat"
+    if num_vectors <= HNSW_MAX_VECTORS:
+        return "hnsw"
+    return "ivf_pq"
+
+
+def resolve_index_type(index_type: Optional[str], num_vectors: int) -> str:
+    """
+    Resolve a configured index type ("auto" or None selects by size).
+
+    Trained types fall back to flat when the corpus is too small to train on.
+
+    Raises:
+        ValueError: If index_type is not "auto" or one of INDEX_TYPES
+    """
+    if not index_type or index_type == "auto":
+        return select_index_type(num_vectors)
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown vector index type: {index_type}. Expected one of {INDEX_TYPES}")
+    if index_type != "flat" and num_vectors < MIN_TRAIN_VECTORS:
+        logger.info(f"{num_vectors} vectors are too few to train '{index_type}', using flat")
+        return "flat"
+    return index_type
+
+
+def default_params(index_type: str, num_vectors: int, dim: int) -> Dict[str, Any]:
+    """
+    Default build and search parameters for an index type.
+
+    Args:
+        index_type: One of INDEX_TYPES
+        num_vectors: Number of vectors in the store
+        dim: Embedding dimension
+
+    Returns:
+        Parameter dict (nlist/nprobe for IVF, m/nbits for PQ, M/ef_* for HNSW)
+    """
+    if index_type == "hnsw":
+        return {"M": 32, "ef_construction": 200, "ef_search": 64}
+    if index_type in ("ivf_flat", "ivf_pq"):
+        nlist = int(4 * np.sqrt(num_vectors))
+        nlist = max(1, min(nlist, num_vectors // MIN_POINTS_PER_CENTROID, 65536))
+        params = {"nlist": nlist, "nprobe": min(nlist, max(8, nlist // 64))}
+        if index_type == "ivf_pq":
+            # Sub-quantizers of 8 dimensions each when the dimension allows it
+            sub_dim = next(s for s in (8, 4, 2, 1) if dim % s == 0)
+            nbits = int(np.log2(max(num_vectors // MIN_POINTS_PER_CENTROID, 16)))
+            params.update({"m": dim // sub_dim, "nbits": max(4, min(8, nbits))})
+        return params
+    return {}
+
+
+def build_ann_index(
+    vectors: np.ndarray,
+    index_type: Optional[str] = "auto",
+    params: Optional[Dict[str, Any]] = None,
+    seed: int = 0,
+) -> Tuple[Any, str, Dict[str, Any]]:
+    """
+    Build and populate a FAISS inner-product index.
+
+    Args:
+        vectors: L2-normalized (N, D) float32 matrix
+        index_type: "auto" or one of INDEX_TYPES
+        params: Overrides for default_params()
+        seed: Seed for the training sample
+
+    Returns:
+        Tuple of (index, resolved index type, effective parameters)
+    """
+    import faiss
+
+    num_vectors, dim = vectors.shape
+    index_type = resolve_index_type(index_type, num_vectors)
+    params = {**default_params(index_type, num_vectors, dim), **(params or {})}
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+    if index_type == "flat":
+        index = faiss.IndexFlatIP(dim)
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, params["M"], faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = params["ef_construction"]
+    else:
+        quantizer = faiss.IndexFlatIP(dim)
+        if index_type == "ivf_flat":
+            index = faiss.IndexIVFFlat(quantizer, dim, params["nlist"], faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexIVFPQ(
+                quantizer,
+                dim,
+                params["nlist"],
+                params["m"],
+                params["nbits"],
+                faiss.METRIC_INNER_PRODUCT,
+            )
+
+        train_size = params["nlist"] * 64
+        if index_type == "ivf_pq":
+            train_size = max(train_size, (1 << params["nbits"]) * 64)
+        train_size = min(num_vectors, train_size, MAX_TRAIN_VECTORS)
+        rng = np.random.default_rng(seed)
+        sample = np.sort(rng.choice(num_vectors, size=train_size, replace=False))
+        start = time.perf_counter()
+        index.train(vectors[sample])
+        logger.info(
+            f"Trained {index_type} index on {train_size} vectors "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+    index.add(vectors)
+    set_search_params(index, params)
+    return index, index_type, params
+
+
+def set_search_params(index: Any, params: Dict[str, Any]) -> None:
+    """
+    Apply query-time parameters (nprobe / ef_search) to a loaded index.
+
+    Args:
+        index: FAISS index
+        params: Parameter dict as stored in info.json["index_params"]
+    """
+    import faiss
+
+    if "nprobe" in params:
+        ivf = faiss.try_extract_index_ivf(index)
+        if ivf is not None:
+            ivf.nprobe = int(params["nprobe"])
+    if "ef_search" in params and hasattr(index, "hnsw"):
+        index.hnsw.efSearch = int(params["ef_search"])
+
+
+def search_parameters(index: Any, selector: Any) -> Any:
+    """
+    Search parameters that restrict a search to the rows accepted by ``selector``.
+
+    The index's own nprobe / ef_search are carried over, since per-call
+    parameters replace them.
+
+    Args:
+        index: FAISS index
+        selector: FAISS IDSelector
+
+    Returns:
+        SearchParameters to pass as ``index.search(..., params=...)``
+    """
+    import faiss
+
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        return faiss.SearchParametersIVF(sel=selector, nprobe=ivf.nprobe)
+    if hasattr(index, "hnsw"):
+        return faiss.SearchParametersHNSW(sel=selector, efSearch=index.hnsw.efSearch)
+    return faiss.SearchParameters(sel=selector)
+
+
+def exact_search(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """
+    Exact top-k inner-product search, scanning vectors in blocks.
+
+    Args:
+        vectors: (N, D) matrix (may be memory-mapped)
+        queries: (Q, D) float32 matrix
+        k: Number of neighbours (<= N)
+
+    Returns:
+        (Q, k) int64 row ids, unordered within each row
+    """
+    best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    best_ids = np.zeros((len(queries), k), dtype=np.int64)
+    block = 65536
+    for start in range(0, len(vectors), block):
+        sims = queries @ np.asarray(vectors[start : start + block], dtype=np.float32).T
+        ids = np.broadcast_to(np.arange(start, start + sims.shape[1]), sims.shape)
+        scores = np.concatenate([best_scores, sims], axis=1)
+        candidates = np.concatenate([best_ids, ids], axis=1)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, top, axis=1)
+        best_ids = np.take_along_axis(candidates, top, axis=1)
+    return best_ids
+
+
+def self_check(
+    index: Any,
+    vectors: np.ndarray,
+    index_type: str,
+    params: Dict[str, Any],
+    k: int = 10,
+    num_queries: int = 100,
+    target_recall: float = TARGET_RECALL,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Measure recall@k and latency against exact search, tuning search parameters.
+
+    Stored vectors are used as queries. For approximate indexes, ``nprobe`` or
+    ``ef_search`` is doubled until ``target_recall`` is reached or the
+    parameter hits its ceiling; ``params`` is updated in place.
+
+    Args:
+        index: Populated FAISS index
+        vectors: The (N, D) matrix the index was built from
+        index_type: Resolved index type
+        params: Effective parameters (updated with the tuned values)
+        k: Neighbours per query
+        num_queries: Number of sampled queries
+        target_recall: Recall@k to aim for
+        seed: Seed for the query sample
+
+    Returns:
+        Report with recall, per-query latency of ANN and exact search, and k
+    """
+    num_vectors = len(vectors)
+    k = min(k, num_vectors)
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(num_vectors, size=min(num_queries, num_vectors), replace=False)
+    queries = np.ascontiguousarray(vectors[np.sort(sample)], dtype=np.float32)
+
+    start = time.perf_counter()
+    truth = exact_search(vectors, queries, k)
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    knob, ceiling = None, None
+    if index_type in ("ivf_flat", "ivf_pq"):
+        knob, ceiling = "nprobe", params["nlist"]
+    elif index_type == "hnsw":
+        knob, ceiling = "ef_search", MAX_EF_SEARCH
+
+    while True:
+        set_search_params(index, params)
+        start = time.perf_counter()
+        _, found = index.search(queries, k)
+        ann_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        hits = sum(len(set(t) & set(f)) for t, f in zip(truth.tolist(), found.tolist()))
+        recall = hits / truth.size
+        if knob is None or recall >= target_recall or params[knob] >= ceiling:
+            break
+        params[knob] = min(params[knob] * 2, ceiling)
+
+    if recall < target_recall:
+        logger.warning(
+            f"{index_type} index reaches recall@{k}={recall:.3f} "
+            f"(target {target_recall}) with {params}"
+        )
+    return {
+        "k": k,
+        "num_queries": len(queries),
+        "recall": round(recall, 4),
+        "ann_ms_per_query": round(ann_ms, 3),
+        "exact_ms_per_query": round(exact_ms, 3),
+    }
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Vector Index Cache
+==================
+
+Process-wide cache of loaded vector indexes and their chunk metadata.
+
+Reading ``index.faiss`` and ``metadata.json`` from disk on every query is the
+dominant latency cost of dense retrieval on large knowledge bases. This cache
+keeps loaded entries in memory, keyed by the KB's ``vector_store`` directory:
+
+- Entries are evicted least-recently-used first once the byte budget is exceeded
+- An entry is reloaded only when one of its backing files changes on disk
+  (detected via mtime/size, so a rebuild in another process is picked up)
+- Hit/miss/eviction counters are exposed through ``stats()``
+
+A second instance, ``get_llamaindex_cache()``, keeps loaded LlamaIndex
+``VectorStoreIndex`` objects resident, keyed by their ``llamaindex_storage``
+directory and watching the JSON files LlamaIndex persists.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from src.logging import get_logger
+
+logger = get_logger("VectorIndexCache")
+
+# Files whose modification invalidates a cached entry
+WATCHED_FILES = (
+    "info.json",
+    "index.faiss",
+    "embeddings.npy",
+    "chunks.jsonl",
+    "tombstones.json",
+    # Legacy (format 1) layout
+    "metadata.json",
+    "embeddings.pkl",
+)
+
+# Files persisted by LlamaIndex's StorageContext
+LLAMAINDEX_FILES = (
+    "docstore.json",
+    "index_store.json",
+    "default__vector_store.json",
+    "image__vector_store.json",
+    "graph_store.json",
+)
+
+# Default budget, overridable via RAG_INDEX_CACHE_MAX_MB
+DEFAULT_MAX_MB = 1024
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass
+class CachedIndex:
+    """
+    A loaded vector store.
+
+    Attributes:
+        info: Parsed info.json (empty dict if missing)
+        metadata: Chunk records aligned with index/embedding rows (a list, or
+            a lazily-read ChunkStore for the current on-disk format)
+        index: Loaded FAISS index, or None for the non-FAISS layout
+        embeddings: Embedding matrix (memory-mapped and pre-normalized for the
+            current on-disk format); for FAISS stores, the canonical matrix
+            used for exact filtered search, or None if it is missing
+        tombstones: Sorted ids of deleted rows to exclude from results
+        row_filter: Row masks for tombstones and metadata filters
+        engine: NumPy search engine for the non-FAISS layout
+        nbytes: Approximate resident size used for the LRU budget
+    """
+
+    info: Dict[str, Any]
+    metadata: Sequence[Dict[str, Any]]
+    index: Any = None
+    embeddings: Any = None
+    tombstones: Any = None
+    row_filter: Any = None
+    engine: Any = None
+    nbytes: int = 0
+    signature: Signature = field(default=(), repr=False)
+
+
+def get_signature(store_dir: Path, names: Sequence[str] = WATCHED_FILES) -> Signature:
+    """
+    Compute the on-disk signature of a vector store directory.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        names: Files to include in the signature
+
+    Returns:
+        Tuple of (filename, mtime_ns, size) for every watched file that exists
+    """
+    signature = []
+    for name in names:
+        try:
+            st = os.stat(store_dir / name)
+        except FileNotFoundError:
+            continue
+        signature.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+class VectorIndexCache:
+    """
+    Size-bounded LRU cache of loaded vector stores.
+
+    Thread-safe: lookups may come from the event loop or from executor threads.
+    Loading happens outside the lock so one slow load does not block hits on
+    other knowledge bases.
+    """
+
+    def __init__(
+        self, max_bytes: Optional[int] = None, watched_files: Sequence[str] = WATCHED_FILES
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget. Defaults to RAG_INDEX_CACHE_MAX_MB (1024 MB).
+            watched_files: Files whose change invalidates an entry
+        """
+        if max_bytes is None:
+            max_bytes = int(os.getenv("RAG_INDEX_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.watched_files = tuple(watched_files)
+        self._entries: "OrderedDict[str, CachedIndex]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+
+    def get(self, store_dir: Path, loader: Callable[[Path], CachedIndex]) -> CachedIndex:
+        """
+        Return the cached entry for a store, loading it if absent or stale.
+
+        Args:
+            store_dir: Path to the KB's vector_store directory
+            loader: Callable that loads a CachedIndex from store_dir
+
+        Returns:
+            CachedIndex for the current on-disk state
+        """
+        key = str(Path(store_dir).resolve())
+        signature = get_signature(Path(store_dir), self.watched_files)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.signature == signature:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                # Files changed on disk since the entry was loaded
+                self._remove(key)
+                self.reloads += 1
+            self.misses += 1
+
+        entry = loader(Path(store_dir))
+        entry.signature = signature
+
+        with self._lock:
+            if entry.nbytes > self.max_bytes:
+                logger.warning(
+                    f"Vector store {key} ({entry.nbytes / 1e6:.1f} MB) exceeds cache budget "
+                    f"({self.max_bytes / 1e6:.1f} MB), not caching"
+                )
+                return entry
+            if key in self._entries:
+                # A concurrent load finished first; keep the newer one
+                self._remove(key)
+            self._entries[key] = entry
+            self._current_bytes += entry.nbytes
+            self._evict_to_budget()
+
+        return entry
+
+    def invalidate(self, store_dir: Optional[Path] = None) -> None:
+        """
+        Drop a cached entry, or every entry if store_dir is None.
+
+        Args:
+            store_dir: Path to the KB's vector_store directory
+        """
+        with self._lock:
+            if store_dir is None:
+                self._entries.clear()
+                self._current_bytes = 0
+                return
+            key = str(Path(store_dir).resolve())
+            if key in self._entries:
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "reloads": self.reloads,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._current_bytes -= entry.nbytes
+
+    def _evict_to_budget(self) -> None:
+        while self._current_bytes > self.max_bytes and len(self._entries) > 1:
+            key, _ = next(iter(self._entries.items()))
+            self._remove(key)
+            self.evictions += 1
+            logger.debug(f"Evicted vector store from cache: {key}")
+
+
+# Singleton instance
+_cache: Optional[VectorIndexCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_index_cache() -> VectorIndexCache:
+    """
+    Get or create the process-wide vector index cache.
+
+    Returns:
+        VectorIndexCache instance
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = VectorIndexCache()
+    return _cache
+
+
+def reset_index_cache():
+    """Reset the singleton vector index cache."""
+    global _cache
+    _cache = None
+
+
+_llamaindex_cache: Optional[VectorIndexCache] = None
+
+
+def get_llamaindex_cache() -> VectorIndexCache:
+    """
+    Get or create the process-wide cache of loaded LlamaIndex indexes.
+
+    The byte budget comes from RAG_LLAMAINDEX_CACHE_MAX_MB (default 1024 MB).
+
+    Returns:
+        VectorIndexCache instance watching LlamaIndex storage files
+    """
+    global _llamaindex_cache
+    if _llamaindex_cache is None:
+        with _cache_lock:
+            if _llamaindex_cache is None:
+                max_mb = int(os.getenv("RAG_LLAMAINDEX_CACHE_MAX_MB", DEFAULT_MAX_MB))
+                _llamaindex_cache = VectorIndexCache(
+                    max_bytes=max_mb * 1024 * 1024, watched_files=LLAMAINDEX_FILES
+                )
+    return _llamaindex_cache
+
+
+def reset_llamaindex_cache():
+    """Reset the singleton LlamaIndex index cache."""
+    global _llamaindex_cache
+    _llamaindex_cache = None
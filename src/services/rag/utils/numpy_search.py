@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+NumPy Vector Search
+===================
+
+Exact cosine-similarity search over a ``vector_store/`` embedding matrix, for
+hosts where FAISS is unavailable.
+
+- Rows are normalized once when the engine is created (stores written in the
+  current format are already normalized on disk and are used as-is)
+- Any number of queries is scored with one matrix product per block of rows,
+  so memory-mapped float16 matrices are upcast a block at a time
+- Top-k candidates are selected with ``np.argpartition`` (O(N)) and only the
+  k winners are sorted
+- Deleted rows and metadata filters are applied as boolean row masks
+- ``search_rows()`` scores only a given subset of rows, for selective filters
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rows scored per matrix product; bounds the float32 copy of a float16 block
+BLOCK_ROWS = 65536
+
+
+class RowFilter:
+    """
+    Boolean row masks for tombstones and metadata filters.
+
+    Filters map a field to an allowed value or list of values, e.g.
+    ``{"doc_id": ["a.pdf", "b.pdf"], "type": "text"}``. A field is looked up on
+    the chunk record first and then in its ``metadata`` dict. The values of a
+    field are read once per store and kept as a column array.
+    """
+
+    def __init__(self, metadata: Sequence[Dict[str, Any]], tombstones: Optional[np.ndarray] = None):
+        """
+        Initialize the filter.
+
+        Args:
+            metadata: Chunk records aligned with matrix rows
+            tombstones: Ids of deleted rows
+        """
+        self.metadata = metadata
+        self.alive = np.ones(len(metadata), dtype=bool)
+        if tombstones is not None and len(tombstones):
+            self.alive[tombstones[tombstones < len(metadata)]] = False
+        self._columns: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def mask(self, filters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Rows that are not deleted and match every filter.
+
+        Args:
+            filters: Field -> allowed value(s)
+
+        Returns:
+            Boolean array of length N
+        """
+        mask = self.alive
+        for field, allowed in (filters or {}).items():
+            if not isinstance(allowed, (list, tuple, set, frozenset)):
+                allowed = [allowed]
+            mask = mask & np.isin(self._column(field), list(allowed))
+        return mask
+
+    def _column(self, field: str) -> np.ndarray:
+        with self._lock:
+            column = self._columns.get(field)
+            if column is None:
+                records = (
+                    self.metadata.get_many(range(len(self.metadata)))
+                    if hasattr(self.metadata, "get_many")
+                    else self.metadata
+                )
+                column = np.empty(len(self.metadata), dtype=object)
+                column[:] = [
+                    record[field] if field in record else record.get("metadata", {}).get(field)
+                    for record in records
+                ]
+                self._columns[field] = column
+            return column
+
+
+class NumpySearchEngine:
+    """
+    Batched exact top-k search over an embedding matrix.
+    """
+
+    def __init__(self, embeddings: np.ndarray, row_filter: RowFilter, normalized: bool = False):
+        """
+        Initialize the engine.
+
+        Args:
+            embeddings: (N, D) matrix, possibly memory-mapped
+            row_filter: Masks for deleted rows and metadata filters
+            normalized: True if rows are already L2-normalized (left untouched,
+                so memory-mapped pages stay on disk until searched)
+        """
+        if not normalized:
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            # Replace zero norms with 1 to avoid division by zero
+            embeddings = embeddings / np.where(norms == 0, 1, norms)
+        self.embeddings = embeddings
+        self.row_filter = row_filter
+
+    @property
+    def nbytes(self) -> int:
+        """Resident size (zero for a memory-mapped matrix)."""
+        return 0 if isinstance(self.embeddings, np.memmap) else int(self.embeddings.nbytes)
+
+    def scores(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of every query against every row.
+
+        Args:
+            queries: (Q, D) matrix
+
+        Returns:
+            (Q, N) float32 similarities
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1, norms)
+
+        num_rows = len(self.embeddings)
+        if self.embeddings.dtype == np.float32 and num_rows <= BLOCK_ROWS:
+            return np.asarray(queries @ self.embeddings.T)
+
+        out = np.empty((len(queries), num_rows), dtype=np.float32)
+        for start in range(0, num_rows, BLOCK_ROWS):
+            block = np.asarray(self.embeddings[start : start + BLOCK_ROWS], dtype=np.float32)
+            out[:, start : start + len(block)] = queries @ block.T
+        return out
+
+    def search(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Top-k rows for each query.
+
+        Args:
+            queries: (Q, D) matrix, or a single (D,) vector
+            top_k: Number of results per query
+            filters: Field -> allowed value(s), see RowFilter
+
+        Returns:
+            Per query, a list of (row id, similarity) sorted by descending similarity
+        """
+        queries = np.atleast_2d(queries)
+        num_rows = len(self.embeddings)
+        k = min(top_k, num_rows)
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        similarities = self.scores(queries)
+        mask = self.row_filter.mask(filters)[:num_rows]
+        if not mask.all():
+            similarities[:, ~mask] = -np.inf
+
+        # O(N) candidate selection, then sort only the k winners
+        if k < num_rows:
+            top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(num_rows), (len(queries), num_rows))
+        top_scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        return [
+            [(int(i), float(s)) for i, s in zip(ids, scores) if np.isfinite(s)]
+            for ids, scores in zip(top, top_scores)
+        ]
+
+
+def search_rows(
+    embeddings: np.ndarray, row_ids: np.ndarray, queries: np.ndarray, top_k: int
+) -> List[List[Tuple[int, float]]]:
+    """
+    Exact top-k over a subset of rows of a normalized matrix.
+
+    Only the selected rows are read, so the cost is proportional to
+    ``len(row_ids)`` rather than to the size of the store.
+
+    Args:
+        embeddings: (N, D) L2-normalized matrix, possibly memory-mapped
+        row_ids: Sorted ids of the rows to search
+        queries: (Q, D) matrix
+        top_k: Number of results per query
+
+    Returns:
+        Per query, a list of (row id, similarity) sorted by descending similarity
+    """
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+    norms = np.linalg.norm(queries, axis=1, keepdims=True)
+    queries = queries / np.where(norms == 0, 1, norms)
+    k = min(top_k, len(row_ids))
+    if k <= 0:
+        return [[] for _ in range(len(queries))]
+
+    similarities = np.empty((len(queries), len(row_ids)), dtype=np.float32)
+    for start in range(0, len(row_ids), BLOCK_ROWS):
+        block = np.asarray(embeddings[row_ids[start : start + BLOCK_ROWS]], dtype=np.float32)
+        similarities[:, start : start + len(block)] = queries @ block.T
+
+    if k < len(row_ids):
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(len(row_ids)), (len(queries), len(row_ids)))
+    top_scores = np.take_along_axis(similarities, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+    return [
+        [(int(row_ids[i]), float(s)) for i, s in zip(ids, scores)]
+        for ids, scores in zip(top, top_scores)
+    ]
@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+"""
+Binary Vector Store
+===================
+
+Memory-mapped on-disk layout for the ``vector_store/`` directory of a KB.
+
+Format 2 (current):
+- ``embeddings.npy``: L2-normalized float32/float16 matrix, opened with
+  ``np.load(mmap_mode="r")`` so only the pages touched by a search are resident.
+  This is the canonical copy of the vectors; ``index.faiss``, when present, is
+  derived from it and can be rebuilt (e.g. by compaction).
+- ``chunks.jsonl``: one JSON chunk record per line
+- ``chunks.offsets.npy``: int64 byte offsets (N + 1) into chunks.jsonl, so a
+  search reads only the top-k records instead of parsing every chunk
+- ``tombstones.json``: row ids of deleted chunks, dropped at query time until
+  ``compact_store()`` rewrites the store without them
+- ``info.json``: ``"format": 2`` plus dtype/normalization details
+
+Rows are append-only: ``append_chunks()``/``append_embeddings()`` extend the
+files in place (only the .npy headers are rewritten), so adding a document
+costs time proportional to the new content, not to the size of the KB.
+Writers must hold ``store_lock(store_dir)``; readers hold it only while
+opening the files, so they never observe a half-compacted store.
+
+Format 1 (legacy): ``embeddings.pkl`` (pickled float32 matrix) and an indented
+``metadata.json`` list. ``migrate_legacy_store()`` converts it in place.
+"""
+
+from collections.abc import Sequence
+import io
+import json
+import os
+from pathlib import Path
+import pickle
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.logging import get_logger
+
+logger = get_logger("VectorStore")
+
+STORE_FORMAT = 2
+
+EMBEDDINGS_FILE = "embeddings.npy"
+CHUNKS_FILE = "chunks.jsonl"
+OFFSETS_FILE = "chunks.offsets.npy"
+INFO_FILE = "info.json"
+TOMBSTONES_FILE = "tombstones.json"
+
+LEGACY_EMBEDDINGS_FILE = "embeddings.pkl"
+LEGACY_METADATA_FILE = "metadata.json"
+
+SUPPORTED_DTYPES = ("float32", "float16")
+
+_store_locks: Dict[str, threading.Lock] = {}
+_store_locks_guard = threading.Lock()
+
+
+def store_lock(store_dir: Path) -> threading.Lock:
+    """
+    Get the process-wide write lock for a vector store directory.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+
+    Returns:
+        threading.Lock shared by every writer of that store
+    """
+    key = str(Path(store_dir).resolve())
+    with _store_locks_guard:
+        if key not in _store_locks:
+            _store_locks[key] = threading.Lock()
+        return _store_locks[key]
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize the rows of a matrix, leaving zero rows untouched.
+
+    Args:
+        matrix: 2-D array of vectors
+
+    Returns:
+        New float32 array with unit-norm rows
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def write_chunks(store_dir: Path, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Write chunk records as JSON lines plus a byte-offset index.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        records: Chunk records in row order
+
+    Returns:
+        Number of records written
+    """
+    chunks_tmp = store_dir / f"{CHUNKS_FILE}.tmp"
+    offsets = [0]
+    with open(chunks_tmp, "wb") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            offsets.append(f.tell())
+
+    offsets_tmp = store_dir / f"{OFFSETS_FILE}.tmp.npy"
+    np.save(offsets_tmp, np.asarray(offsets, dtype=np.int64))
+
+    os.replace(chunks_tmp, store_dir / CHUNKS_FILE)
+    os.replace(offsets_tmp, store_dir / OFFSETS_FILE)
+    return len(offsets) - 1
+
+
+def _append_npy(path: Path, rows: np.ndarray) -> None:
+    """
+    Append rows to a C-ordered .npy file in place.
+
+    Data is written before the header is updated, so an interrupted append
+    leaves a valid file with the old shape. Falls back to a full rewrite if
+    the new header would not fit in the existing header block.
+
+    Args:
+        path: .npy file to extend
+        rows: Array whose trailing dimensions match the stored array
+    """
+    fmt = np.lib.format
+    with open(path, "r+b") as f:
+        version = fmt.read_magic(f)
+        if version == (1, 0):
+            read_header, write_header = fmt.read_array_header_1_0, fmt.write_array_header_1_0
+        else:
+            read_header, write_header = fmt.read_array_header_2_0, fmt.write_array_header_2_0
+        shape, fortran_order, dtype = read_header(f)
+        header_len = f.tell()
+
+        rows = np.ascontiguousarray(rows, dtype=dtype)
+        if fortran_order or rows.shape[1:] != shape[1:]:
+            raise ValueError(f"Cannot append rows of shape {rows.shape} to {path} ({shape})")
+
+        new_shape = (shape[0] + rows.shape[0],) + tuple(shape[1:])
+        header = io.BytesIO()
+        write_header(
+            header,
+            {"descr": fmt.dtype_to_descr(dtype), "fortran_order": False, "shape": new_shape},
+        )
+
+        if len(header.getvalue()) == header_len:
+            f.seek(header_len + int(np.prod(shape)) * dtype.itemsize)
+            f.write(rows.tobytes())
+            f.truncate()
+            f.seek(0)
+            f.write(header.getvalue())
+            return
+
+    existing = np.load(path)
+    tmp = path.with_name(f"{path.stem}.tmp.npy")
+    np.save(tmp, np.concatenate([existing, rows]))
+    os.replace(tmp, path)
+
+
+def append_chunks(store_dir: Path, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Append chunk records to an existing chunk store.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        records: New chunk records in row order
+
+    Returns:
+        Number of records appended
+    """
+    store_dir = Path(store_dir)
+    offsets = np.load(store_dir / OFFSETS_FILE)
+    base = int(offsets[-1])
+
+    new_offsets = []
+    with open(store_dir / CHUNKS_FILE, "r+b") as f:
+        # Drop any bytes left behind by an interrupted append
+        f.truncate(base)
+        f.seek(base)
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            new_offsets.append(f.tell())
+
+    if new_offsets:
+        _append_npy(store_dir / OFFSETS_FILE, np.asarray(new_offsets, dtype=np.int64))
+    return len(new_offsets)
+
+
+def append_embeddings(store_dir: Path, embeddings: np.ndarray) -> None:
+    """
+    Normalize and append rows to embeddings.npy, keeping its stored dtype.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        embeddings: Raw (N, D) embedding matrix
+    """
+    _append_npy(Path(store_dir) / EMBEDDINGS_FILE, normalize_rows(embeddings))
+
+
+def write_embeddings(store_dir: Path, embeddings: np.ndarray, dtype: str = "float32") -> None:
+    """
+    Write a normalized embedding matrix as .npy.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        embeddings: Raw (N, D) embedding matrix
+        dtype: Storage dtype, "float32" or "float16"
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported vector dtype: {dtype}. Use one of {SUPPORTED_DTYPES}")
+
+    tmp = store_dir / f"{EMBEDDINGS_FILE}.tmp.npy"
+    np.save(tmp, normalize_rows(embeddings).astype(dtype))
+    os.replace(tmp, store_dir / EMBEDDINGS_FILE)
+
+
+def open_embeddings(store_dir: Path) -> np.ndarray:
+    """
+    Open the embedding matrix read-only as a memory map.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+
+    Returns:
+        np.memmap of shape (N, D)
+    """
+    return np.load(store_dir / EMBEDDINGS_FILE, mmap_mode="r")
+
+
+class ChunkStore(Sequence):
+    """
+    Read-only, offset-indexed view over chunks.jsonl.
+
+    Behaves like the list previously loaded from metadata.json (``len()``,
+    ``store[i]``) but reads a record from disk only when it is accessed.
+
+    The chunk file stays open for the lifetime of the store, so a view keeps
+    reading the snapshot it was opened on even if compaction replaces the
+    files; appends only extend the files and never disturb existing rows.
+    """
+
+    def __init__(self, store_dir: Path):
+        """
+        Open a chunk store.
+
+        Args:
+            store_dir: Path to the KB's vector_store directory
+        """
+        self.path = Path(store_dir) / CHUNKS_FILE
+        if not self.path.exists():
+            raise FileNotFoundError(f"Chunk file not found: {self.path}")
+        self.offsets = np.load(Path(store_dir) / OFFSETS_FILE, mmap_mode="r")
+        self._file = open(self.path, "rb")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return max(len(self.offsets) - 1, 0)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.get_many(range(*idx.indices(len(self))))
+        return self.get_many([idx])[0]
+
+    def __del__(self):
+        file = getattr(self, "_file", None)
+        if file is not None:
+            file.close()
+
+    def get_many(self, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Read several records.
+
+        Args:
+            ids: Row ids to read, in the desired output order
+
+        Returns:
+            List of chunk records
+        """
+        records = []
+        n = len(self)
+        with self._lock:
+            for i in ids:
+                i = int(i)
+                if i < 0:
+                    i += n
+                if not 0 <= i < n:
+                    raise IndexError(f"Chunk index out of range: {i}")
+                start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+                self._file.seek(start)
+                records.append(json.loads(self._file.read(end - start)))
+        return records
+
+    @property
+    def nbytes(self) -> int:
+        """Resident size of the offset index."""
+        return int(self.offsets.nbytes)
+
+
+def load_tombstones(store_dir: Path) -> np.ndarray:
+    """
+    Load the ids of deleted rows.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+
+    Returns:
+        Sorted int64 array of tombstoned row ids (empty if none)
+    """
+    path = Path(store_dir) / TOMBSTONES_FILE
+    if not path.exists():
+        return np.empty(0, dtype=np.int64)
+    with open(path, "r", encoding="utf-8") as f:
+        return np.asarray(sorted(json.load(f)), dtype=np.int64)
+
+
+def add_tombstones(store_dir: Path, ids: Iterable[int]) -> int:
+    """
+    Mark rows as deleted.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        ids: Row ids to tombstone
+
+    Returns:
+        Total number of tombstoned rows
+    """
+    merged = sorted(set(load_tombstones(store_dir).tolist()) | {int(i) for i in ids})
+    tmp = Path(store_dir) / f"{TOMBSTONES_FILE}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(merged, f)
+    os.replace(tmp, Path(store_dir) / TOMBSTONES_FILE)
+    return len(merged)
+
+
+def find_rows(store_dir: Path, doc_ids: Iterable[str]) -> List[int]:
+    """
+    Find live rows belonging to the given documents.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        doc_ids: Document identifiers (the ``doc_id`` field of chunk records)
+
+    Returns:
+        Matching row ids, excluding rows that are already tombstoned
+    """
+    wanted = set(doc_ids)
+    dead = set(load_tombstones(store_dir).tolist())
+    num_rows = len(ChunkStore(store_dir))
+    rows = []
+    with open(Path(store_dir) / CHUNKS_FILE, "rb") as f:
+        for i, line in enumerate(f):
+            if i >= num_rows:
+                break
+            if i not in dead and json.loads(line).get("doc_id") in wanted:
+                rows.append(i)
+    return rows
+
+
+def compact_store(
+    store_dir: Path,
+    build_index: Optional[Callable[[np.ndarray], Optional[Dict[str, Any]]]] = None,
+) -> int:
+    """
+    Rewrite a store without its tombstoned rows.
+
+    Row ids are renumbered densely. The caller must hold ``store_lock``.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        build_index: Optional callback that rebuilds index.faiss from the
+            compacted (normalized) matrix; a returned dict is merged into info.json
+
+    Returns:
+        Number of rows removed
+    """
+    store_dir = Path(store_dir)
+    tombstones = load_tombstones(store_dir)
+    if len(tombstones) == 0:
+        return 0
+
+    chunks = ChunkStore(store_dir)
+    keep = np.ones(len(chunks), dtype=bool)
+    keep[tombstones[tombstones < len(chunks)]] = False
+    kept_ids = np.flatnonzero(keep)
+
+    def renumbered():
+        for new_id, record in enumerate(chunks.get_many(kept_ids)):
+            record["id"] = new_id
+            yield record
+
+    embeddings = open_embeddings(store_dir)
+    kept = np.asarray(embeddings[kept_ids[kept_ids < len(embeddings)]])
+    dtype = str(embeddings.dtype)
+    del embeddings
+
+    write_chunks(store_dir, renumbered())
+    write_embeddings(store_dir, kept, dtype=dtype)
+    index_info = build_index(normalize_rows(kept)) if build_index is not None else None
+
+    info = load_info(store_dir)
+    info.update(index_info or {})
+    info["num_chunks"] = int(len(kept_ids))
+    (store_dir / TOMBSTONES_FILE).unlink(missing_ok=True)
+    save_info(store_dir, info)
+
+    removed = len(chunks) - len(kept_ids)
+    logger.info(f"Compacted vector store {store_dir}: removed {removed} rows")
+    return removed
+
+
+def is_current_format(info: Dict[str, Any]) -> bool:
+    """Return True if info.json describes a format-2 store."""
+    return info.get("format", 1) >= STORE_FORMAT
+
+
+def load_info(store_dir: Path) -> Dict[str, Any]:
+    """
+    Load info.json, returning an empty dict if it is missing.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+    """
+    info_file = Path(store_dir) / INFO_FILE
+    if not info_file.exists():
+        return {}
+    with open(info_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_info(store_dir: Path, info: Dict[str, Any]) -> None:
+    """
+    Write info.json atomically. Written last so readers never see new info
+    pointing at half-written data files.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        info: Store description
+    """
+    tmp = Path(store_dir) / f"{INFO_FILE}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(info, f, indent=2)
+    os.replace(tmp, Path(store_dir) / INFO_FILE)
+
+
+def migrate_legacy_store(
+    store_dir: Path,
+    dtype: str = "float32",
+    remove_legacy: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Convert a format-1 vector store (embeddings.pkl + metadata.json) in place.
+
+    The FAISS index, if any, is left untouched; only the chunk metadata and
+    the canonical matrix are rewritten. For FAISS stores the matrix is
+    reconstructed from the (flat) index when faiss is installed; otherwise the
+    indexer recreates it before its next append or compaction.
+
+    Args:
+        store_dir: Path to the KB's vector_store directory
+        dtype: Storage dtype for embeddings.npy
+        remove_legacy: Delete embeddings.pkl/metadata.json after converting
+
+    Returns:
+        The updated info dict, or None if there was nothing to migrate
+    """
+    store_dir = Path(store_dir)
+    info = load_info(store_dir)
+    metadata_file = store_dir / LEGACY_METADATA_FILE
+
+    if is_current_format(info):
+        logger.info(f"Vector store already in format {STORE_FORMAT}: {store_dir}")
+        return None
+    if not metadata_file.exists():
+        logger.warning(f"No legacy metadata.json found in {store_dir}")
+        return None
+
+    with open(metadata_file, "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    pickle_file = store_dir / LEGACY_EMBEDDINGS_FILE
+    if not info.get("use_faiss", False):
+        if not pickle_file.exists():
+            raise FileNotFoundError(f"Embeddings file not found: {pickle_file}")
+        with open(pickle_file, "rb") as f:
+            embeddings = pickle.load(f)
+        if len(embeddings) != len(metadata):
+            raise ValueError(
+                f"Embedding rows ({len(embeddings)}) do not match metadata records "
+                f"({len(metadata)}) in {store_dir}"
+            )
+        write_embeddings(store_dir, embeddings, dtype=dtype)
+        info["dtype"] = dtype
+    elif (store_dir / "index.faiss").exists():
+        try:
+            import faiss
+        except ImportError:
+            logger.warning(f"FAISS not available, {EMBEDDINGS_FILE} not written for {store_dir}")
+        else:
+            index = faiss.read_index(str(store_dir / "index.faiss"))
+            write_embeddings(store_dir, index.reconstruct_n(0, index.ntotal), dtype=dtype)
+            info["dtype"] = dtype
+
+    write_chunks(store_dir, metadata)
+    info.update({"format": STORE_FORMAT, "normalized": True, "num_chunks": len(metadata)})
+    info.setdefault("use_faiss", False)
+    save_info(store_dir, info)
+
+    if remove_legacy:
+        metadata_file.unlink(missing_ok=True)
+        pickle_file.unlink(missing_ok=True)
+
+    logger.info(f"Migrated vector store with {len(metadata)} chunks: {store_dir}")
+    return info
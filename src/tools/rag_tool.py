@@ -69,6 +69,42 @@ async def rag_search(
         raise Exception(f"RAG search failed: {e}")
 
 
+async def rag_search_many(
+    queries: List[str],
+    kb_name: Optional[str] = None,
+    mode: str = "hybrid",
+    provider: Optional[str] = None,
+    kb_base_dir: Optional[str] = None,
+    **kwargs,
+) -> List[dict]:
+    """
+    Query knowledge base with several queries in one batched call.
+
+    Args:
+        queries: Query questions
+        kb_name: Knowledge base name (optional, defaults to default knowledge base)
+        mode: Query mode (e.g., "hybrid", "local", "global", "naive")
+        provider: RAG pipeline to use (defaults to RAG_PROVIDER env var or "raganything")
+        kb_base_dir: Base directory for knowledge bases (for testing)
+        **kwargs: Additional parameters passed to the RAG pipeline
+
+    Returns:
+        list: One result dictionary per query (same keys as rag_search), in input order
+
+    Raises:
+        Exception: If the query fails
+
+    Example:
+        results = await rag_search_many(["What is ML?", "What is DL?"], kb_name="textbook")
+    """
+    service = RAGService(kb_base_dir=kb_base_dir, provider=provider)
+
+    try:
+        return await service.search_many(queries=queries, kb_name=kb_name, mode=mode, **kwargs)
+    except Exception as e:
+        raise Exception(f"RAG search failed: {e}")
+
+
 async def initialize_rag(
     kb_name: str,
     documents: List[str],
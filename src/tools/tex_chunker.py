@@ -15,7 +15,7 @@ Based on: TODO.md specification
 import os
 import re
 
-import tiktoken
+from src.services.llm.tokenizer import get_token_counter
 
 
 class TexChunker:
@@ -32,15 +32,9 @@ class TexChunker:
         if model is None:
             model = os.getenv("LLM_MODEL")
 
-        try:
-            if model:
-                self.encoder = tiktoken.encoding_for_model(model)
-            else:
-                # Use cl100k_base as default encoding if no model specified
-                self.encoder = tiktoken.get_encoding("cl100k_base")
-        except Exception:
-            # If model not supported, use cl100k_base (GPT-4 encoding)
-            self.encoder = tiktoken.get_encoding("cl100k_base")
+        # Shared counter: encoding loaded once per model, counts of repeated
+        # sections/paragraphs memoized (cl100k_base for unknown models)
+        self.counter = get_token_counter(model or None)
 
     def estimate_tokens(self, text: str) -> int:
         """
@@ -55,8 +49,7 @@ class TexChunker:
         try:
             # Clean text: remove overly long repeated characters (may cause token explosion)
             cleaned_text = self._clean_text(text)
-            tokens = self.encoder.encode(cleaned_text)
-            return len(tokens)
+            return self.counter.count(cleaned_text)
         except Exception as e:
             # If encoding fails, use rough estimate: 1 token ≈ 4 chars
             print(f"  ⚠️ Token estimation failed, using rough estimate: {e!s}")
@@ -274,15 +267,20 @@ class TexChunker:
         Returns:
             Overlap text
         """
+        encoder = self.counter.encoding
+        if encoder is None:
+            # No tokenizer available: ~4 characters per token
+            return previous_chunk[-overlap_tokens * 4 :]
+
         # Encode entire chunk
-        tokens = self.encoder.encode(previous_chunk)
+        tokens = encoder.encode(previous_chunk, disallowed_special=())
 
         # Take last overlap_tokens tokens
         if len(tokens) <= overlap_tokens:
             return previous_chunk
 
         overlap_token_ids = tokens[-overlap_tokens:]
-        overlap_text = self.encoder.decode(overlap_token_ids)
+        overlap_text = encoder.decode(overlap_token_ids)
 
         return overlap_text
 
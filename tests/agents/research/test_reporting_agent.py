@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+from src.agents.research.agents.reporting_agent import ReportingAgent
+from src.agents.research.data_structures import TopicBlock
+
+
+def test_sections_written_concurrently_and_assembled_in_outline_order():
+    config = {"reporting": {"enable_citation_list": False, "max_parallel_sections": 2}}
+    agent = ReportingAgent(config=config, api_key="k", base_url="https://example.invalid")
+    blocks = [TopicBlock(block_id=f"block_{i}", sub_topic=f"T{i}", overview="o") for i in (1, 2, 3)]
+    outline = {
+        "title": "# Report",
+        "sections": [
+            {"block_id": "block_1", "title": "## One"},
+            {"block_id": "block_2", "title": "## Two", "subsections": [{"title": "### 2.1"}]},
+            {"block_id": "block_3", "title": "## Three"},
+        ],
+    }
+    delays = {"block_1": 0.2, "block_2": 0.1, "block_3": 0.1}
+    running = []
+    peak = []
+    seen = {}
+
+    async def fake_section(topic, block, section, subsections=None):
+        running.append(block.block_id)
+        peak.append(len(running))
+        await asyncio.sleep(delays[block.block_id])
+        running.remove(block.block_id)
+        return f"{section['title']}\n\nBody of **{block.sub_topic}**"
+
+    async def fake_intro(topic, blocks, outline, section_summaries=None):
+        seen["intro"] = section_summaries
+        return "intro"
+
+    async def fake_conclusion(topic, blocks, outline, section_summaries=None):
+        seen["conclusion"] = section_summaries
+        return "conclusion"
+
+    agent._write_section_body = fake_section
+    agent._write_section_with_subsections = fake_section
+    agent._write_introduction = fake_intro
+    agent._write_conclusion = fake_conclusion
+
+    start = time.monotonic()
+    report = asyncio.run(agent._write_report("topic", blocks, outline))
+    elapsed = time.monotonic() - start
+
+    assert max(peak) == 2
+    assert elapsed < 0.35
+    assert report.index("intro") < report.index("## One") < report.index("## Two")
+    assert report.index("## Two") < report.index("## Three") < report.index("conclusion")
+    assert (
+        seen["intro"]
+        == seen["conclusion"]
+        == {
+            "block_1": "Body of T1",
+            "block_2": "Body of T2",
+            "block_3": "Body of T3",
+        }
+    )
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+
+from src.agents.research.agents.manager_agent import ManagerAgent
+from src.agents.research.data_structures import DynamicTopicQueue, TopicStatus
+
+pytest.importorskip("arxiv")
+from src.agents.research.research_pipeline import ResearchPipeline  # noqa: E402
+
+
+class _Logger:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _Research:
+    def __init__(self, delays):
+        self.delays = delays
+        self.events = []
+
+    async def process(self, topic_block, manager_agent, **kwargs):
+        self.events.append(("start", topic_block.sub_topic))
+        await asyncio.sleep(self.delays[topic_block.sub_topic])
+        if topic_block.sub_topic == "fast":
+            await manager_agent.add_new_topic("discovered", "found while researching")
+        self.events.append(("end", topic_block.sub_topic))
+        return {}
+
+
+def test_discovered_topics_start_without_waiting_for_siblings():
+    queue = DynamicTopicQueue("research_test")
+    queue.add_block("slow", "o")
+    queue.add_block("fast", "o")
+    manager = ManagerAgent(config={}, api_key="k", base_url="https://example.invalid")
+    manager.set_queue(queue)
+    research = _Research({"slow": 0.4, "fast": 0.1, "discovered": 0.1})
+
+    pipeline = object.__new__(ResearchPipeline)
+    pipeline.config = {"researching": {"max_parallel_topics": 2}}
+    pipeline.queue = queue
+    pipeline.agents = {"manager": manager, "research": research, "note": None}
+    pipeline.citation_manager = None
+    pipeline.logger = _Logger()
+    pipeline._stage_events = {}
+    pipeline._log_researching_progress = lambda *args, **kwargs: None
+
+    start = time.monotonic()
+    asyncio.run(pipeline._phase2_researching_parallel())
+    elapsed = time.monotonic() - start
+
+    # The discovered topic runs alongside the slow sibling, not after it
+    assert research.events.index(("start", "discovered")) < research.events.index(("end", "slow"))
+    assert elapsed < 0.45
+    assert [b.status for b in queue.blocks] == [TopicStatus.COMPLETED] * 3
+    assert queue.work_queue is None
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import time
+
+from src.agents.solve.analysis_loop.investigate_agent import InvestigateAgent
+from src.agents.solve.memory import CitationMemory, InvestigateMemory
+
+
+def test_round_runs_tools_concurrently_with_stable_cite_ids(tmp_path):
+    config = {"solve": {"agents": {"investigate_agent": {"max_actions_per_round": 3}}}}
+    agent = InvestigateAgent(config=config, api_key="k", base_url="https://example.invalid")
+    delays = {"slow": 0.3, "medium": 0.2, "fast": 0.1}
+    plan = [{"tool": "rag_naive", "query": name} for name in delays]
+    plan.append({"tool": "rag_hybrid", "query": "broken"})
+    agent.max_actions_per_round = 4
+
+    async def fake_llm(**kwargs):
+        return json.dumps({"reasoning": "r", "plan": plan})
+
+    async def fake_rag(query, kb_name, output_dir):
+        await asyncio.sleep(delays[query])
+        return {"answer": f"answer to {query}"}
+
+    async def failing_rag(query, kb_name, output_dir):
+        raise RuntimeError("index unavailable")
+
+    agent.call_llm = fake_llm
+    agent._build_system_prompt = lambda: "system"
+    agent._build_user_prompt = lambda context: "user"
+    agent._call_rag_naive = fake_rag
+    agent._call_rag_hybrid = failing_rag
+
+    memory = InvestigateMemory(output_dir=str(tmp_path))
+    citations = CitationMemory(output_dir=str(tmp_path))
+
+    start = time.monotonic()
+    result = asyncio.run(
+        agent.process("q", memory, citations, output_dir=str(tmp_path), verbose=False)
+    )
+    elapsed = time.monotonic() - start
+
+    # Slowest tool, not the sum of all three
+    assert elapsed < 0.5
+    # Cite IDs and memory follow plan order, not completion order
+    assert [item.query for item in memory.knowledge_chain] == ["slow", "medium", "fast"]
+    assert result["knowledge_item_ids"] == [item.cite_id for item in memory.knowledge_chain]
+    assert [a["cite_id"] is None for a in result["actions"]] == [False, False, False, True]
+
+
+def test_fetch_tool_result_reports_timeouts_and_silent_errors():
+    config = {"solve": {"agents": {"investigate_agent": {"tool_timeout": 0.05}}}}
+    agent = InvestigateAgent(config=config, api_key="k", base_url="https://example.invalid")
+
+    async def hanging_rag(query, kb_name, output_dir):
+        await asyncio.sleep(1)
+
+    async def silent_rag(query, kb_name, output_dir):
+        raise KeyError()
+
+    agent._call_rag_naive = hanging_rag
+    agent._call_rag_hybrid = silent_rag
+
+    timed_out = asyncio.run(agent._fetch_tool_result("rag_naive", "q", None, "kb", None))
+    failed = asyncio.run(agent._fetch_tool_result("rag_hybrid", "q", None, "kb", None))
+
+    assert timed_out["error"] == "timed out after 0.05s"
+    assert failed["error"] == "KeyError()"
@@ -0,0 +1,65 @@
+import asyncio
+
+from src.agents.solve.memory import SolveChainStep, SolveMemory
+from src.agents.solve.solve_loop.manager_agent import ManagerAgent
+from src.agents.solve.solve_loop.solve_agent import SolveAgent
+from src.agents.solve.utils.step_scheduler import (
+    StepScheduler,
+    resolve_dependencies,
+    transitive_dependencies,
+)
+
+
+def _step(step_id, depends_on):
+    return SolveChainStep(step_id=step_id, step_target=step_id, depends_on=depends_on)
+
+
+def test_independent_steps_overlap_and_dependents_wait():
+    # S1 and S2 are independent, S3 integrates both, S4 only needs S2
+    steps = [_step("S1", []), _step("S2", []), _step("S3", ["S1", "S2"]), _step("S4", ["S2"])]
+    durations = {"S1": 0.2, "S2": 0.1, "S3": 0.1, "S4": 0.1}
+    events = []
+
+    async def runner(step):
+        events.append(("start", step.step_id))
+        await asyncio.sleep(durations[step.step_id])
+        events.append(("end", step.step_id))
+
+    report = asyncio.run(StepScheduler(max_parallel=3).run(steps, runner))
+
+    assert events[:2] == [("start", "S1"), ("start", "S2")]
+    assert events.index(("start", "S3")) > events.index(("end", "S1"))
+    assert events.index(("start", "S4")) < events.index(("end", "S1"))
+    assert report["critical_path"] == ["S1", "S3"]
+    assert 0.25 < report["critical_path_seconds"] < report["serial_seconds"]
+    assert report["wall_seconds"] < 0.4
+
+
+def test_plans_without_dependencies_stay_sequential():
+    steps = [_step("S1", None), _step("S2", None), _step("S3", ["S3", "S9", "S1"])]
+    dependencies = resolve_dependencies(steps)
+
+    assert dependencies == {"S1": [], "S2": ["S1"], "S3": ["S1"]}
+    assert transitive_dependencies("S2", dependencies) == {"S1"}
+
+
+def test_manager_normalizes_dependency_ids():
+    agent = ManagerAgent(config={}, api_key="k", base_url="https://example.invalid")
+
+    assert agent._parse_depends_on(["s1", "2", "[S1]", "s3"], "S3", ["S1", "S2"]) == ["S1", "S2"]
+    assert agent._parse_depends_on("none", "S2", ["S1"]) == []
+    assert agent._parse_depends_on(None, "S2", ["S1"]) is None
+
+
+def test_solve_prompt_only_includes_dependency_responses(tmp_path):
+    agent = SolveAgent(config={}, api_key="k", base_url="https://example.invalid")
+    memory = SolveMemory(output_dir=str(tmp_path))
+    memory.solve_chains = [_step("S1", []), _step("S2", []), _step("S3", ["S1"])]
+    for step in memory.solve_chains[:2]:
+        step.step_response = f"response of {step.step_id}"
+    dependencies = resolve_dependencies(memory.solve_chains)
+
+    previous = agent._format_previous_steps(memory.solve_chains[2], memory, dependencies)
+
+    assert "response of S1" in previous
+    assert "response of S2" not in previous
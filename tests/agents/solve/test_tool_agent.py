@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+from src.agents.solve.memory import CitationMemory, SolveChainStep, SolveMemory
+from src.agents.solve.solve_loop.tool_agent import ToolAgent
+
+
+def test_step_tool_calls_are_pipelined_and_code_runs_serialized(tmp_path):
+    agent = ToolAgent(config={}, api_key="k", base_url="https://example.invalid")
+    solve_memory = SolveMemory(output_dir=str(tmp_path))
+    citation_memory = CitationMemory(output_dir=str(tmp_path))
+    solve_memory.create_chains([SolveChainStep(step_id="S1", step_target="t")])
+    for tool_type, query in [
+        ("rag_hybrid", "slow"),
+        ("web_search", "fast"),
+        ("code_execution", "a"),
+        ("code_execution", "b"),
+    ]:
+        cite_id = citation_memory.add_citation(tool_type=tool_type, query=query)
+        solve_memory.append_tool_call("S1", tool_type, query, cite_id=cite_id)
+
+    running_code = []
+    overlapping_code = []
+
+    async def fake_execute(record, kb_name, output_dir, artifacts_dir, verbose):
+        if record.tool_type == "code_execution":
+            overlapping_code.append(bool(running_code))
+            running_code.append(record.query)
+            await asyncio.sleep(0.1)
+            running_code.remove(record.query)
+        else:
+            await asyncio.sleep(0.3 if record.query == "slow" else 0.1)
+        return f"raw {record.query}", {}
+
+    async def fake_summarize(tool_type, query, raw_answer):
+        await asyncio.sleep(0.1)
+        return f"summary of {raw_answer}"
+
+    agent._execute_single_call = fake_execute
+    agent._summarize_tool_result = fake_summarize
+
+    start = time.monotonic()
+    result = asyncio.run(
+        agent.process(
+            step=solve_memory.get_step("S1"),
+            solve_memory=solve_memory,
+            citation_memory=citation_memory,
+            kb_name="kb",
+            output_dir=str(tmp_path),
+        )
+    )
+    elapsed = time.monotonic() - start
+
+    # Slowest tool + its summary, instead of every call and summary in turn
+    assert elapsed < 0.6
+    assert overlapping_code == [False, False]
+    assert [log["summary"] for log in result["executed"]] == [
+        "summary of raw slow",
+        "summary of raw fast",
+        "summary of raw a",
+        "summary of raw b",
+    ]
+    assert all(call.status == "success" for call in solve_memory.get_step("S1").tool_calls)
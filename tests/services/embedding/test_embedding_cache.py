@@ -0,0 +1,44 @@
+import asyncio
+
+from src.services.embedding.cache import EmbeddingCache, make_cache_key
+
+
+def test_partial_hits_only_send_misses(tmp_path, monkeypatch):
+    from src.services.embedding import cache as cache_module
+    from src.services.embedding.client import EmbeddingClient
+    from src.services.embedding.config import EmbeddingConfig
+
+    path = tmp_path / "embeddings.sqlite"
+    monkeypatch.setattr(cache_module, "_cache", EmbeddingCache(path=path, max_items=2))
+
+    sent = []
+
+    async def fake_upstream(texts):
+        sent.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+    client = EmbeddingClient.__new__(EmbeddingClient)
+    client.config = EmbeddingConfig(model="m", api_key="", binding="openai", dim=2)
+    client.logger = cache_module.logger
+    client._embed_uncached = fake_upstream
+
+    first = asyncio.run(client.embed(["a", "bb", "a"]))
+    second = asyncio.run(client.embed(["bb", "ccc", "dddd"]))
+
+    assert sent == [["a", "bb"], ["ccc", "dddd"]]
+    assert first == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert second == [[2.0, 1.0], [3.0, 1.0], [4.0, 1.0]]
+
+    # A fresh process sees the vectors persisted on disk
+    reopened = EmbeddingCache(path=path, max_items=2)
+    keys = [make_cache_key(t, "openai", "m", 2) for t in ["a", "zzz"]]
+    assert reopened.get_many(keys) == [[1.0, 1.0], None]
+    assert make_cache_key("a", "openai", "other", 2) != keys[0]
+    assert make_cache_key("a", "openai", "m", 2, base_url="http://gpu-a:8000/v1") != keys[0]
+    assert make_cache_key("a", "openai", "m", 2, base_url="http://gpu-a:8000/v1") != (
+        make_cache_key("a", "openai", "m", 2, base_url="http://gpu-b:8000/v1")
+    )
+    assert make_cache_key("a", "openai", "m", 2, base_url="HTTP://GPU-A:8000/v1/") == (
+        make_cache_key("a", "openai", "m", 2, base_url="http://gpu-a:8000/v1")
+    )
+    assert reopened.stats()["disk_hits"] == 1
@@ -0,0 +1,60 @@
+import asyncio
+
+from aiohttp import web
+import pytest
+
+from src.services.llm import cloud_provider
+from src.services.llm.exceptions import LLMRateLimitError
+from src.services.llm.http_session import close_llm_sessions
+
+
+def _serve(handler):
+    async def start():
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/v1"
+
+    return start
+
+
+def test_openai_complete_sends_one_request_and_maps_errors():
+    received = []
+
+    async def handler(request):
+        body = await request.json()
+        received.append(body)
+        if body["messages"][-1]["content"] == "busy":
+            return web.json_response(
+                {"error": {"message": "Rate limit reached"}},
+                status=429,
+                headers={"Retry-After": "7"},
+            )
+        return web.json_response({"choices": [{"message": {"content": "ok"}}]})
+
+    async def run():
+        runner, base_url = await _serve(handler)()
+        common = {"model": "gpt-4o", "api_key": "k", "base_url": base_url}
+        try:
+            answer = await cloud_provider.complete(
+                "hi",
+                history_messages=[{"role": "assistant", "content": "earlier"}],
+                response_format={"type": "json_object"},
+                **common,
+            )
+            with pytest.raises(LLMRateLimitError) as excinfo:
+                await cloud_provider.complete("busy", **common)
+            return answer, excinfo.value
+        finally:
+            await close_llm_sessions()
+            await runner.cleanup()
+
+    answer, error = asyncio.run(run())
+    assert answer == "ok"
+    assert error.retry_after == 7.0
+    assert len(received) == 2
+    assert [m["role"] for m in received[0]["messages"]] == ["system", "assistant", "user"]
+    assert received[0]["response_format"] == {"type": "json_object"}
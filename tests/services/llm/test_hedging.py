@@ -0,0 +1,84 @@
+import asyncio
+
+from src.services.llm.hedging import LLMHedger
+
+
+def _warmed_hedger(**kwargs):
+    hedger = LLMHedger(min_samples=5, min_delay=0.02, **kwargs)
+    for _ in range(5):
+        hedger.observe("openai", "m", 0.01)
+    return hedger
+
+
+def test_slow_call_is_hedged_and_loser_cancelled():
+    hedger = _warmed_hedger()
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("primary")
+            raise
+        return "primary"
+
+    async def fast():
+        return "backup"
+
+    async def run():
+        return await hedger.run(slow, fast, "openai", "m", session_id="s")
+
+    assert asyncio.run(run()) == "backup"
+    assert cancelled == ["primary"]
+    stats = hedger.stats()
+    assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+    assert stats["delays"]["openai/m"] == 0.02
+
+
+def test_budget_caps_hedges_per_session():
+    hedger = _warmed_hedger(budget=1)
+    calls = []
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    async def backup():
+        calls.append("backup")
+        raise RuntimeError("secondary down")
+
+    async def run():
+        first = await hedger.run(slow, backup, "openai", "m", session_id="s")
+        second = await hedger.run(slow, backup, "openai", "m", session_id="s")
+        return first, second
+
+    # A failed duplicate falls back to the original answer; the session's
+    # budget is then exhausted and the second call is not hedged
+    assert asyncio.run(run()) == ("primary", "primary")
+    assert calls == ["backup"]
+    assert hedger.stats()["budget_denied"] == 1
+
+
+def test_queued_call_is_not_hedged_until_sent():
+    hedger = _warmed_hedger()
+    calls = []
+
+    async def run():
+        sent = asyncio.Event()
+
+        async def queued_then_fast():
+            # Waits for a scheduler slot well past the hedge delay, then answers quickly
+            await asyncio.sleep(0.1)
+            sent.set()
+            await asyncio.sleep(0.005)
+            return "primary"
+
+        async def backup():
+            calls.append("backup")
+            return "backup"
+
+        return await hedger.run(queued_then_fast, backup, "openai", "m", session_id="s", sent=sent)
+
+    assert asyncio.run(run()) == "primary"
+    assert calls == []
+    assert hedger.stats()["hedged"] == 0
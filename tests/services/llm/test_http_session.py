@@ -0,0 +1,42 @@
+import asyncio
+
+from aiohttp import web
+
+from src.services.llm import local_provider
+from src.services.llm.http_session import (
+    close_llm_sessions,
+    get_llm_session,
+    llm_session_stats,
+    reset_llm_session_stats,
+)
+
+
+async def _chat(request):
+    return web.json_response({"choices": [{"message": {"content": "ok"}}]})
+
+
+def test_calls_reuse_one_pooled_connection():
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", _chat)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        base_url = f"http://127.0.0.1:{port}/v1"
+        try:
+            reset_llm_session_stats()
+            for _ in range(3):
+                assert await local_provider.complete("hi", model="m", base_url=base_url) == "ok"
+            assert get_llm_session(base_url) is get_llm_session(f"{base_url}/models")
+            return llm_session_stats()
+        finally:
+            await close_llm_sessions()
+            await runner.cleanup()
+
+    stats = asyncio.run(run())
+    host = next(iter(stats["hosts"].values()))
+    assert host["requests"] == 3
+    assert host["new_connections"] == 1
+    assert host["reused_connections"] == 2
@@ -0,0 +1,62 @@
+from src.services.llm.prompt_cache import (
+    anthropic_cache_blocks,
+    prompt_cache_key,
+    system_first,
+)
+from src.services.llm.usage import parse_usage
+
+
+def test_anthropic_breakpoints_cover_stable_prefix():
+    messages = [
+        {"role": "user", "content": "first question"},
+        {"role": "assistant", "content": "first answer"},
+        {"role": "user", "content": "follow-up"},
+    ]
+    system, marked = anthropic_cache_blocks("long system prompt", messages)
+
+    assert system == [
+        {"type": "text", "text": "long system prompt", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert marked[1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    # The per-call message and the caller's list are left untouched
+    assert marked[2] == messages[2]
+    assert messages[1]["content"] == "first answer"
+
+
+def test_openai_prefix_hints_and_cached_usage():
+    messages = [
+        {"role": "user", "content": "q"},
+        {"role": "system", "content": "s"},
+    ]
+    assert [m["role"] for m in system_first(messages)] == ["system", "user"]
+
+    openai_url = "https://api.openai.com/v1"
+    key = prompt_cache_key("openai", "gpt-4o", "s", openai_url)
+    assert key and key == prompt_cache_key("openai", "gpt-4o", "s", openai_url)
+    assert prompt_cache_key("openai", "gpt-4o", "s", "https://res.openai.azure.com/openai")
+    assert prompt_cache_key("deepseek", "deepseek-chat", "s", openai_url) is None
+    # OpenAI-compatible servers share the "openai" binding but get no key
+    assert prompt_cache_key("openai", "llama3", "s", "http://localhost:8000/v1") is None
+    assert prompt_cache_key("openai", "deepseek-chat", "s", "https://api.deepseek.com") is None
+
+    openai = parse_usage(
+        {
+            "usage": {
+                "prompt_tokens": 2000,
+                "completion_tokens": 10,
+                "prompt_tokens_details": {"cached_tokens": 1536},
+            }
+        }
+    )
+    anthropic = parse_usage(
+        {
+            "usage": {
+                "input_tokens": 50,
+                "cache_read_input_tokens": 1800,
+                "cache_creation_input_tokens": 0,
+                "output_tokens": 12,
+            }
+        }
+    )
+    assert (openai.prompt_tokens, openai.cache_read_tokens) == (2000, 1536)
+    assert (anthropic.prompt_tokens, anthropic.cache_read_tokens) == (1850, 1800)
@@ -0,0 +1,70 @@
+import asyncio
+
+from src.services.llm import factory
+from src.services.llm.response_cache import (
+    LLMResponseCache,
+    set_response_cache,
+    was_cache_hit,
+)
+
+
+def test_complete_serves_repeated_prompts_from_cache(monkeypatch):
+    calls = []
+
+    async def fake_complete(**kwargs):
+        calls.append(kwargs["prompt"])
+        return f"answer to {kwargs['prompt']}"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_complete)
+    cache = LLMResponseCache(max_entries=2)
+    set_response_cache(cache)
+    common = {"model": "m", "base_url": "https://api.example.com/v1", "binding": "openai"}
+
+    async def run():
+        outcomes = []
+        for prompt, kwargs in [
+            ("q1", {"temperature": 0}),  # cached by default at temperature 0
+            ("q1", {"temperature": 0}),
+            ("q1", {"temperature": 0.7}),  # not cached without opt-in
+            ("q1", {"temperature": 0.7, "cache": True}),
+            ("q1", {"temperature": 0.7, "cache": True}),
+            ("q1", {"temperature": 0, "cache": False}),
+        ]:
+            await factory.complete(prompt, **common, **kwargs)
+            outcomes.append(was_cache_hit())
+        return outcomes
+
+    try:
+        assert asyncio.run(run()) == [False, True, False, False, True, False]
+        assert len(calls) == 4
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+    finally:
+        set_response_cache(None)
+
+
+def test_requests_differing_in_unkeyed_params_do_not_share_answers(monkeypatch):
+    calls = []
+
+    async def fake_complete(**kwargs):
+        calls.append(kwargs)
+        return f"answer {len(calls)}"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_complete)
+    set_response_cache(LLMResponseCache())
+    common = {"model": "m", "binding": "openai", "temperature": 0}
+
+    async def run():
+        return [
+            await factory.complete("q", base_url="https://a.example.com/v1", **common),
+            await factory.complete("q", base_url="https://b.example.com/v1", **common),
+            await factory.complete("q", base_url="https://a.example.com/v1", stop=["\n"], **common),
+            await factory.complete("q", base_url="https://a.example.com/v1", seed=7, **common),
+            await factory.complete("q", base_url="https://a.example.com/v1", **common),
+        ]
+
+    try:
+        assert asyncio.run(run()) == ["answer 1", "answer 2", "answer 3", "answer 4", "answer 1"]
+    finally:
+        set_response_cache(None)
@@ -0,0 +1,40 @@
+from src.services.llm.router import ModelRouter
+from src.services.llm.usage import LLMUsage
+
+
+def test_stages_resolve_to_configured_tier(monkeypatch):
+    monkeypatch.delenv("LLM_MODEL_TIER_FAST", raising=False)
+    router = ModelRouter(
+        tiers={"fast": {"model": "gpt-4o-mini", "api_key_env": "FAST_KEY"}, "off": {"model": ""}},
+        stages={"rephrase": "fast", "solve.rephrase": "off", "summarize": "off"},
+    )
+    monkeypatch.setenv("FAST_KEY", "sk-fast")
+
+    route = router.resolve("rephrase", "research")
+    assert (route.tier, route.model, route.api_key, route.binding) == (
+        "fast",
+        "gpt-4o-mini",
+        "sk-fast",
+        None,
+    )
+    # Module-specific entries win; tiers without a model keep the primary model
+    assert router.resolve("rephrase", "solve") is None
+    assert router.resolve("summarize") is None
+    assert router.resolve("investigate") is None
+
+    monkeypatch.setenv("LLM_MODEL_TIER_OFF", "local-small")
+    assert router.resolve("summarize").model == "local-small"
+
+
+def test_records_per_stage_latency_cost_and_fallbacks():
+    router = ModelRouter()
+    router.record("rephrase", "fast", "claude-3-haiku", 0.5, usage=LLMUsage(1000, 1000))
+    router.record("rephrase", "fast", "claude-3-haiku", 1.5, ok=False)
+    router.record("rephrase", "primary", "gpt-4o", 2.0, fallback=True)
+
+    stages = router.stats()["stages"]
+    fast = stages["rephrase:fast"]
+    assert fast["calls"] == 2 and fast["failures"] == 1
+    assert fast["avg_latency"] == 1.0
+    assert fast["cost_usd"] == 0.00025 + 0.00125
+    assert stages["rephrase:primary"]["fallbacks"] == 1
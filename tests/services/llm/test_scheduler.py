@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+from src.services.llm.scheduler import LLMScheduler, Priority
+
+
+def test_priority_and_fair_queuing_order():
+    scheduler = LLMScheduler(max_concurrency=1)
+    order = []
+
+    async def request(name, priority, session):
+        async with scheduler.slot("openai", "m", priority=priority, session_id=session):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def run():
+        async with scheduler.slot("openai", "m"):
+            tasks = [
+                asyncio.create_task(request(*args))
+                for args in [
+                    ("bg", Priority.BACKGROUND, "kb"),
+                    ("x1", Priority.INTERACTIVE, "x"),
+                    ("x2", Priority.INTERACTIVE, "x"),
+                    ("y1", Priority.INTERACTIVE, "y"),
+                    ("n1", Priority.NORMAL, "n"),
+                ]
+            ]
+            await asyncio.sleep(0.01)
+            depth = scheduler.stats()["openai/m"]["queue_depth"]
+        await asyncio.gather(*tasks)
+        return depth
+
+    depth = asyncio.run(run())
+    assert depth == {"interactive": 3, "normal": 1, "background": 1}
+    assert order == ["x1", "y1", "x2", "n1", "bg"]
+    assert scheduler.stats()["openai/m"]["granted"] == 6
+
+
+def test_token_budget_delays_requests():
+    # 6000 tokens/minute = 100 tokens/second
+    scheduler = LLMScheduler(tpm=6000)
+
+    async def run():
+        async with scheduler.slot("openai", "m", tokens=6000):
+            pass
+        start = time.monotonic()
+        async with scheduler.slot("openai", "m", tokens=30):
+            return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.25
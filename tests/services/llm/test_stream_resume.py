@@ -0,0 +1,68 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from src.services.llm import factory
+from src.services.llm.exceptions import LLMStreamInterruptedError
+from src.services.llm.telemetry import reset_stream_stats, stream_stats
+
+
+class FlakyProvider:
+    """Streams two chunks, drops the connection, then serves continuations."""
+
+    def __init__(self, continuation):
+        self.calls = []
+        self.continuation = continuation
+
+    async def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        if len(self.calls) == 1:
+            yield "The quick brown "
+            yield "fox jumps"
+            raise aiohttp.ClientPayloadError("connection reset")
+        for chunk in self.continuation:
+            yield chunk
+
+
+def _collect(**kwargs):
+    async def run():
+        return [
+            chunk
+            async for chunk in factory.stream(
+                prompt="q",
+                model="m",
+                base_url="https://api.example.com/v1",
+                binding="openai",
+                retry_delay=0,
+                **kwargs,
+            )
+        ]
+
+    return asyncio.run(run())
+
+
+def test_stream_resumes_without_repeating_output(monkeypatch):
+    provider = FlakyProvider([" fox jumps over ", "the lazy dog."])
+    monkeypatch.setattr(factory, "cloud_provider", provider)
+    reset_stream_stats()
+
+    chunks = _collect()
+
+    assert "".join(chunks) == "The quick brown fox jumps over the lazy dog."
+    continued = provider.calls[1]["messages"]
+    assert continued[-2] == {"role": "assistant", "content": "The quick brown fox jumps"}
+    assert continued[-1]["role"] == "user"
+    stats = stream_stats()["openai/m"]
+    assert stats["streams"] == 1 and stats["resumes"] == 1 and stats["interrupted"] == 0
+
+
+def test_stream_fails_cleanly_when_resume_disabled(monkeypatch):
+    provider = FlakyProvider(["unused"])
+    monkeypatch.setattr(factory, "cloud_provider", provider)
+
+    with pytest.raises(LLMStreamInterruptedError) as info:
+        _collect(resume=False)
+
+    assert info.value.partial == "The quick brown fox jumps"
+    assert len(provider.calls) == 1
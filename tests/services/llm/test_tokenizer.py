@@ -0,0 +1,42 @@
+from src.services.llm.tokenizer import TokenCounter
+
+
+class FakeEncoding:
+    """Whitespace tokenizer that records how often it is asked to encode."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text, **kwargs):
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        return [text.split() for text in texts]
+
+
+def test_counts_are_batched_and_memoized():
+    encoding = FakeEncoding()
+    counter = TokenCounter(encoding=encoding, cache_size=10)
+    history = ["system prompt here", "hi", "hello there friend"]
+
+    assert counter.count_many(history) == [3, 1, 3]
+    # Next turn: only the new message is encoded
+    assert counter.count_many(history + ["one more"]) == [3, 1, 3, 2]
+    assert counter.count("hi") == 1
+
+    assert encoding.encoded == history + ["one more"]
+    assert counter.stats()["hits"] == 4
+
+
+def test_lru_bound_and_length_fallback():
+    counter = TokenCounter(encoding=FakeEncoding(), cache_size=2)
+    counter.count_many(["a", "b", "c"])
+    assert counter.stats()["entries"] == 2
+
+    # Without tiktoken encodings counts fall back to ~4 characters per token
+    counter.encoding = None
+    assert counter.count("x" * 40) == 10
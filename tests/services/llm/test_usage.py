@@ -0,0 +1,50 @@
+import asyncio
+
+from src.services.llm import factory
+from src.services.llm.usage import (
+    LLMUsage,
+    get_last_usage,
+    merge_usage,
+    parse_usage,
+    record_usage,
+)
+
+
+def test_parse_usage_provider_formats():
+    openai = {"usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15}}
+    anthropic = {"usage": {"input_tokens": 20, "output_tokens": 7}}
+    ollama = {"done": True, "prompt_eval_count": 9, "eval_count": 4}
+
+    assert parse_usage(openai) == LLMUsage(12, 3)
+    assert parse_usage(anthropic) == LLMUsage(20, 7)
+    assert parse_usage(ollama) == LLMUsage(9, 4)
+    assert parse_usage({"choices": []}) is None
+
+    # Anthropic stream: message_start then message_delta
+    start = parse_usage({"type": "message_start", "message": {"usage": {"input_tokens": 50}}})
+    delta = parse_usage({"type": "message_delta", "usage": {"output_tokens": 31}})
+    assert merge_usage(start, delta) == LLMUsage(50, 31)
+
+
+def test_complete_exposes_provider_usage(monkeypatch):
+    class Provider:
+        async def complete(self, **kwargs):
+            record_usage(LLMUsage(prompt_tokens=100, completion_tokens=5))
+            return "answer"
+
+    monkeypatch.setattr(factory, "cloud_provider", Provider())
+
+    async def run():
+        calls = []
+        for _ in range(2):
+            await factory.complete(
+                prompt="q",
+                model="m",
+                base_url="https://api.example.com/v1",
+                binding="openai",
+                cache=False,
+            )
+            calls.append(get_last_usage())
+        return calls
+
+    assert asyncio.run(run()) == [LLMUsage(100, 5), LLMUsage(100, 5)]
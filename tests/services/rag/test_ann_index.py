@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from src.services.rag.utils.ann_index import (
+    build_ann_index,
+    default_params,
+    exact_search,
+    resolve_index_type,
+    select_index_type,
+    self_check,
+)
+
+
+def test_index_type_selection_by_corpus_size():
+    assert select_index_type(10_000) == "flat"
+    assert select_index_type(200_000) == "hnsw"
+    assert select_index_type(5_000_000) == "ivf_pq"
+    # Too small to train: fall back to exact search
+    assert resolve_index_type("ivf_pq", 500) == "flat"
+    with pytest.raises(ValueError):
+        resolve_index_type("lsh", 10_000)
+
+    params = default_params("ivf_pq", 2_000_000, 1024)
+    assert 1024 % params["m"] == 0
+    assert params["nprobe"] <= params["nlist"]
+
+
+def test_exact_search_matches_argsort():
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((300, 16)).astype(np.float32)
+    queries = vectors[:5]
+
+    found = exact_search(vectors, queries, 7)
+
+    expected = np.argsort(-(queries @ vectors.T), axis=1)[:, :7]
+    assert [set(row) for row in found.tolist()] == [set(row) for row in expected.tolist()]
+
+
+@pytest.mark.parametrize("index_type", ["ivf_flat", "hnsw", "ivf_pq"])
+def test_built_index_passes_self_check(index_type):
+    pytest.importorskip("faiss")
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((4000, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    index, resolved, params = build_ann_index(vectors, index_type=index_type)
+    report = self_check(index, vectors, resolved, params)
+
+    assert resolved == index_type
+    assert index.ntotal == len(vectors)
+    assert report["recall"] >= (0.9 if index_type != "ivf_pq" else 0.3)
+
+
+@pytest.mark.parametrize("with_matrix", [True, False])
+def test_filtered_ann_search_returns_allowed_rows(with_matrix):
+    pytest.importorskip("faiss")
+    from src.services.rag.components.retrievers.dense import DenseRetriever
+    from src.services.rag.utils.index_cache import CachedIndex
+    from src.services.rag.utils.numpy_search import RowFilter
+
+    rng = np.random.default_rng(2)
+    vectors = rng.standard_normal((4000, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index, _, _ = build_ann_index(vectors, index_type="ivf_flat")
+    # A handful of rows for "rare" and about a third of the store for "common"
+    records = [
+        {"id": i, "doc_id": "rare" if i % 1000 == 7 else ("common" if i % 3 == 0 else "other")}
+        for i in range(len(vectors))
+    ]
+    store = CachedIndex(
+        info={},
+        metadata=records,
+        index=index,
+        embeddings=vectors if with_matrix else None,
+        row_filter=RowFilter(records),
+    )
+    retriever = DenseRetriever()
+    queries = vectors[:2]
+
+    rare = retriever._faiss_search(store, queries, 5, {"doc_id": "rare"})
+    common = retriever._faiss_search(store, queries, 5, {"doc_id": "common"})
+
+    expected_rare = {i for i, r in enumerate(records) if r["doc_id"] == "rare"}
+    assert all({idx for idx, _ in hits} <= expected_rare for hits in rare)
+    if with_matrix:
+        assert all({idx for idx, _ in hits} == expected_rare for hits in rare)
+    assert all(len(hits) == 5 and all(idx % 3 == 0 for idx, _ in hits) for hits in common)
@@ -0,0 +1,135 @@
+import json
+import os
+from pathlib import Path
+
+from src.services.rag.utils.index_cache import LLAMAINDEX_FILES, CachedIndex, VectorIndexCache
+
+
+def make_store(path: Path, n: int) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "metadata.json").write_text(json.dumps([{"id": i} for i in range(n)]))
+    (path / "info.json").write_text(json.dumps({"num_chunks": n}))
+    return path
+
+
+def make_loader(calls: list, nbytes: int = 100):
+    def loader(store_dir: Path) -> CachedIndex:
+        calls.append(store_dir)
+        metadata = json.loads((store_dir / "metadata.json").read_text())
+        return CachedIndex(info={}, metadata=metadata, nbytes=nbytes)
+
+    return loader
+
+
+def test_hit_after_first_load(tmp_path: Path):
+    store = make_store(tmp_path / "kb" / "vector_store", 3)
+    cache = VectorIndexCache(max_bytes=1000)
+    calls = []
+
+    first = cache.get(store, make_loader(calls))
+    second = cache.get(store, make_loader(calls))
+
+    assert first is second
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_reload_when_files_change(tmp_path: Path):
+    store = make_store(tmp_path / "kb" / "vector_store", 3)
+    cache = VectorIndexCache(max_bytes=1000)
+    calls = []
+
+    cache.get(store, make_loader(calls))
+    (store / "info.json").write_text(json.dumps({"num_chunks": 5, "rebuilt": True}))
+    st = os.stat(store / "info.json")
+    os.utime(store / "info.json", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    cache.get(store, make_loader(calls))
+
+    assert len(calls) == 2
+    assert cache.stats()["reloads"] == 1
+
+
+def test_lru_eviction_by_bytes(tmp_path: Path):
+    stores = [make_store(tmp_path / f"kb{i}" / "vector_store", 1) for i in range(3)]
+    cache = VectorIndexCache(max_bytes=250)
+    calls = []
+
+    cache.get(stores[0], make_loader(calls))
+    cache.get(stores[1], make_loader(calls))
+    cache.get(stores[0], make_loader(calls))  # touch kb0 so kb1 is least recent
+    cache.get(stores[2], make_loader(calls))
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 200
+
+    cache.get(stores[0], make_loader(calls))
+    assert len(calls) == 3  # kb0 still resident
+
+    cache.get(stores[1], make_loader(calls))
+    assert len(calls) == 4  # kb1 was evicted
+
+
+def test_invalidate(tmp_path: Path):
+    store = make_store(tmp_path / "kb" / "vector_store", 1)
+    cache = VectorIndexCache(max_bytes=1000)
+    calls = []
+
+    cache.get(store, make_loader(calls))
+    cache.invalidate(store)
+    cache.get(store, make_loader(calls))
+
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 1
+
+
+def test_llamaindex_files_trigger_reload(tmp_path: Path):
+    storage = tmp_path / "kb" / "llamaindex_storage"
+    storage.mkdir(parents=True)
+    (storage / "docstore.json").write_text("{}")
+    cache = VectorIndexCache(max_bytes=1000, watched_files=LLAMAINDEX_FILES)
+    calls = []
+
+    def loader(store_dir: Path) -> CachedIndex:
+        calls.append(store_dir)
+        return CachedIndex(info={}, metadata=[], index=object(), nbytes=10)
+
+    cache.get(storage, loader)
+    cache.get(storage, loader)
+    (storage / "docstore.json").write_text('{"docstore/data": {}}')
+    cache.get(storage, loader)
+
+    assert len(calls) == 2
+    assert cache.stats()["reloads"] == 1
+
+
+def test_embedding_config_change_drops_llamaindex_indexes(tmp_path: Path, monkeypatch):
+    from src.services.config.unified_config import ConfigType, UnifiedConfigManager
+    from src.services.rag.utils.index_cache import get_llamaindex_cache, reset_llamaindex_cache
+
+    storage = tmp_path / "kb" / "llamaindex_storage"
+    storage.mkdir(parents=True)
+    (storage / "docstore.json").write_text("{}")
+    reset_llamaindex_cache()
+    calls = []
+
+    def loader(store_dir: Path) -> CachedIndex:
+        calls.append(store_dir)
+        return CachedIndex(info={}, metadata=[], index=object(), nbytes=10)
+
+    get_llamaindex_cache().get(storage, loader)
+
+    # Bypass __init__ so no settings files are touched
+    manager = object.__new__(UnifiedConfigManager)
+    configs = {"active_id": "default", "configs": [{"id": "other"}]}
+    monkeypatch.setattr(manager, "_load_configs", lambda config_type: configs, raising=False)
+    monkeypatch.setattr(manager, "_save_configs", lambda config_type, data: True, raising=False)
+    assert manager.set_active_config(ConfigType.EMBEDDING, "other")
+
+    get_llamaindex_cache().get(storage, loader)
+    assert len(calls) == 2
+    reset_llamaindex_cache()
@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.services.rag.utils.numpy_search import NumpySearchEngine, RowFilter
+
+
+def _records(n):
+    return [
+        {"id": i, "doc_id": f"doc{i % 3}", "content": f"chunk {i}", "metadata": {"page": i // 10}}
+        for i in range(n)
+    ]
+
+
+def test_batched_search_matches_full_sort():
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((500, 16)).astype(np.float32)
+    queries = rng.standard_normal((3, 16)).astype(np.float32)
+    engine = NumpySearchEngine(embeddings, RowFilter(_records(500)))
+
+    results = engine.search(queries, top_k=5)
+
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    for query, hits in zip(queries, results):
+        expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+        assert [idx for idx, _ in hits] == expected.tolist()
+        assert [s for _, s in hits] == sorted((s for _, s in hits), reverse=True)
+
+
+def test_tombstones_and_filters_are_masked():
+    rng = np.random.default_rng(1)
+    embeddings = rng.standard_normal((60, 8)).astype(np.float16)
+    records = _records(60)
+    engine = NumpySearchEngine(
+        embeddings, RowFilter(records, tombstones=np.array([0, 3])), normalized=False
+    )
+
+    hits = engine.search(embeddings[0].astype(np.float32), top_k=100, filters={"doc_id": "doc0"})[0]
+    ids = {idx for idx, _ in hits}
+    assert ids == {i for i in range(60) if i % 3 == 0} - {0, 3}
+
+    hits = engine.search(embeddings[:2], top_k=100, filters={"doc_id": "doc1", "page": [0, 5]})
+    assert all({records[i]["metadata"]["page"] for i, _ in h} <= {0, 5} for h in hits)
+    assert all(records[i]["doc_id"] == "doc1" for h in hits for i, _ in h)
@@ -0,0 +1,46 @@
+import pytest
+
+from src.services.rag import factory
+from src.services.rag.factory import (
+    get_shared_pipeline,
+    invalidate_pipelines,
+    pipeline_stats,
+    register_pipeline,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Register test pipelines on copies of the process-wide registry and stats"""
+    factory._init_pipelines()
+    monkeypatch.setattr(factory, "_PIPELINES", dict(factory._PIPELINES))
+    monkeypatch.setattr(factory, "_STATS", {})
+    yield
+    invalidate_pipelines("test_registry")
+
+
+class _CountingPipeline:
+    built = 0
+
+    def __init__(self, kb_base_dir=None):
+        type(self).built += 1
+        self.kb_base_dir = kb_base_dir
+
+
+def test_shared_pipeline_is_reused_until_invalidated(tmp_path):
+    register_pipeline("test_registry", _CountingPipeline)
+    base_a, base_b = str(tmp_path / "a"), str(tmp_path / "b")
+
+    first = get_shared_pipeline("test_registry", kb_base_dir=base_a)
+    assert get_shared_pipeline("test_registry", kb_base_dir=base_a) is first
+    assert get_shared_pipeline("test_registry", kb_base_dir=base_b) is not first
+    assert _CountingPipeline.built == 2
+
+    stats = pipeline_stats()["providers"]["test_registry"]
+    assert stats["builds"] == 2
+    assert stats["reuses"] == 1
+
+    assert invalidate_pipelines("test_registry", kb_base_dir=base_a) == 1
+    assert get_shared_pipeline("test_registry", kb_base_dir=base_a) is not first
+    assert invalidate_pipelines("test_registry") == 2
+    assert pipeline_stats()["providers"]["test_registry"]["teardowns"] == 3
@@ -0,0 +1,20 @@
+import asyncio
+
+from src.services.rag.pipeline import RAGPipeline
+
+
+class _FlakyRetriever:
+    async def process(self, query, kb_name, **kwargs):
+        if query == "bad":
+            raise RuntimeError("index unavailable")
+        return {"query": query, "answer": f"answer to {query}", "content": ""}
+
+
+def test_failed_query_does_not_drop_the_batch():
+    pipeline = RAGPipeline("test").retriever(_FlakyRetriever())
+
+    results = asyncio.run(pipeline.search_many(["a", "bad", "b"], kb_name="kb"))
+
+    assert [r["answer"] for r in results] == ["answer to a", "", "answer to b"]
+    assert results[1]["error"] == "index unavailable"
+    assert "error" not in results[0]
@@ -0,0 +1,137 @@
+import asyncio
+import json
+from pathlib import Path
+import pickle
+
+import numpy as np
+import pytest
+
+from src.services.rag.components.indexers.vector import VectorIndexer
+from src.services.rag.types import Chunk
+from src.services.rag.utils.vector_store import (
+    ChunkStore,
+    add_tombstones,
+    append_chunks,
+    append_embeddings,
+    compact_store,
+    find_rows,
+    load_info,
+    load_tombstones,
+    migrate_legacy_store,
+    open_embeddings,
+    write_chunks,
+    write_embeddings,
+)
+
+
+def test_chunk_store_reads_records_by_offset(tmp_path: Path):
+    records = [{"id": i, "content": f"chunk {i} — ünïcode"} for i in range(5)]
+    assert write_chunks(tmp_path, records) == 5
+
+    store = ChunkStore(tmp_path)
+
+    assert len(store) == 5
+    assert store[3] == records[3]
+    assert store[-1] == records[4]
+    assert store.get_many([4, 0]) == [records[4], records[0]]
+
+
+def test_embeddings_are_normalized_and_memory_mapped(tmp_path: Path):
+    matrix = np.array([[3.0, 4.0], [0.0, 0.0], [1.0, 0.0]], dtype=np.float32)
+    write_embeddings(tmp_path, matrix, dtype="float16")
+
+    loaded = open_embeddings(tmp_path)
+
+    assert isinstance(loaded, np.memmap)
+    assert loaded.dtype == np.float16
+    np.testing.assert_allclose(loaded[0], [0.6, 0.8], atol=1e-3)
+    np.testing.assert_array_equal(loaded[1], [0.0, 0.0])
+
+
+def test_migrate_legacy_store(tmp_path: Path):
+    metadata = [{"id": i, "content": f"text {i}"} for i in range(3)]
+    (tmp_path / "metadata.json").write_text(json.dumps(metadata, indent=2))
+    (tmp_path / "info.json").write_text(json.dumps({"use_faiss": False, "num_chunks": 3}))
+    with open(tmp_path / "embeddings.pkl", "wb") as f:
+        pickle.dump(np.eye(3, dtype=np.float32) * 2, f)
+
+    info = migrate_legacy_store(tmp_path, remove_legacy=True)
+
+    assert info["format"] == 2
+    assert load_info(tmp_path)["normalized"] is True
+    assert not (tmp_path / "metadata.json").exists()
+    assert ChunkStore(tmp_path)[2] == metadata[2]
+    np.testing.assert_allclose(open_embeddings(tmp_path), np.eye(3))
+
+    # Already migrated: nothing to do
+    assert migrate_legacy_store(tmp_path) is None
+
+
+def test_append_then_compact(tmp_path: Path):
+    write_chunks(tmp_path, [{"id": i, "doc_id": "a.txt"} for i in range(2)])
+    write_embeddings(tmp_path, np.eye(4, dtype=np.float32)[:2])
+
+    append_chunks(tmp_path, [{"id": i, "doc_id": "b.txt"} for i in range(2, 4)])
+    append_embeddings(tmp_path, np.eye(4, dtype=np.float32)[2:] * 5)
+
+    assert len(ChunkStore(tmp_path)) == 4
+    assert open_embeddings(tmp_path).shape == (4, 4)
+    np.testing.assert_allclose(open_embeddings(tmp_path)[3], [0, 0, 0, 1])
+
+    rows = find_rows(tmp_path, ["a.txt"])
+    assert rows == [0, 1]
+    add_tombstones(tmp_path, rows)
+    assert find_rows(tmp_path, ["a.txt"]) == []
+
+    assert compact_store(tmp_path) == 2
+    store = ChunkStore(tmp_path)
+    assert [r["id"] for r in store] == [0, 1]
+    assert [r["doc_id"] for r in store] == ["b.txt", "b.txt"]
+    np.testing.assert_allclose(open_embeddings(tmp_path), np.eye(4)[2:])
+    assert len(load_tombstones(tmp_path)) == 0
+
+
+def test_migrated_faiss_store_can_be_compacted(tmp_path: Path):
+    faiss = pytest.importorskip("faiss")
+    store_dir = tmp_path / "kb" / "vector_store"
+    store_dir.mkdir(parents=True)
+    vectors = np.eye(4, dtype=np.float32)
+    index = faiss.IndexFlatIP(4)
+    index.add(vectors)
+    faiss.write_index(index, str(store_dir / "index.faiss"))
+    metadata = [{"id": i, "doc_id": "a.txt" if i < 2 else "b.txt"} for i in range(4)]
+    (store_dir / "metadata.json").write_text(json.dumps(metadata))
+    (store_dir / "info.json").write_text(json.dumps({"use_faiss": True, "num_chunks": 4}))
+
+    migrate_legacy_store(store_dir, remove_legacy=True)
+    np.testing.assert_allclose(open_embeddings(store_dir), vectors)
+
+    # Stores migrated before the matrix was written only have index.faiss
+    (store_dir / "embeddings.npy").unlink()
+    indexer = VectorIndexer(kb_base_dir=str(tmp_path), compaction_threshold=1.0)
+    assert asyncio.run(indexer.delete_documents("kb", ["a.txt"])) == 2
+    assert asyncio.run(indexer.compact("kb")) == 2
+
+    assert [r["doc_id"] for r in ChunkStore(store_dir)] == ["b.txt", "b.txt"]
+    np.testing.assert_allclose(open_embeddings(store_dir), vectors[2:])
+    assert faiss.read_index(str(store_dir / "index.faiss")).ntotal == 2
+
+
+def test_document_count_tracks_readds_and_deletes(tmp_path: Path):
+    store_dir = tmp_path / "kb" / "vector_store"
+    store_dir.mkdir(parents=True)
+    indexer = VectorIndexer(kb_base_dir=str(tmp_path), compaction_threshold=1.0)
+    indexer.use_faiss = False
+
+    def chunks(*doc_ids):
+        return [(doc_id, Chunk(content=doc_id)) for doc_id in doc_ids]
+
+    vectors = np.eye(4, dtype=np.float32)
+    indexer._write_store(store_dir, chunks("a.txt", "a.txt", "b.txt"), vectors[:3], 2)
+    indexer._append_store(store_dir, chunks("a.txt", "c.txt"), vectors[[0, 3]], 2)
+    assert load_info(store_dir)["num_documents"] == 3
+
+    assert asyncio.run(indexer.delete_documents("kb", ["a.txt", "missing.txt"])) == 1
+    assert load_info(store_dir)["num_documents"] == 2
+    assert asyncio.run(indexer.delete_documents("kb", ["a.txt"])) == 0
+    assert load_info(store_dir)["num_documents"] == 2